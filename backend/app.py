@@ -1,6 +1,9 @@
-from fastapi import FastAPI, HTTPException, Query
+from typing import List
+
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
+from pydantic import TypeAdapter
 from sqlalchemy.dialects.postgresql import array
 
 from .air_traffic import fetch_air_traffic
@@ -17,13 +20,23 @@ from .data_store import (
 )
 from .markets import fetch_market_items
 from .sources import build_global_items, build_snapshots
-from .models import AgentRequest
+from .models import AgentRequest, CountrySnapshot, GlobalItem, MarketItem
 from .routes import geo_risk, themes, scoring_settings, asset_search, gp_scans, reports
 
 load_dotenv()
 
 app = FastAPI()
 
+# List endpoints serialize their models straight to JSON bytes in pydantic's
+# core, instead of model_dump() followed by FastAPI's jsonable_encoder pass
+_SNAPSHOT_LIST = TypeAdapter(List[CountrySnapshot])
+_GLOBAL_ITEM_LIST = TypeAdapter(List[GlobalItem])
+_MARKET_ITEM_LIST = TypeAdapter(List[MarketItem])
+
+
+def _json_response(adapter: TypeAdapter, items: list) -> Response:
+    return Response(content=adapter.dump_json(items), media_type="application/json")
+
 
 @app.on_event("startup")
 async def startup_event():
@@ -48,6 +61,12 @@ async def startup_event():
     except Exception as e:
         print(f"⚠️  Error during theme auto-seeding: {e}")
 
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled HTTP clients on shutdown."""
+    await geo_risk.close_ollama_client()
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],
@@ -58,17 +77,17 @@ app.add_middleware(
 
 @app.get("/countries")
 def list_countries():
-    return [snapshot.model_dump() for snapshot in load_snapshots()]
+    return _json_response(_SNAPSHOT_LIST, load_snapshots())
 
 
 @app.get("/global")
 def list_global():
-    return [item.model_dump() for item in load_global_items()]
+    return _json_response(_GLOBAL_ITEM_LIST, load_global_items())
 
 
 @app.get("/markets")
 def list_markets():
-    return [item.model_dump() for item in load_market_items()]
+    return _json_response(_MARKET_ITEM_LIST, load_market_items())
 
 
 @app.get("/air-traffic")
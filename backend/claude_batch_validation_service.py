@@ -48,6 +48,9 @@ class BatchValidationResult:
 _batch_cache: Dict[str, Tuple[BatchValidationResult, datetime]] = {}
 _cache_ttl_minutes = 60
 
+# Maximum number of signals sent to Claude in one validation batch (API token limits)
+MAX_BATCH_SIGNALS = 50
+
 
 class ClaudeBatchValidationService:
     """Service for Claude-powered batch signal validation."""
@@ -96,8 +99,8 @@ class ClaudeBatchValidationService:
             if cached_result:
                 return cached_result
 
-        # Limit to top 50 signals for API token limits
-        signals_subset = signals[:50]
+        # Limit to top signals for API token limits
+        signals_subset = signals[:MAX_BATCH_SIGNALS]
 
         # Build signal summary for Claude
         signal_summaries = []
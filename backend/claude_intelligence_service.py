@@ -33,6 +33,9 @@ class SemanticAnalysisResult:
 _claude_cache: Dict[str, Tuple[SemanticAnalysisResult, datetime]] = {}
 _cache_ttl_minutes = 60
 
+# Maximum signals sent to Claude in a single batch request
+_BATCH_SIZE = 25
+
 
 class ClaudeIntelligenceService:
     """Service for Claude-powered semantic intelligence analysis."""
@@ -90,15 +93,7 @@ class ClaudeIntelligenceService:
                 return cached_result
 
         # Build context string
-        context_parts = []
-        if asset_country:
-            context_parts.append(f"Country: {asset_country}")
-        if asset_sector:
-            context_parts.append(f"Sector: {asset_sector}")
-        if themes:
-            context_parts.append(f"Relevant themes: {', '.join(themes)}")
-
-        context = "\n".join(context_parts) if context_parts else "General global intelligence"
+        context = self._build_asset_context(asset_country, asset_sector, themes)
 
         # Build prompt
         prompt = f"""You are an expert geopolitical risk analyst. Analyze if this intelligence signal is truly relevant to the given asset.
@@ -147,15 +142,7 @@ RESPOND IN JSON FORMAT ONLY:
             )
 
             # Parse response
-            response_text = message.content[0].text.strip()
-
-            # Extract JSON from response (handle markdown code blocks)
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0].strip()
-
-            response_data = json.loads(response_text)
+            response_data = self._parse_json_response(message.content[0].text)
 
             # Create result
             result = SemanticAnalysisResult(
@@ -175,13 +162,156 @@ RESPOND IN JSON FORMAT ONLY:
         except Exception as e:
             # Fallback: return neutral score on error
             print(f"Claude API error: {e}")
-            return SemanticAnalysisResult(
-                relevance_score=0.5,  # Neutral score
-                confidence_score=0.0,  # No confidence
-                matched_themes=[],
-                reasoning=f"API error: {str(e)}",
-                is_relevant=False  # Don't pass through on error
-            )
+            return self._error_result(f"API error: {str(e)}")
+
+    def analyze_signals_batch(
+        self,
+        signals: List[Dict],
+        asset_country: Optional[str],
+        asset_sector: Optional[str],
+        themes: List[str],
+        relevance_threshold: float = 0.6,
+        use_haiku: bool = True
+    ) -> List[SemanticAnalysisResult]:
+        """
+        Analyze many signals with one Claude request per chunk of signals.
+
+        Cached signals are answered locally; the rest are sent together in a
+        single prompt (up to _BATCH_SIZE per request) that returns a verdict
+        per signal index, instead of one round-trip per signal.
+
+        Args:
+            signals: List of signal dicts with 'title' and 'summary'
+            asset_country: Country of the asset
+            asset_sector: Sector of the asset
+            themes: List of relevant geopolitical themes
+            relevance_threshold: Minimum relevance score to pass (0.0-1.0)
+            use_haiku: Use Claude Haiku for speed/cost (default: True)
+
+        Returns:
+            One SemanticAnalysisResult per input signal, in input order
+        """
+        results: List[Optional[SemanticAnalysisResult]] = [None] * len(signals)
+        cache_keys: List[Optional[str]] = [None] * len(signals)
+        pending: List[int] = []
+
+        # Answer what we can from cache
+        for idx, signal in enumerate(signals):
+            if self.use_cache:
+                cache_keys[idx] = self._generate_cache_key(
+                    signal.get("title", ""), signal.get("summary", ""),
+                    asset_country, asset_sector, themes
+                )
+                cached_result = self._get_from_cache(cache_keys[idx])
+                if cached_result:
+                    # Threshold may differ from the one the entry was cached under
+                    results[idx] = SemanticAnalysisResult(
+                        relevance_score=cached_result.relevance_score,
+                        confidence_score=cached_result.confidence_score,
+                        matched_themes=cached_result.matched_themes,
+                        reasoning=cached_result.reasoning,
+                        is_relevant=cached_result.relevance_score >= relevance_threshold,
+                    )
+                    continue
+            pending.append(idx)
+
+        context = self._build_asset_context(asset_country, asset_sector, themes)
+        model = "claude-3-haiku-20240307" if use_haiku else "claude-3-5-sonnet-20241022"
+
+        for start in range(0, len(pending), _BATCH_SIZE):
+            chunk = pending[start:start + _BATCH_SIZE]
+
+            signal_blocks = []
+            for idx in chunk:
+                signal_blocks.append(
+                    f"[{idx}] Title: {signals[idx].get('title', '')}\n"
+                    f"    Summary: {signals[idx].get('summary', '')}"
+                )
+            signals_text = "\n\n".join(signal_blocks)
+
+            prompt = f"""You are an expert geopolitical risk analyst. Analyze whether each intelligence signal below is truly relevant to the given asset.
+
+ASSET CONTEXT:
+{context}
+
+INTELLIGENCE SIGNALS ({len(chunk)} signals):
+{signals_text}
+
+TASK (for EACH signal):
+1. Determine if the signal is TRULY relevant to the asset's risk profile
+2. Rate relevance from 0.0 (completely irrelevant) to 1.0 (highly relevant)
+3. Rate your confidence from 0.0 (very uncertain) to 1.0 (very confident)
+4. Identify which themes (if any) the signal matches semantically
+5. Explain your reasoning concisely (1-2 sentences)
+
+RELEVANCE GUIDELINES:
+- 0.8-1.0: Direct, specific impact on the asset (e.g., sanctions on Russia for Russian assets)
+- 0.6-0.8: Likely indirect impact (e.g., regional conflict affecting neighboring country)
+- 0.4-0.6: Tangential relevance (e.g., global trend affecting sector broadly)
+- 0.2-0.4: Weak connection (e.g., mentioned country but unrelated topic)
+- 0.0-0.2: Irrelevant or generic news
+
+RESPOND IN JSON FORMAT ONLY:
+{{
+    "results": [
+        {{
+            "signal_index": 0,
+            "relevance_score": 0.0-1.0,
+            "confidence_score": 0.0-1.0,
+            "matched_themes": ["theme1", "theme2"],
+            "reasoning": "Your explanation here"
+        }}
+    ]
+}}
+
+IMPORTANT: Provide a result for ALL {len(chunk)} signals, using the [index] shown for each."""
+
+            try:
+                message = self.client.messages.create(
+                    model=model,
+                    max_tokens=min(4096, 150 * len(chunk) + 200),
+                    temperature=0.1,  # Low temperature for consistent scoring
+                    messages=[{
+                        "role": "user",
+                        "content": prompt
+                    }]
+                )
+
+                response_data = self._parse_json_response(message.content[0].text)
+                by_index = {}
+                for entry in response_data.get("results", []):
+                    try:
+                        by_index[int(entry.get("signal_index", -1))] = entry
+                    except (TypeError, ValueError):
+                        continue
+
+                for idx in chunk:
+                    entry = by_index.get(idx)
+                    if entry is None:
+                        results[idx] = self._error_result("No verdict returned for signal")
+                        continue
+
+                    relevance_score = float(entry.get("relevance_score", 0.0))
+                    result = SemanticAnalysisResult(
+                        relevance_score=relevance_score,
+                        confidence_score=float(entry.get("confidence_score", 0.0)),
+                        matched_themes=entry.get("matched_themes", []),
+                        reasoning=entry.get("reasoning", ""),
+                        is_relevant=relevance_score >= relevance_threshold
+                    )
+                    results[idx] = result
+
+                    # Cache result
+                    if self.use_cache:
+                        self._add_to_cache(cache_keys[idx], result)
+
+            except Exception as e:
+                # Fallback: neutral score for every signal in the failed chunk
+                print(f"Claude API batch error: {e}")
+                for idx in chunk:
+                    results[idx] = self._error_result(f"API error: {str(e)}")
+
+        return results
 
     def analyze_batch_signals(
         self,
@@ -192,10 +322,7 @@ RESPOND IN JSON FORMAT ONLY:
         relevance_threshold: float = 0.6,
     ) -> List[Tuple[int, SemanticAnalysisResult]]:
         """
-        Analyze multiple signals in sequence.
-
-        Note: This processes signals one-by-one. For production, consider
-        implementing true batch processing with concurrent API calls.
+        Analyze multiple signals and keep only the relevant ones.
 
         Args:
             signals: List of signal dicts with 'title' and 'summary'
@@ -207,23 +334,53 @@ RESPOND IN JSON FORMAT ONLY:
         Returns:
             List of (index, SemanticAnalysisResult) tuples for relevant signals only
         """
-        relevant_signals = []
+        results = self.analyze_signals_batch(
+            signals=signals,
+            asset_country=asset_country,
+            asset_sector=asset_sector,
+            themes=themes,
+            relevance_threshold=relevance_threshold,
+        )
+        return [(idx, result) for idx, result in enumerate(results) if result.is_relevant]
 
-        for idx, signal in enumerate(signals):
-            result = self.analyze_signal_relevance(
-                signal_title=signal.get("title", ""),
-                signal_summary=signal.get("summary", ""),
-                asset_country=asset_country,
-                asset_sector=asset_sector,
-                themes=themes,
-                relevance_threshold=relevance_threshold,
-            )
+    @staticmethod
+    def _build_asset_context(
+        asset_country: Optional[str],
+        asset_sector: Optional[str],
+        themes: List[str]
+    ) -> str:
+        """Build the ASSET CONTEXT block shared by single and batch prompts."""
+        context_parts = []
+        if asset_country:
+            context_parts.append(f"Country: {asset_country}")
+        if asset_sector:
+            context_parts.append(f"Sector: {asset_sector}")
+        if themes:
+            context_parts.append(f"Relevant themes: {', '.join(themes)}")
 
-            # Only include if relevant
-            if result.is_relevant:
-                relevant_signals.append((idx, result))
+        return "\n".join(context_parts) if context_parts else "General global intelligence"
 
-        return relevant_signals
+    @staticmethod
+    def _parse_json_response(response_text: str) -> Dict:
+        """Parse a JSON response, handling markdown code blocks."""
+        response_text = response_text.strip()
+        if "```json" in response_text:
+            response_text = response_text.split("```json")[1].split("```")[0].strip()
+        elif "```" in response_text:
+            response_text = response_text.split("```")[1].split("```")[0].strip()
+
+        return json.loads(response_text)
+
+    @staticmethod
+    def _error_result(reasoning: str) -> SemanticAnalysisResult:
+        """Neutral result used when Claude could not score a signal."""
+        return SemanticAnalysisResult(
+            relevance_score=0.5,  # Neutral score
+            confidence_score=0.0,  # No confidence
+            matched_themes=[],
+            reasoning=reasoning,
+            is_relevant=False  # Don't pass through on error
+        )
 
     def _generate_cache_key(
         self,
@@ -16,6 +16,7 @@ from .models import CountrySnapshot, GlobalItem
 from .database import SessionLocal
 from .db_models import CountrySnapshotTable, GlobalItemTable
 from .data_store import _snapshot_to_pydantic, _global_item_to_pydantic
+from .intelligence_scoring import _parse_date
 
 
 def _retry_db_query(func, max_retries=3, delay=1):
@@ -175,23 +176,3 @@ def load_snapshots_filtered(
         # If database fails completely, return empty list (web search will still work)
         print("Warning: Database query failed, returning empty results. Web search will continue.")
         return []
-
-
-def _parse_date(date_str: str) -> Optional[datetime]:
-    """Parse various date formats."""
-    formats = [
-        "%Y-%m-%d",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%Y-%m-%d %H:%M:%S",
-        "%d/%m/%Y",
-        "%m/%d/%Y",
-        "%Y-%m-%dT%H:%M:%S.%f",
-        "%Y-%m-%dT%H:%M:%S.%fZ",
-    ]
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_str, fmt)
-        except (ValueError, TypeError):
-            continue
-    return None
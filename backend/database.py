@@ -27,6 +27,7 @@ engine = create_engine(
     max_overflow=10,  # Additional connections if pool is exhausted
     pool_pre_ping=True,  # Verify connections before using (handles dropped connections)
     pool_recycle=3600,  # Recycle connections after 1 hour
+    insertmanyvalues_page_size=1000,  # Rows per INSERT ... VALUES batch for bulk inserts with RETURNING
     connect_args={
         "connect_timeout": 10,  # 10 second connection timeout
         "sslmode": "require",  # Require SSL for Neon
@@ -4,7 +4,7 @@ from typing import List, Set
 from .schemas.geo_risk import Holding
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AssetProfile:
     """Structured profile of an asset for geopolitical risk analysis."""
     # Core identifiers
@@ -42,6 +42,21 @@ class AssetProfile:
     is_infrastructure_exposed: bool  # Infrastructure/utilities
 
 
+# (label, AssetProfile flag) pairs, in display order
+_EXPOSURE_PAIRS = (
+    ("Government", "is_government_exposed"),
+    ("Energy", "is_energy_exposed"),
+    ("Financial", "is_financial_exposed"),
+    ("Technology", "is_technology_exposed"),
+    ("Infrastructure", "is_infrastructure_exposed"),
+)
+
+
+def get_exposures(profile: AssetProfile) -> List[str]:
+    """Labels of the sector exposures flagged on a profile, in display order."""
+    return [name for name, flag in _EXPOSURE_PAIRS if getattr(profile, flag)]
+
+
 def characterize_asset(holding: Holding) -> AssetProfile:
     """
     Extract and structure asset characteristics for geopolitical risk analysis.
@@ -126,37 +141,27 @@ def get_characterization_summary(profile: AssetProfile) -> str:
     Useful for LLM prompts and logging.
     """
     parts = []
+    add = parts.append
     
     if profile.country:
-        parts.append(f"Country: {profile.country}")
-    parts.append(f"Region: {profile.region}")
+        add("Country: " + profile.country)
+    add("Region: " + profile.region)
     if profile.sub_region:
-        parts.append(f"Sub-region: {profile.sub_region}")
+        add("Sub-region: " + profile.sub_region)
     
-    parts.append(f"Type: {profile.asset_type}")
-    parts.append(f"Class: {profile.asset_class}")
-    parts.append(f"Sector: {profile.sector}")
+    add("Type: " + profile.asset_type)
+    add("Class: " + profile.asset_class)
+    add("Sector: " + profile.sector)
     
     if profile.is_emerging_market:
-        parts.append("Market: Emerging")
+        add("Market: Emerging")
     elif profile.is_developed_market:
-        parts.append("Market: Developed")
+        add("Market: Developed")
     elif profile.is_global_fund:
-        parts.append("Market: Global")
-    
-    exposures = []
-    if profile.is_government_exposed:
-        exposures.append("Government")
-    if profile.is_energy_exposed:
-        exposures.append("Energy")
-    if profile.is_financial_exposed:
-        exposures.append("Financial")
-    if profile.is_technology_exposed:
-        exposures.append("Technology")
-    if profile.is_infrastructure_exposed:
-        exposures.append("Infrastructure")
+        add("Market: Global")
     
+    exposures = get_exposures(profile)
     if exposures:
-        parts.append(f"Exposures: {', '.join(exposures)}")
+        add("Exposures: " + ", ".join(exposures))
     
     return " | ".join(parts)
@@ -1,6 +1,5 @@
 """Deterministic fallback generator for geopolitical risk scans."""
 import hashlib
-from datetime import datetime
 from typing import List
 from .schemas.geo_risk import (
     GeoRiskScanInputs,
@@ -10,6 +9,33 @@ from .schemas.geo_risk import (
     GeoRiskScanMeta,
     ValidationResult,
 )
+from .geo_risk_store import new_scan_id, new_created_at
+
+_ELEVATED_SUITABILITY = (
+    "Elevated downside uncertainty may warrant additional consideration "
+    "given the client's stated risk tolerance. The probability distribution "
+    "suggests meaningful tail risk that could impact portfolio stability. "
+    "Ongoing monitoring and periodic reassessment may be appropriate."
+)
+_MODERATE_SUITABILITY = (
+    "The scenario analysis indicates moderate-to-elevated risk factors that "
+    "may require ongoing monitoring. Current probabilities suggest a balanced "
+    "assessment of potential outcomes. Consideration of risk mitigation "
+    "strategies may be warranted."
+)
+_DEFAULT_SUITABILITY = (
+    "The scenario analysis indicates a range of potential outcomes. "
+    "Current probabilities suggest a balanced risk profile. Regular review "
+    "of geopolitical developments may support ongoing suitability assessments."
+)
+
+# (risk_tolerance, severe bucket) -> suitability text; severe buckets are
+# "high" (> 0.25), "mid" (> 0.2) and "low". Unlisted pairs use the default.
+_SUITABILITY_TEMPLATES = {
+    ("low", "high"): _ELEVATED_SUITABILITY,
+    ("medium", "high"): _MODERATE_SUITABILITY,
+    ("medium", "mid"): _MODERATE_SUITABILITY,
+}
 
 
 def generate_fallback(inputs: GeoRiskScanInputs) -> GeoRiskScanResult:
@@ -80,26 +106,10 @@ def generate_fallback(inputs: GeoRiskScanInputs) -> GeoRiskScanResult:
     drivers = [all_drivers[i] for i in driver_indices if i < len(all_drivers)][:4]
     
     # Generate suitability impact (non-directive, compliance-safe)
-    if inputs.risk_tolerance == "low" and severe > 0.25:
-        suitability_impact = (
-            "Elevated downside uncertainty may warrant additional consideration "
-            "given the client's stated risk tolerance. The probability distribution "
-            "suggests meaningful tail risk that could impact portfolio stability. "
-            "Ongoing monitoring and periodic reassessment may be appropriate."
-        )
-    elif inputs.risk_tolerance == "medium" and severe > 0.2:
-        suitability_impact = (
-            "The scenario analysis indicates moderate-to-elevated risk factors that "
-            "may require ongoing monitoring. Current probabilities suggest a balanced "
-            "assessment of potential outcomes. Consideration of risk mitigation "
-            "strategies may be warranted."
-        )
-    else:
-        suitability_impact = (
-            "The scenario analysis indicates a range of potential outcomes. "
-            "Current probabilities suggest a balanced risk profile. Regular review "
-            "of geopolitical developments may support ongoing suitability assessments."
-        )
+    severe_bucket = "high" if severe > 0.25 else ("mid" if severe > 0.2 else "low")
+    suitability_impact = _SUITABILITY_TEMPLATES.get(
+        (inputs.risk_tolerance, severe_bucket), _DEFAULT_SUITABILITY
+    )
     
     limitations = [
         "Analysis based on available data as of specified date",
@@ -109,8 +119,8 @@ def generate_fallback(inputs: GeoRiskScanInputs) -> GeoRiskScanResult:
     ]
     
     # Generate scan_id and timestamp
-    scan_id = f"fallback_{seed}_{int(datetime.now().timestamp())}"
-    created_at = datetime.now().isoformat()
+    scan_id = new_scan_id("fallback", str(seed))
+    created_at = new_created_at()
     
     return GeoRiskScanResult(
         scan_id=scan_id,
@@ -1,13 +1,51 @@
 """Impact assessment - analyzes intelligence signals to determine asset impact."""
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+from dataclasses import dataclass, replace
+from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import heapq
 import os
+import re
 from .geo_risk_intelligence import IntelligenceSignal
 from .geo_risk_characterization import AssetProfile
 from .geo_risk_theme_mapper import ThemeRelevance
 
-
-@dataclass
+# Upper bound on concurrent Claude summary requests per asset
+_MAX_SUMMARY_WORKERS = 8
+
+# Compact integer encoding of impact directions used by the AggregateImpact columns
+DIRECTION_CODES = {"negative": -1, "neutral": 0, "positive": 1}
+
+# Themes with a smaller impact magnitude get a canned summary instead of a Claude call
+_MIN_SUMMARY_MAGNITUDE = 0.05
+
+# Sentiment keywords used to classify signal direction (substring match)
+_POSITIVE_KEYWORDS = (
+    "growth", "improve", "stability", "recovery", "positive", "strength",
+    "agreement", "cooperation", "progress", "expansion", "boost", "gain",
+)
+_NEGATIVE_KEYWORDS = (
+    "crisis", "conflict", "sanction", "instability", "decline", "risk",
+    "tension", "dispute", "threat", "volatility", "uncertainty", "loss",
+    "embargo", "restriction", "protest", "unrest", "war", "attack",
+)
+_POSITIVE_RE = re.compile("|".join(map(re.escape, _POSITIVE_KEYWORDS)))
+_NEGATIVE_RE = re.compile("|".join(map(re.escape, _NEGATIVE_KEYWORDS)))
+
+# Theme-specific magnitude nudges: theme -> (bonus, rule). "neg_only" forces a
+# negative direction on any negative signal (sanctions, instability, trade and
+# energy disruption are almost always negative); "neg_dominant" requires negative
+# signals to outnumber positive ones (volatility can be negative or neutral).
+_THEME_NUDGES = {
+    "sanctions": (0.20, "neg_only"),
+    "political_instability": (0.15, "neg_only"),
+    "currency_volatility": (0.10, "neg_dominant"),
+    "trade_disruption": (0.15, "neg_only"),
+    "energy_security": (0.10, "neg_only"),
+}
+
+
+@dataclass(frozen=True, slots=True)
 class ThemeImpact:
     """Impact assessment for a single theme."""
     theme: str
@@ -19,15 +57,73 @@ class ThemeImpact:
     summary: str = ""  # Claude-generated verbal summary of decision making
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AggregateImpact:
     """Aggregated impact across all themes."""
     overall_direction: str  # "positive", "negative", "neutral"
     overall_magnitude: float  # 0.0 to 1.0
     confidence: float  # 0.0 to 1.0
-    theme_impacts: List[ThemeImpact]
+    theme_impacts: Tuple[ThemeImpact, ...]
     total_signals: int
 
+    # Column view of theme_impacts (same order) for numeric passes; tuples
+    # rather than lists or arrays so the whole impact stays hashable
+    magnitudes: Tuple[float, ...]  # impact_magnitude per theme
+    confidences: Tuple[float, ...]  # confidence per theme
+    directions: Tuple[int, ...]  # DIRECTION_CODES value per theme
+
+
+@lru_cache(maxsize=1)
+def _anthropic_client(api_key: str):
+    """Shared Anthropic client so the HTTP connection pool is reused across summaries."""
+    from anthropic import Anthropic
+
+    return Anthropic(api_key=api_key)
+
+
+@lru_cache(maxsize=2048)
+def _summarize_prompt(prompt: str, api_key: str) -> str:
+    """
+    Request a summary for a fully-built prompt.
+
+    Cached on the prompt text, which fingerprints the theme, asset context,
+    assessment and top signals, so repeat scans skip the API call. Failures
+    raise and are therefore never cached.
+    """
+    from anthropic import NotFoundError
+
+    client = _anthropic_client(api_key)
+
+    # Try Claude Sonnet 4.5 first (best for suitability reporting)
+    models_to_try = [
+        "claude-sonnet-4-5-20250929",  # Claude Sonnet 4.5 (latest, best quality)
+        "claude-3-haiku-20240307",     # Fallback to Haiku
+    ]
+
+    last_error = None
+    for model in models_to_try:
+        try:
+            message = client.messages.create(
+                model=model,
+                max_tokens=250,
+                temperature=0.3,
+                messages=[{
+                    "role": "user",
+                    "content": prompt
+                }]
+            )
+            summary = message.content[0].text.strip()
+            return summary
+        except NotFoundError as model_error:
+            # Model not available (404), try next model; other errors propagate
+            last_error = model_error
+            print(f"Model {model} not available, trying fallback...")
+            continue
+
+    # If all models failed, raise the last error
+    if last_error:
+        raise last_error
+
 
 def _generate_theme_summary(
     theme: ThemeRelevance,
@@ -51,6 +147,10 @@ def _generate_theme_summary(
     Returns:
         Verbal summary explaining the decision making
     """
+    # Immaterial impacts don't warrant an API round-trip
+    if not signals or impact_magnitude < _MIN_SUMMARY_MAGNITUDE:
+        return f"Insufficient signals to characterize {theme.theme.replace('_', ' ')} impact."
+
     # Check if Claude API is available
     api_key = os.getenv("CLAUDE_API")
     if not api_key:
@@ -58,13 +158,9 @@ def _generate_theme_summary(
         return f"Based on {len(signals)} signals, this theme shows {impact_direction} impact with {int(confidence * 100)}% confidence."
 
     try:
-        from anthropic import Anthropic
-
-        client = Anthropic(api_key=api_key)
-
         # Build signal context (limit to top 5 most relevant signals)
         signal_summaries = []
-        for i, sig in enumerate(sorted(signals, key=lambda s: s.relevance_score, reverse=True)[:5]):
+        for sig in heapq.nlargest(5, signals, key=lambda s: s.relevance_score):
             signal_summaries.append(f"- {sig.title} ({sig.source})")
 
         signals_text = "\n".join(signal_summaries)
@@ -100,39 +196,7 @@ Requirements:
 - Be objective and evidence-based
 - Suitable for client-facing investment documentation"""
 
-        # Try Claude Sonnet 4.5 first (best for suitability reporting)
-        models_to_try = [
-            "claude-sonnet-4-5-20250929",  # Claude Sonnet 4.5 (latest, best quality)
-            "claude-3-haiku-20240307",     # Fallback to Haiku
-        ]
-
-        last_error = None
-        for model in models_to_try:
-            try:
-                message = client.messages.create(
-                    model=model,
-                    max_tokens=250,
-                    temperature=0.3,
-                    messages=[{
-                        "role": "user",
-                        "content": prompt
-                    }]
-                )
-                summary = message.content[0].text.strip()
-                return summary
-            except Exception as model_error:
-                last_error = model_error
-                # If it's a 404 (model not found), try next model
-                if "404" in str(model_error) or "not_found" in str(model_error):
-                    print(f"Model {model} not available, trying fallback...")
-                    continue
-                else:
-                    # For other errors, raise immediately
-                    raise
-
-        # If all models failed, raise the last error
-        if last_error:
-            raise last_error
+        return _summarize_prompt(prompt, api_key)
 
     except Exception as e:
         print(f"Failed to generate Claude summary (all models): {e}")
@@ -140,6 +204,50 @@ Requirements:
         return f"Based on {len(signals)} intelligence signals, this theme shows {impact_direction} impact with {int(confidence * 100)}% confidence for {profile.name}."
 
 
+def _generate_theme_summaries(
+    contexts: List[Tuple[ThemeRelevance, List[IntelligenceSignal], ThemeImpact]],
+    profile: AssetProfile,
+) -> Dict[str, str]:
+    """
+    Generate summaries for several themes concurrently.
+
+    Each summary is an independent Claude request, so issuing them in parallel
+    keeps wall-clock latency close to a single round-trip instead of one per theme.
+
+    Args:
+        contexts: (theme, signals, numeric impact) for each theme needing a summary
+        profile: Asset profile
+
+    Returns:
+        Mapping of theme name to summary
+    """
+    if not contexts:
+        return {}
+
+    def _summarize(context: Tuple[ThemeRelevance, List[IntelligenceSignal], ThemeImpact]) -> str:
+        theme, theme_signals, impact = context
+        return _generate_theme_summary(
+            theme=theme,
+            signals=theme_signals,
+            profile=profile,
+            impact_direction=impact.impact_direction,
+            impact_magnitude=impact.impact_magnitude,
+            confidence=impact.confidence,
+        )
+
+    workers = min(len(contexts), _MAX_SUMMARY_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        summaries = list(executor.map(_summarize, contexts))
+
+    return {theme.theme: summary for (theme, _, _), summary in zip(contexts, summaries)}
+
+
+def _classify_signal(signal: IntelligenceSignal) -> Tuple[bool, bool]:
+    """Return (has_positive, has_negative) keyword flags for a signal."""
+    text = f"{signal.title} {signal.summary}".lower()
+    return _POSITIVE_RE.search(text) is not None, _NEGATIVE_RE.search(text) is not None
+
+
 def assess_impact(
     profile: AssetProfile,
     themes: List[ThemeRelevance],
@@ -157,12 +265,16 @@ def assess_impact(
         AggregateImpact with overall assessment and per-theme breakdowns
     """
     theme_impacts: List[ThemeImpact] = []
+    summary_contexts: List[Tuple[ThemeRelevance, List[IntelligenceSignal], ThemeImpact]] = []
     
-    # Group signals by theme
+    # Group signals by theme, classifying each signal's sentiment exactly once
     signals_by_theme: Dict[str, List[IntelligenceSignal]] = {}
+    signal_classes: Dict[int, Tuple[bool, bool]] = {}
     for signal in signals:
         if signal.theme_match:
             signals_by_theme.setdefault(signal.theme_match, []).append(signal)
+            if id(signal) not in signal_classes:
+                signal_classes[id(signal)] = _classify_signal(signal)
     
     # Assess impact for each theme
     for theme in themes:
@@ -183,8 +295,17 @@ def assess_impact(
             continue
         
         # Analyze signals to determine impact
-        impact = _assess_theme_impact(theme, theme_signals, profile)
+        classifications = [signal_classes[id(s)] for s in theme_signals]
+        impact = _assess_theme_impact(theme, theme_signals, profile, classifications)
         theme_impacts.append(impact)
+        summary_contexts.append((theme, theme_signals, impact))
+    
+    # Generate Claude-powered summaries for all themes in one concurrent batch
+    summaries = _generate_theme_summaries(summary_contexts, profile)
+    theme_impacts = [
+        replace(impact, summary=summaries[impact.theme]) if impact.theme in summaries else impact
+        for impact in theme_impacts
+    ]
     
     # Aggregate impacts
     return _aggregate_impacts(theme_impacts, len(signals))
@@ -194,36 +315,18 @@ def _assess_theme_impact(
     theme: ThemeRelevance,
     signals: List[IntelligenceSignal],
     profile: AssetProfile,
+    classifications: List[Tuple[bool, bool]],
 ) -> ThemeImpact:
-    """Assess impact for a single theme based on its signals."""
-    
-    # Determine impact direction based on theme type and signal content
-    positive_keywords = [
-        "growth", "improve", "stability", "recovery", "positive", "strength",
-        "agreement", "cooperation", "progress", "expansion", "boost", "gain",
-    ]
-    negative_keywords = [
-        "crisis", "conflict", "sanction", "instability", "decline", "risk",
-        "tension", "dispute", "threat", "volatility", "uncertainty", "loss",
-        "embargo", "restriction", "protest", "unrest", "war", "attack",
-    ]
-    
-    # Count positive vs negative signals
-    positive_count = 0
-    negative_count = 0
-    neutral_count = 0
+    """
+    Assess impact for a single theme based on its signals.
+
+    Numeric assessment only; the summary is filled in by assess_impact.
+    classifications holds the (has_positive, has_negative) pair for each signal.
+    """
     
-    for signal in signals:
-        text = f"{signal.title} {signal.summary}".lower()
-        has_positive = any(kw in text for kw in positive_keywords)
-        has_negative = any(kw in text for kw in negative_keywords)
-        
-        if has_negative and not has_positive:
-            negative_count += 1
-        elif has_positive and not has_negative:
-            positive_count += 1
-        else:
-            neutral_count += 1
+    # Count positive vs negative signals from their precomputed classifications
+    positive_count = sum(1 for has_positive, has_negative in classifications if has_positive and not has_negative)
+    negative_count = sum(1 for has_positive, has_negative in classifications if has_negative and not has_positive)
     
     # Determine direction
     total = len(signals)
@@ -238,31 +341,14 @@ def _assess_theme_impact(
         magnitude = 0.3 * theme.relevance_score
     
     # Adjust for theme-specific logic
-    if theme.theme == "sanctions":
-        # Sanctions are almost always negative
-        if negative_count > 0:
-            direction = "negative"
-            magnitude = min(1.0, magnitude + 0.2)
-    elif theme.theme == "political_instability":
-        # Instability is negative
-        if negative_count > 0:
-            direction = "negative"
-            magnitude = min(1.0, magnitude + 0.15)
-    elif theme.theme == "currency_volatility":
-        # Volatility can be negative or neutral
-        if negative_count > positive_count:
-            direction = "negative"
-            magnitude = min(1.0, magnitude + 0.1)
-    elif theme.theme == "trade_disruption":
-        # Trade disruption is negative
-        if negative_count > 0:
+    nudge = _THEME_NUDGES.get(theme.theme)
+    if nudge:
+        bonus, rule = nudge
+        if (rule == "neg_only" and negative_count > 0) or (
+            rule == "neg_dominant" and negative_count > positive_count
+        ):
             direction = "negative"
-            magnitude = min(1.0, magnitude + 0.15)
-    elif theme.theme == "energy_security":
-        # Energy security issues are negative
-        if negative_count > 0:
-            direction = "negative"
-            magnitude = min(1.0, magnitude + 0.1)
+            magnitude = min(1.0, magnitude + bonus)
     
     # Confidence based on signal count and relevance
     confidence = min(1.0, (len(signals) / 10.0) * 0.5 + theme.relevance_score * 0.5)
@@ -280,16 +366,6 @@ def _assess_theme_impact(
     if profile.country:
         reasoning_parts.append(f"Country: {profile.country}")
 
-    # Generate Claude-powered summary
-    summary = _generate_theme_summary(
-        theme=theme,
-        signals=signals,
-        profile=profile,
-        impact_direction=direction,
-        impact_magnitude=magnitude,
-        confidence=confidence,
-    )
-
     return ThemeImpact(
         theme=theme.theme,
         impact_direction=direction,
@@ -297,7 +373,6 @@ def _assess_theme_impact(
         confidence=confidence,
         reasoning="; ".join(reasoning_parts),
         signal_count=len(signals),
-        summary=summary,
     )
 
 
@@ -307,21 +382,17 @@ def _aggregate_impacts(
 ) -> AggregateImpact:
     """Aggregate individual theme impacts into overall assessment."""
     
-    # Weighted average of impacts
-    weighted_negative = 0.0
-    weighted_positive = 0.0
-    total_weight = 0.0
-    total_confidence = 0.0
+    # Columns of the per-theme numbers
+    magnitudes = tuple([impact.impact_magnitude for impact in theme_impacts])
+    confidences = tuple([impact.confidence for impact in theme_impacts])
+    directions = tuple([DIRECTION_CODES[impact.impact_direction] for impact in theme_impacts])
     
-    for impact in theme_impacts:
-        weight = impact.impact_magnitude * impact.confidence
-        total_weight += weight
-        total_confidence += impact.confidence
-        
-        if impact.impact_direction == "negative":
-            weighted_negative += weight
-        elif impact.impact_direction == "positive":
-            weighted_positive += weight
+    # Weighted average of impacts; direction masks multiply in as 0/1
+    weights = [m * c for m, c in zip(magnitudes, confidences)]
+    total_weight = sum(weights)
+    total_confidence = sum(confidences)
+    weighted_negative = sum(w * (d < 0) for w, d in zip(weights, directions))
+    weighted_positive = sum(w * (d > 0) for w, d in zip(weights, directions))
     
     # Determine overall direction
     if weighted_negative > weighted_positive and weighted_negative > total_weight * 0.4:
@@ -343,6 +414,9 @@ def _aggregate_impacts(
         overall_direction=overall_direction,
         overall_magnitude=overall_magnitude,
         confidence=overall_confidence,
-        theme_impacts=theme_impacts,
+        theme_impacts=tuple(theme_impacts),
         total_signals=total_signals,
+        magnitudes=magnitudes,
+        confidences=confidences,
+        directions=directions,
     )
@@ -15,11 +15,16 @@ Pipeline:
 5. Aggregate and prioritize signals
 6. Return top N most relevant signals
 """
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from functools import lru_cache
+import heapq
+import logging
 import os
+import re
+import sys
 from typing import TYPE_CHECKING
 
 from .geo_risk_characterization import AssetProfile
@@ -27,34 +32,72 @@ from .geo_risk_theme_mapper import ThemeRelevance, get_geopolitical_themes
 from .data_store_filtered import load_global_items_filtered, load_snapshots_filtered
 from .intelligence_scoring import (
     calculate_recency_score,
+    calculate_recency_scores,
     get_source_quality_score,
     get_activity_level_score,
-    calculate_final_score,
+    calculate_final_scores,
+    get_scoring_config,
+    ScoringConfig,
 )
-from .models import GlobalItem, CountrySnapshot
+from .models import GlobalItem, CountrySnapshot, EventCluster
 from .theme_web_search import (
     search_theme_web,
     convert_web_results_to_signals,
+    _build_search_query,
 )
 from .scoring_settings_service import get_active_scoring_settings
 
+logger = logging.getLogger(__name__)
+
 # Import Claude services (optional, graceful fallback if not available)
 try:
     from .claude_intelligence_service import ClaudeIntelligenceService
     CLAUDE_AVAILABLE = True
 except ImportError:
     CLAUDE_AVAILABLE = False
-    print("Claude service not available - using keyword-based filtering only")
+    logger.info("Claude service not available - using keyword-based filtering only")
 
 try:
-    from .claude_batch_validation_service import ClaudeBatchValidationService
+    from .claude_batch_validation_service import ClaudeBatchValidationService, MAX_BATCH_SIGNALS
     BATCH_VALIDATION_AVAILABLE = True
 except ImportError:
     BATCH_VALIDATION_AVAILABLE = False
-    print("Batch validation service not available")
+    logger.info("Batch validation service not available")
 
+# Aho-Corasick keyword automaton (optional, falls back to per-keyword substring checks)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
-@dataclass
+
+# Keyword-score gates that decide a signal without a Claude semantic call
+_SEMANTIC_REJECT_BELOW = 0.1  # both base relevance and theme match below this
+_SEMANTIC_ACCEPT_BASE_ABOVE = 0.8
+_SEMANTIC_ACCEPT_THEME_ABOVE = 0.5
+
+# Confidence multiplier per batch-validation evidence quality ("medium" is neutral)
+_EVIDENCE_QUALITY_MULTIPLIERS: Dict[str, float] = {"high": 1.2, "low": 0.7}
+
+# Lowercase keywords that tie a country or snapshot name to a profile region
+_REGION_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "Emerging Markets": ("emerging", "developing"),
+    "Europe": ("europe", "european"),
+    "Asia": ("asia", "asian"),
+    "Americas": ("america", "american"),
+    "Middle East": ("middle east", "mideast"),
+}
+_REGION_PATTERNS = {
+    region: re.compile("|".join(re.escape(kw) for kw in keywords))
+    for region, keywords in _REGION_KEYWORDS.items()
+}
+
+# (theme name, lowercased keywords, keyword count, theme relevance) per matchable theme
+ThemeTable = Tuple[Tuple[str, Tuple[str, ...], int, float], ...]
+
+
+@dataclass(slots=True)
 class IntelligenceSignal:
     """A single intelligence signal relevant to an asset."""
     source: str  # "global_item", "country_snapshot", or "web_search"
@@ -89,6 +132,16 @@ class IntelligenceSignal:
     validation_reasoning: str = ""  # Validation explanation
     confidence_multiplier: float = 1.0  # Final confidence adjustment
 
+    def __post_init__(self):
+        # Topic, country and activity level come from a handful of values but are
+        # loaded as separate str objects per item; share one object per value
+        if self.topic is not None:
+            self.topic = sys.intern(self.topic)
+        if self.country is not None:
+            self.country = sys.intern(self.country)
+        if self.activity_level is not None:
+            self.activity_level = sys.intern(self.activity_level)
+
 
 @dataclass
 class IntelligenceRetrievalResult:
@@ -139,6 +192,19 @@ def retrieve_intelligence(
         semantic_threshold = settings.get("semantic_threshold", 0.6) if settings else 0.6
     if use_batch_validation is None:
         use_batch_validation = settings.get("use_batch_validation", True) if settings else True
+
+    # Read thresholds and match scores once for the whole retrieval
+    threshold_low = settings.get("relevance_threshold_low", 0.05) if settings else 0.05
+    threshold_high = settings.get("relevance_threshold_high", 0.1) if settings else 0.1
+    theme_threshold = settings.get("theme_relevance_threshold_web", 0.3) if settings else 0.3
+    max_events = settings.get("max_events_per_snapshot", 3) if settings else 3
+    match_scores = {
+        "country_exact": settings.get("score_country_exact_match", 0.5) if settings else 0.5,
+        "country_partial": settings.get("score_country_partial_match", 0.3) if settings else 0.3,
+        "region_match": settings.get("score_region_match", 0.2) if settings else 0.2,
+        "sector_match": settings.get("score_sector_match", 0.2) if settings else 0.2,
+    }
+    scoring_config = get_scoring_config()
     
     signals: List[IntelligenceSignal] = []
 
@@ -147,95 +213,73 @@ def retrieve_intelligence(
     if use_semantic_filtering and CLAUDE_AVAILABLE:
         try:
             claude_service = ClaudeIntelligenceService()
-            print(f"✓ Claude semantic filtering enabled (threshold: {semantic_threshold})")
+            logger.debug("✓ Claude semantic filtering enabled (threshold: %s)", semantic_threshold)
         except Exception as e:
-            print(f"⚠ Claude service initialization failed: {e}")
-            print("Falling back to keyword-based filtering")
+            logger.warning(
+                "⚠ Claude service initialization failed: %s; falling back to keyword-based filtering", e
+            )
             claude_service = None
 
     # Build theme keywords for matching
     theme_keywords = _build_theme_keywords(themes)
+    theme_table = _build_theme_table(themes, theme_keywords)
+    keyword_automaton = _build_keyword_automaton(theme_table)
     theme_names = [t.theme for t in themes]
     
-    # Step 1: Query global items with database-level filtering
-    global_items = _query_global_items(profile, days_lookback)
-
-    # Step 2: Score and process global items with semantic filtering
-    for item in global_items:
-        signal = _process_global_item(item, profile, themes, theme_keywords, days_lookback)
-        if signal:
-            # Step 2a: Apply semantic filtering (if enabled)
-            if claude_service:
-                semantic_result = claude_service.analyze_signal_relevance(
-                    signal_title=signal.title,
-                    signal_summary=signal.summary,
-                    asset_country=profile.country,
-                    asset_sector=profile.sector,
-                    themes=theme_names,
-                    relevance_threshold=semantic_threshold,
-                )
-
-                # Update signal with Claude's analysis
-                signal.semantic_relevance = semantic_result.relevance_score
-                signal.semantic_confidence = semantic_result.confidence_score
-                signal.semantic_reasoning = semantic_result.reasoning
-
-                # Only keep if semantically relevant
-                if not semantic_result.is_relevant:
-                    continue  # Skip this signal
-
-                # Boost theme matching if Claude identified themes
-                if semantic_result.matched_themes and not signal.theme_match:
-                    signal.theme_match = semantic_result.matched_themes[0]
-
-            # Get threshold from settings
-            settings = get_active_scoring_settings()
-            threshold_low = settings.get("relevance_threshold_low", 0.05) if settings else 0.05
-            threshold_high = settings.get("relevance_threshold_high", 0.1) if settings else 0.1
-            threshold = threshold_low if len(signals) < 5 else threshold_high
-            if signal.relevance_score > threshold:
-                signals.append(signal)
-    
-    # Step 3: Query country snapshots with database-level filtering
-    snapshots = _query_country_snapshots(profile, days_lookback)
-
-    # Step 4: Score and process country snapshots with semantic filtering
-    for snapshot in snapshots:
-        snapshot_signals = _process_country_snapshot(
-            snapshot, profile, themes, theme_keywords, days_lookback
+    # Steps 1 & 3: Query global items and country snapshots with database-level
+    # filtering. The loaders are independent and each opens its own session, so
+    # they run concurrently and their round-trips (including fallbacks) overlap.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        global_items_future = executor.submit(_query_global_items, profile, days_lookback)
+        snapshots_future = executor.submit(_query_country_snapshots, profile, days_lookback)
+        global_items = global_items_future.result()
+        snapshots = snapshots_future.result()
+
+    # Step 2: Score and process global items, then semantically filter them in one batch
+    global_signals = _process_global_items(
+        global_items, profile, theme_table, keyword_automaton, days_lookback, match_scores,
+        scoring_config,
+    )
+
+    # Step 2a: Apply semantic filtering (if enabled)
+    if claude_service:
+        global_signals = _apply_semantic_filtering(
+            claude_service, global_signals, profile, theme_names, semantic_threshold
         )
 
-        # Get threshold from settings
-        settings = get_active_scoring_settings()
-        threshold_low = settings.get("relevance_threshold_low", 0.05) if settings else 0.05
-        threshold_high = settings.get("relevance_threshold_high", 0.1) if settings else 0.1
+    for signal in global_signals:
         threshold = threshold_low if len(signals) < 5 else threshold_high
+        if signal.relevance_score > threshold:
+            signals.append(signal)
+    
+    # Step 4: Score and process country snapshots, then semantically filter them in one batch
+    snapshot_signal_groups = [
+        _process_country_snapshot(
+            snapshot, profile, theme_table, keyword_automaton,
+            days_lookback, match_scores, max_events, scoring_config,
+        )
+        for snapshot in snapshots
+    ]
+
+    # Step 4a: Apply semantic filtering (if enabled)
+    if claude_service:
+        kept = {
+            id(sig) for sig in _apply_semantic_filtering(
+                claude_service,
+                [sig for group in snapshot_signal_groups for sig in group],
+                profile,
+                theme_names,
+                semantic_threshold,
+            )
+        }
+        snapshot_signal_groups = [
+            [sig for sig in group if id(sig) in kept] for group in snapshot_signal_groups
+        ]
 
-        for sig in snapshot_signals:
-            # Step 4a: Apply semantic filtering (if enabled)
-            if claude_service:
-                semantic_result = claude_service.analyze_signal_relevance(
-                    signal_title=sig.title,
-                    signal_summary=sig.summary,
-                    asset_country=profile.country,
-                    asset_sector=profile.sector,
-                    themes=theme_names,
-                    relevance_threshold=semantic_threshold,
-                )
-
-                # Update signal with Claude's analysis
-                sig.semantic_relevance = semantic_result.relevance_score
-                sig.semantic_confidence = semantic_result.confidence_score
-                sig.semantic_reasoning = semantic_result.reasoning
-
-                # Only keep if semantically relevant
-                if not semantic_result.is_relevant:
-                    continue  # Skip this signal
-
-                # Boost theme matching if Claude identified themes
-                if semantic_result.matched_themes and not sig.theme_match:
-                    sig.theme_match = semantic_result.matched_themes[0]
+    for snapshot_signals in snapshot_signal_groups:
+        threshold = threshold_low if len(signals) < 5 else threshold_high
 
+        for sig in snapshot_signals:
             if sig.relevance_score > threshold:
                 signals.append(sig)
     
@@ -245,83 +289,48 @@ def retrieve_intelligence(
     top_themes = sorted(themes, key=lambda t: t.relevance_score, reverse=True)[:max_web_themes]
     web_searches = []
     
-    # Get theme threshold from settings
-    settings = get_active_scoring_settings()
-    theme_threshold = settings.get("theme_relevance_threshold_web", 0.3) if settings else 0.3
-    
-    for theme in top_themes:
-        if theme.relevance_score < theme_threshold:  # Skip low-relevance themes
-            continue
-        
-        try:
-            # Build query for tracking
-            from .theme_web_search import _build_search_query
-            query = _build_search_query(profile, theme, days_lookback)
-            
-            # Search web for this specific theme
-            web_results = search_theme_web(profile, theme, days_lookback)
-            
-            # Convert to intelligence signals
-            web_signals = convert_web_results_to_signals(
-                web_results, profile, theme, days_lookback
-            )
-            
-            # Track web search metadata
-            web_searches.append({
-                "theme": theme.theme,
-                "query": query,
-                "results_count": len(web_results),
-                "signals_count": len(web_signals),
-            })
-            
-            # Add to signals list
+    # Searches are independent HTTP round-trips, so run them concurrently;
+    # results are collected in theme order to keep the output deterministic
+    search_themes = [t for t in top_themes if t.relevance_score >= theme_threshold]
+    if search_themes:
+        with ThreadPoolExecutor(max_workers=len(search_themes)) as executor:
+            search_results = list(executor.map(
+                lambda theme: _search_theme(profile, theme, days_lookback), search_themes
+            ))
+        for search_meta, web_signals in search_results:
+            web_searches.append(search_meta)
             signals.extend(web_signals)
-        except Exception as e:
-            # Don't fail if web search fails - continue with database results
-            print(f"Web search failed for theme {theme.theme}: {e}")
-            # Build query even on error for tracking
-            try:
-                from .theme_web_search import _build_search_query
-                query = _build_search_query(profile, theme, days_lookback)
-            except:
-                query = f"{profile.country or profile.region} {theme.theme}"
-            
-            web_searches.append({
-                "theme": theme.theme,
-                "query": query,
-                "results_count": 0,
-                "signals_count": 0,
-                "error": str(e),
-            })
-            continue
     
     # Step 6: Deduplicate signals by URL (keep highest scored)
-    seen_urls = {}
-    deduplicated = []
+    # Single pass over an insertion-ordered dict; URL-less signals are keyed by
+    # identity. A better-scored duplicate is re-inserted so it moves to the end,
+    # matching the order a remove-and-append would produce.
+    deduplicated: Dict[object, IntelligenceSignal] = {}
     for signal in signals:
         url = signal.url or ""
-        if url and url in seen_urls:
+        if not url:
+            deduplicated[id(signal)] = signal
+        elif url not in deduplicated:
+            deduplicated[url] = signal
+        elif signal.relevance_score > deduplicated[url].relevance_score:
             # Keep the one with higher relevance
-            if signal.relevance_score > seen_urls[url].relevance_score:
-                # Replace the existing one
-                deduplicated.remove(seen_urls[url])
-                deduplicated.append(signal)
-                seen_urls[url] = signal
-        else:
-            deduplicated.append(signal)
-            if url:
-                seen_urls[url] = signal
+            del deduplicated[url]
+            deduplicated[url] = signal
     
-    signals = deduplicated
+    signals = list(deduplicated.values())
 
-    # Step 7: Sort by relevance (highest first)
-    signals.sort(key=lambda x: x.relevance_score, reverse=True)
+    # Step 7: Select top signals by relevance (highest first). Batch validation
+    # only rescores the first MAX_BATCH_SIGNALS, so keeping that many beyond
+    # max_signals leaves the final top N unchanged.
+    run_validation = use_batch_validation and BATCH_VALIDATION_AVAILABLE and len(signals) >= 3
+    keep = max_signals + MAX_BATCH_SIGNALS if run_validation else max_signals
+    signals = heapq.nlargest(keep, signals, key=lambda x: x.relevance_score)
 
     # Step 7.5: Batch validation (Phase 2 enhancement)
-    if use_batch_validation and BATCH_VALIDATION_AVAILABLE and len(signals) >= 3:
+    if run_validation:
         try:
             validation_service = ClaudeBatchValidationService()
-            print(f"✓ Batch validation enabled for {len(signals)} signals")
+            logger.debug("✓ Batch validation enabled for %d signals", len(signals))
 
             # Convert signals to dict format for validation
             signals_for_validation = [
@@ -341,17 +350,21 @@ def retrieve_intelligence(
                 asset_sector=profile.sector,
             )
 
-            print(f"  Coherence: {validation_result.overall_coherence:.2f}")
-            print(f"  Contradictions: {validation_result.contradiction_count}")
-            print(f"  Corroborations: {validation_result.corroboration_count}")
+            logger.debug(
+                "  Coherence: %.2f, contradictions: %d, corroborations: %d",
+                validation_result.overall_coherence,
+                validation_result.contradiction_count,
+                validation_result.corroboration_count,
+            )
 
-            # Apply validation results to signals
+            # Apply validation results to signals (last validation wins per index)
             validation_map = {v.signal_index: v for v in validation_result.validations}
+            signal_count = len(signals)
 
-            for idx, signal in enumerate(signals):
-                validation = validation_map.get(idx)
-                if not validation:
+            for idx, validation in validation_map.items():
+                if not 0 <= idx < signal_count:
                     continue
+                signal = signals[idx]
 
                 # Calculate confidence multiplier
                 confidence_multiplier = 1.0
@@ -364,13 +377,8 @@ def retrieve_intelligence(
                 if validation.is_contradicted:
                     confidence_multiplier *= 0.5
 
-                # Adjust for evidence quality
-                if validation.evidence_quality == "high":
-                    confidence_multiplier *= 1.2
-                elif validation.evidence_quality == "low":
-                    confidence_multiplier *= 0.7
-
-                # Apply validation confidence
+                # Adjust for evidence quality, then apply validation confidence
+                confidence_multiplier *= _EVIDENCE_QUALITY_MULTIPLIERS.get(validation.evidence_quality, 1.0)
                 confidence_multiplier *= validation.validation_confidence
 
                 # Update signal fields
@@ -390,8 +398,7 @@ def retrieve_intelligence(
             signals.sort(key=lambda x: x.relevance_score, reverse=True)
 
         except Exception as e:
-            print(f"⚠ Batch validation failed: {e}")
-            print("Continuing without validation")
+            logger.warning("⚠ Batch validation failed: %s; continuing without validation", e)
 
     # Step 8: Return top N signals with metadata
     return IntelligenceRetrievalResult(
@@ -400,6 +407,129 @@ def retrieve_intelligence(
     )
 
 
+def _search_theme(
+    profile: AssetProfile,
+    theme: ThemeRelevance,
+    days_lookback: int,
+) -> Tuple[Dict[str, any], List[IntelligenceSignal]]:
+    """Run the web search for one theme, returning its tracking metadata and signals."""
+    query = None
+    try:
+        # Build query once for both the search and tracking
+        query = _build_search_query(profile, theme, days_lookback)
+        
+        # Search web for this specific theme
+        web_results = search_theme_web(profile, theme, days_lookback, query=query)
+        
+        # Convert to intelligence signals
+        web_signals = convert_web_results_to_signals(
+            web_results, profile, theme, days_lookback
+        )
+        
+        # Track web search metadata
+        return {
+            "theme": theme.theme,
+            "query": query,
+            "results_count": len(web_results),
+            "signals_count": len(web_signals),
+        }, web_signals
+    except Exception as e:
+        # Don't fail if web search fails - continue with database results
+        logger.warning("Web search failed for theme %s: %s", theme.theme, e)
+        # Fall back to a plain query for tracking if building it failed
+        if query is None:
+            query = f"{profile.country or profile.region} {theme.theme}"
+        
+        return {
+            "theme": theme.theme,
+            "query": query,
+            "results_count": 0,
+            "signals_count": 0,
+            "error": str(e),
+        }, []
+
+
+def _apply_semantic_filtering(
+    claude_service: "ClaudeIntelligenceService",
+    candidates: List[IntelligenceSignal],
+    profile: AssetProfile,
+    theme_names: List[str],
+    semantic_threshold: float,
+) -> List[IntelligenceSignal]:
+    """
+    Run Claude semantic filtering over candidate signals in a single batch.
+
+    Signals whose keyword scores already decide the outcome skip Claude: no
+    location and no theme evidence is rejected, strong evidence for both is
+    accepted. The rest are updated with Claude's analysis. Returns the
+    semantically relevant signals in their original order.
+    """
+    if not candidates:
+        return []
+
+    # Cheap pre-filter: None means the signal still needs Claude
+    decisions: List[Optional[bool]] = []
+    for sig in candidates:
+        if (
+            sig.base_relevance < _SEMANTIC_REJECT_BELOW
+            and sig.theme_match_score < _SEMANTIC_REJECT_BELOW
+        ):
+            decisions.append(False)
+        elif (
+            sig.base_relevance > _SEMANTIC_ACCEPT_BASE_ABOVE
+            and sig.theme_match_score > _SEMANTIC_ACCEPT_THEME_ABOVE
+        ):
+            decisions.append(True)
+        else:
+            decisions.append(None)
+
+    to_analyze = [sig for sig, decision in zip(candidates, decisions) if decision is None]
+    skipped = len(candidates) - len(to_analyze)
+    if skipped:
+        logger.debug(
+            "  Semantic pre-filter decided %d/%d signals without Claude", skipped, len(candidates)
+        )
+
+    semantic_results = iter(claude_service.analyze_signals_batch(
+        signals=[{"title": sig.title, "summary": sig.summary} for sig in to_analyze],
+        asset_country=profile.country,
+        asset_sector=profile.sector,
+        themes=theme_names,
+        relevance_threshold=semantic_threshold,
+    ) if to_analyze else [])
+
+    relevant: List[IntelligenceSignal] = []
+    for sig, decision in zip(candidates, decisions):
+        if decision is not None:
+            sig.semantic_relevance = sig.theme_match_score if decision else 0.0
+            sig.semantic_reasoning = (
+                "Accepted by keyword pre-filter (strong location and theme match)"
+                if decision
+                else "Rejected by keyword pre-filter (no location or theme match)"
+            )
+            if decision:
+                relevant.append(sig)
+            continue
+
+        semantic_result = next(semantic_results)
+        # Update signal with Claude's analysis
+        sig.semantic_relevance = semantic_result.relevance_score
+        sig.semantic_confidence = semantic_result.confidence_score
+        sig.semantic_reasoning = semantic_result.reasoning
+
+        # Only keep if semantically relevant
+        if not semantic_result.is_relevant:
+            continue
+
+        # Boost theme matching if Claude identified themes
+        if semantic_result.matched_themes and not sig.theme_match:
+            sig.theme_match = semantic_result.matched_themes[0]
+
+        relevant.append(sig)
+
+    return relevant
+
+
 def _query_global_items(profile: AssetProfile, days_lookback: int) -> List[GlobalItem]:
     """Query global items with database-level filtering."""
     countries = []
@@ -452,123 +582,148 @@ def _query_country_snapshots(profile: AssetProfile, days_lookback: int) -> List[
     return snapshots
 
 
-def _process_global_item(
-    item: GlobalItem,
+def _process_global_items(
+    items: List[GlobalItem],
     profile: AssetProfile,
-    themes: List[ThemeRelevance],
-    theme_keywords: Dict[str, List[str]],
+    theme_table: ThemeTable,
+    keyword_automaton: Optional["ahocorasick.Automaton"],
     days_lookback: int,
-) -> Optional[IntelligenceSignal]:
-    """Process a global item and convert to IntelligenceSignal with scoring."""
+    match_scores: Dict[str, float],
+    scoring_config: ScoringConfig,
+) -> List[IntelligenceSignal]:
+    """
+    Process global items and convert them to IntelligenceSignals with scoring.
+
+    Scores are computed column by column so recency and final-score settings
+    are read once per batch rather than once per item.
+    """
+    if not items:
+        return []
     
-    # Calculate base relevance (country/region/sector match)
-    base_relevance = _calculate_base_relevance_global(item, profile)
+    # Calculate base relevance (country/region/sector match), lowercasing the
+    # profile country once and each item's countries once
+    profile_country_lower = profile.country.lower() if profile.country else ""
+    base_scores = [
+        _calculate_base_relevance_global(
+            item,
+            profile,
+            tuple(country.lower() for country in item.countries),
+            profile_country_lower,
+            **match_scores,
+        )
+        for item in items
+    ]
     
     # Calculate theme match score
-    theme_match_score, matched_theme = _calculate_theme_match(
-        item.title + " " + item.summary + " " + item.topic,
-        themes,
-        theme_keywords,
-    )
+    theme_matches = [
+        _calculate_theme_match(
+            (item.title + " " + item.summary + " " + item.topic).lower(),
+            theme_table,
+            keyword_automaton,
+        )
+        for item in items
+    ]
+    theme_scores = [score for score, _ in theme_matches]
     
     # Calculate recency score
-    recency_score = calculate_recency_score(item.published_at, days_lookback)
-    
-    # Get source quality
-    source_name = item.source.get("name", "") if isinstance(item.source, dict) else str(item.source)
-    source_quality = get_source_quality_score(source_name)
-    
-    # Calculate final weighted score
-    final_score = calculate_final_score(
-        base_relevance=base_relevance,
-        theme_match=theme_match_score,
-        recency_score=recency_score,
-        source_quality=source_quality,
-        activity_level=0.0,  # Global items don't have activity level
+    recency_scores = calculate_recency_scores(
+        [item.published_at for item in items], days_lookback, scoring_config
     )
     
-    # Extract country
-    country = _extract_country_from_item(item, profile)
-    
-    return IntelligenceSignal(
-        source="global_item",
-        title=item.title,
-        summary=item.summary,
-        topic=item.topic,
-        relevance_score=final_score,
-        theme_match=matched_theme,
-        published_at=item.published_at,
-        url=item.url,
-        country=country,
-        activity_level=None,
-        base_relevance=base_relevance,
-        theme_match_score=theme_match_score,
-        recency_score=recency_score,
-        source_quality=source_quality,
-        activity_level_score=0.0,
-        semantic_relevance=0.0,
-        semantic_confidence=0.0,
-        semantic_reasoning="",
-        validation_confidence=1.0,
-        is_corroborated=False,
-        is_contradicted=False,
-        corroboration_count=0,
-        evidence_quality="",
-        validation_reasoning="",
-        confidence_multiplier=1.0,
+    # Get source quality (looked up once per distinct source)
+    source_cache: Dict[str, float] = {}
+    source_scores = []
+    for item in items:
+        source_name = item.source.get("name", "") if isinstance(item.source, dict) else str(item.source)
+        if source_name not in source_cache:
+            source_cache[source_name] = get_source_quality_score(source_name, scoring_config)
+        source_scores.append(source_cache[source_name])
+    
+    # Calculate final weighted score (global items don't have activity level)
+    final_scores = calculate_final_scores(
+        base_scores, theme_scores, recency_scores, source_scores, [0.0] * len(items),
+        scoring_config,
     )
+    
+    return [
+        IntelligenceSignal(
+            source="global_item",
+            title=item.title,
+            summary=item.summary,
+            topic=item.topic,
+            relevance_score=final_score,
+            theme_match=matched_theme,
+            published_at=item.published_at,
+            url=item.url,
+            country=_extract_country_from_item(item, profile),
+            activity_level=None,
+            base_relevance=base_relevance,
+            theme_match_score=theme_match_score,
+            recency_score=recency_score,
+            source_quality=source_quality,
+            activity_level_score=0.0,
+            semantic_relevance=0.0,
+            semantic_confidence=0.0,
+            semantic_reasoning="",
+            validation_confidence=1.0,
+            is_corroborated=False,
+            is_contradicted=False,
+            corroboration_count=0,
+            evidence_quality="",
+            validation_reasoning="",
+            confidence_multiplier=1.0,
+        )
+        for item, base_relevance, (theme_match_score, matched_theme), recency_score, source_quality, final_score
+        in zip(items, base_scores, theme_matches, recency_scores, source_scores, final_scores)
+    ]
 
 
 def _process_country_snapshot(
     snapshot: CountrySnapshot,
     profile: AssetProfile,
-    themes: List[ThemeRelevance],
-    theme_keywords: Dict[str, List[str]],
+    theme_table: ThemeTable,
+    keyword_automaton: Optional["ahocorasick.Automaton"],
     days_lookback: int,
+    match_scores: Dict[str, float],
+    max_events: int,
+    scoring_config: ScoringConfig,
 ) -> List[IntelligenceSignal]:
     """Process a country snapshot and convert to IntelligenceSignal(s)."""
     signals: List[IntelligenceSignal] = []
     
-    # Get max events from settings
-    settings = get_active_scoring_settings()
-    max_events = settings.get("max_events_per_snapshot", 3) if settings else 3
-    top_events = _get_top_events(snapshot, profile, themes, theme_keywords, max_events=max_events)
+    top_events = _get_top_events(
+        snapshot, profile, theme_table, keyword_automaton, max_events=max_events
+    )
+    
+    # Calculate base relevance (same for every event in the snapshot)
+    base_relevance = _calculate_base_relevance_snapshot(
+        snapshot,
+        profile,
+        country_exact=match_scores["country_exact"],
+        country_partial=match_scores["country_partial"],
+        region_match=match_scores["region_match"],
+    )
     
-    if not top_events and snapshot.events:
-        # If no events matched themes, use first event
-        top_events = [snapshot.events[0]]
+    # Recency and activity come from the snapshot, so they are shared by its events
+    recency_score = calculate_recency_score(snapshot.updated_at, days_lookback, scoring_config)
+    activity_level_score = get_activity_level_score(snapshot.activity_level, scoring_config)
+    
+    # Source quality (use event confidence as proxy)
+    # Events don't have direct source, use default
+    source_quality = 0.8  # Default for aggregated country intelligence
+    
+    # Calculate final scores, reusing the theme matches from _get_top_events
+    count = len(top_events)
+    final_scores = calculate_final_scores(
+        [base_relevance] * count,
+        [theme_match_score for _, theme_match_score, _ in top_events],
+        [recency_score] * count,
+        [source_quality] * count,
+        [activity_level_score] * count,
+        scoring_config,
+    )
     
-    for event in top_events:
-        # Calculate base relevance
-        base_relevance = _calculate_base_relevance_snapshot(snapshot, profile)
-        
-        # Calculate theme match
-        event_text = f"{event.title} {event.summary} {event.why} {event.topic}"
-        theme_match_score, matched_theme = _calculate_theme_match(
-            event_text,
-            themes,
-            theme_keywords,
-        )
-        
-        # Calculate recency (use snapshot updated_at)
-        recency_score = calculate_recency_score(snapshot.updated_at, days_lookback)
-        
-        # Source quality (use event confidence as proxy)
-        # Events don't have direct source, use default
-        source_quality = 0.8  # Default for aggregated country intelligence
-        
-        # Activity level score
-        activity_level_score = get_activity_level_score(snapshot.activity_level)
-        
-        # Calculate final score
-        final_score = calculate_final_score(
-            base_relevance=base_relevance,
-            theme_match=theme_match_score,
-            recency_score=recency_score,
-            source_quality=source_quality,
-            activity_level=activity_level_score,
-        )
-        
+    for (event, theme_match_score, matched_theme), final_score in zip(top_events, final_scores):
         signal = IntelligenceSignal(
             source="country_snapshot",
             title=event.title,
@@ -602,39 +757,40 @@ def _process_country_snapshot(
     return signals
 
 
-def _calculate_base_relevance_global(item: GlobalItem, profile: AssetProfile) -> float:
-    """Calculate base relevance score for a global item (using database settings or defaults)."""
-    score = 0.0
+def _calculate_base_relevance_global(
+    item: GlobalItem,
+    profile: AssetProfile,
+    countries_lower: Tuple[str, ...],
+    profile_country_lower: str,
+    *,
+    country_exact: float,
+    country_partial: float,
+    region_match: float,
+    sector_match: float,
+) -> float:
+    """
+    Calculate base relevance score for a global item from the configured match scores.
     
-    # Get scores from settings
-    settings = get_active_scoring_settings()
-    country_exact = settings.get("score_country_exact_match", 0.5) if settings else 0.5
-    country_partial = settings.get("score_country_partial_match", 0.3) if settings else 0.3
-    region_match = settings.get("score_region_match", 0.2) if settings else 0.2
-    sector_match = settings.get("score_sector_match", 0.2) if settings else 0.2
+    countries_lower and profile_country_lower are the lowercased item countries
+    and profile country, computed once by the caller.
+    """
+    score = 0.0
     
     # Country match (strong signal)
     if profile.country:
         if profile.country in item.countries:
             score += country_exact
         # Partial match (e.g., "United States" in "United States of America")
-        elif any(profile.country.lower() in country.lower() for country in item.countries):
+        elif any(profile_country_lower in country_lower for country_lower in countries_lower):
             score += country_partial
     
     # Region match
     if profile.region:
-        region_keywords = {
-            "Emerging Markets": ["emerging", "developing"],
-            "Europe": ["europe", "european"],
-            "Asia": ["asia", "asian"],
-            "Americas": ["america", "american"],
-            "Middle East": ["middle east", "mideast"],
-        }
         region_lower = profile.region.lower()
-        for country in item.countries:
-            country_lower = country.lower()
-            if region_lower in country_lower or any(
-                kw in country_lower for kw in region_keywords.get(profile.region, [])
+        region_pattern = _REGION_PATTERNS.get(profile.region)
+        for country_lower in countries_lower:
+            if region_lower in country_lower or (
+                region_pattern is not None and region_pattern.search(country_lower)
             ):
                 score += region_match
                 break
@@ -652,67 +808,75 @@ def _calculate_base_relevance_global(item: GlobalItem, profile: AssetProfile) ->
 def _calculate_base_relevance_snapshot(
     snapshot: CountrySnapshot,
     profile: AssetProfile,
+    *,
+    country_exact: float,
+    country_partial: float,
+    region_match: float,
 ) -> float:
-    """Calculate base relevance score for a country snapshot (using database settings or defaults)."""
+    """Calculate base relevance score for a country snapshot from the configured match scores."""
     score = 0.0
     
-    # Get scores from settings
-    settings = get_active_scoring_settings()
-    country_exact = settings.get("score_country_exact_match", 0.5) if settings else 0.5
-    country_partial = settings.get("score_country_partial_match", 0.3) if settings else 0.3
-    region_match = settings.get("score_region_match", 0.2) if settings else 0.2
+    snapshot_lower = snapshot.name.lower()
     
     # Direct country match (very strong) - use higher multiplier for snapshots
     if profile.country:
-        if profile.country.lower() == snapshot.name.lower():
+        country_lower = profile.country.lower()
+        if country_lower == snapshot_lower:
             score += country_exact * 1.4  # Boost for exact match in snapshots
-        elif profile.country.lower() in snapshot.name.lower():
+        elif country_lower in snapshot_lower:
             score += country_partial * 1.4  # Boost for partial match in snapshots
     
     # Region match
     if profile.region:
-        region_keywords = {
-            "Emerging Markets": ["emerging", "developing"],
-            "Europe": ["europe", "european"],
-            "Asia": ["asia", "asian"],
-            "Americas": ["america", "american"],
-            "Middle East": ["middle east", "mideast"],
-        }
-        snapshot_lower = snapshot.name.lower()
-        if any(kw in snapshot_lower for kw in region_keywords.get(profile.region, [])):
+        region_pattern = _REGION_PATTERNS.get(profile.region)
+        if region_pattern is not None and region_pattern.search(snapshot_lower):
             score += region_match
     
     return min(1.0, score)
 
 
 def _calculate_theme_match(
-    text: str,
-    themes: List[ThemeRelevance],
-    theme_keywords: Dict[str, List[str]],
+    text_lower: str,
+    theme_table: ThemeTable,
+    keyword_automaton: Optional["ahocorasick.Automaton"] = None,
 ) -> tuple[float, Optional[str]]:
     """
     Calculate theme match score and return best matching theme.
     
+    Args:
+        text_lower: Signal text, already lowercased by the caller
+        theme_table: Matchable themes from _build_theme_table
+        keyword_automaton: Automaton from _build_keyword_automaton; when given,
+            all themes' keywords are found in one scan of the text
+    
     Returns:
         (score, theme_name) tuple
     """
-    text_lower = text.lower()
     best_score = 0.0
     best_theme = None
     
-    for theme in themes:
-        if theme.relevance_score < 0.2:  # Skip low-relevance themes
-            continue
-        
-        keywords = theme_keywords.get(theme.theme, [])
-        matches = sum(1 for kw in keywords if kw.lower() in text_lower)
+    match_counts: Optional[Dict[str, int]] = None
+    if keyword_automaton is not None:
+        # Each keyword counts once per theme, however often it occurs
+        matched = set()
+        for _, hits in keyword_automaton.iter(text_lower):
+            matched.update(hits)
+        match_counts = {}
+        for theme_name, _ in matched:
+            match_counts[theme_name] = match_counts.get(theme_name, 0) + 1
+    
+    for theme_name, keywords, keyword_count, relevance_score in theme_table:
+        if match_counts is not None:
+            matches = match_counts.get(theme_name, 0)
+        else:
+            matches = sum(1 for kw in keywords if kw in text_lower)
         
         if matches > 0:
             # Score based on number of keyword matches and theme relevance
-            match_score = min(1.0, (matches / len(keywords)) * theme.relevance_score)
+            match_score = min(1.0, (matches / keyword_count) * relevance_score)
             if match_score > best_score:
                 best_score = match_score
-                best_theme = theme.theme
+                best_theme = theme_name
     
     return best_score, best_theme
 
@@ -720,37 +884,107 @@ def _calculate_theme_match(
 def _get_top_events(
     snapshot: CountrySnapshot,
     profile: AssetProfile,
-    themes: List[ThemeRelevance],
-    theme_keywords: Dict[str, List[str]],
+    theme_table: ThemeTable,
+    keyword_automaton: Optional["ahocorasick.Automaton"] = None,
     max_events: int = 3,
-) -> List:
-    """Get top N most relevant events from a snapshot."""
+) -> List[Tuple[EventCluster, float, Optional[str]]]:
+    """
+    Get top N most relevant events from a snapshot.
+    
+    Returns (event, theme_match_score, matched_theme) tuples so callers can
+    reuse the theme match instead of recomputing it. If no events are
+    selected, the snapshot's first event is returned with its match.
+    """
     if not snapshot.events:
         return []
     
-    event_scores = []
-    for event in snapshot.events:
-        event_text = f"{event.title} {event.summary} {event.why} {event.topic}"
-        score, _ = _calculate_theme_match(event_text, themes, theme_keywords)
-        event_scores.append((score, event))
+    event_matches = [
+        (event, *_calculate_theme_match(_event_text_lower(event), theme_table, keyword_automaton))
+        for event in snapshot.events
+    ]
+    first_event_match = event_matches[0]
     
     # Sort by score (highest first)
-    event_scores.sort(key=lambda x: x[0], reverse=True)
+    event_matches.sort(key=lambda x: x[1], reverse=True)
     
-    # Return top N events
-    return [event for _, event in event_scores[:max_events]]
+    # Return top N events, falling back to the first event
+    return event_matches[:max_events] or [first_event_match]
+
+
+def _event_text_lower(event: EventCluster) -> str:
+    """Lowercased text of a snapshot event used for theme matching."""
+    return f"{event.title} {event.summary} {event.why} {event.topic}".lower()
 
 
-def _build_theme_keywords(themes: List[ThemeRelevance]) -> Dict[str, List[str]]:
-    """Build keyword dictionary for themes."""
-    keywords: Dict[str, List[str]] = {}
+def _build_theme_keywords(themes: List[ThemeRelevance]) -> Dict[str, Tuple[str, ...]]:
+    """Build keyword dictionary for themes, lowercased once up front."""
+    keywords: Dict[str, Tuple[str, ...]] = {}
     all_themes = get_geopolitical_themes()
     for theme in themes:
         if theme.theme in all_themes:
-            keywords[theme.theme] = all_themes[theme.theme].get("keywords", [])
+            keywords[theme.theme] = tuple(kw.lower() for kw in all_themes[theme.theme].get("keywords", []))
     return keywords
 
 
+def _build_theme_table(
+    themes: List[ThemeRelevance],
+    theme_keywords: Dict[str, Tuple[str, ...]],
+) -> ThemeTable:
+    """
+    Build the per-retrieval theme table used by _calculate_theme_match.
+
+    Low-relevance themes and themes without keywords can never match, so they
+    are dropped here instead of being re-checked for every signal.
+    """
+    table = []
+    for theme in themes:
+        if theme.relevance_score < 0.2:  # Skip low-relevance themes
+            continue
+        keywords = theme_keywords.get(theme.theme, ())
+        if keywords:
+            table.append((theme.theme, keywords, len(keywords), theme.relevance_score))
+    return tuple(table)
+
+
+def _build_keyword_automaton(theme_table: ThemeTable) -> Optional["ahocorasick.Automaton"]:
+    """
+    Build one Aho-Corasick automaton over the keywords of every matchable theme.
+
+    Each keyword maps to the (theme, position) pairs it appears at, so a single
+    scan of a text yields the distinct keywords matched for every theme.
+    Returns None when pyahocorasick is not installed.
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    return _keyword_automaton(tuple((theme_name, keywords) for theme_name, keywords, _, _ in theme_table))
+
+
+@lru_cache(maxsize=64)
+def _keyword_automaton(
+    theme_keywords: Tuple[Tuple[str, Tuple[str, ...]], ...],
+) -> Optional["ahocorasick.Automaton"]:
+    """
+    Build the automaton for a set of (theme, keywords) pairs.
+
+    Keyed on the keywords only (not the relevance scores), so assets that share
+    matchable themes reuse one automaton instead of rebuilding it per retrieval.
+    The automaton is only read after it is built.
+    """
+    payloads: Dict[str, List[Tuple[str, int]]] = {}
+    for theme_name, keywords in theme_keywords:
+        for position, kw in enumerate(keywords):
+            if kw:
+                payloads.setdefault(kw, []).append((theme_name, position))
+    if not payloads:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for kw, hits in payloads.items():
+        automaton.add_word(kw, tuple(hits))
+    automaton.make_automaton()
+    return automaton
+
+
 def _extract_country_from_item(item: GlobalItem, profile: AssetProfile) -> Optional[str]:
     """Extract the most relevant country from item."""
     if profile.country and profile.country in item.countries:
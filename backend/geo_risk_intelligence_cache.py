@@ -3,20 +3,32 @@
 Provides simple in-memory caching to reduce database load for repeated queries.
 Cache is invalidated when new data is refreshed.
 """
+from collections import OrderedDict
+import threading
+import time
 from typing import Optional, Tuple, List
-from datetime import datetime, timedelta
 from functools import wraps
-import hashlib
-import json
 
 from .geo_risk_characterization import AssetProfile
 from .geo_risk_theme_mapper import ThemeRelevance
 from .geo_risk_intelligence import retrieve_intelligence, IntelligenceSignal, IntelligenceRetrievalResult
+from .scoring_settings_service import get_active_scoring_settings
 
 
-# Simple in-memory cache
-_cache: dict[str, Tuple[IntelligenceRetrievalResult, datetime]] = {}
-_cache_ttl = timedelta(minutes=10)  # Cache for 10 minutes
+# Canonical tuple of the query parameters that determine a retrieval result
+CacheKey = Tuple[
+    Optional[str], Optional[str], Optional[str], Optional[str], Tuple[str, ...], int, bool, float, bool
+]
+
+# Simple in-memory LRU cache, bounded so keys that are never repeated don't pile up
+# Entries hold a time.monotonic() timestamp, so TTL checks ignore wall-clock jumps
+_cache: "OrderedDict[CacheKey, Tuple[IntelligenceRetrievalResult, float]]" = OrderedDict()
+_CACHE_TTL_SECONDS = 600.0  # Cache for 10 minutes
+_cache_max_entries = 1024
+
+# Guards _cache and _key_locks; per-key locks serialize fetches for the same key
+_cache_lock = threading.Lock()
+_key_locks: dict[CacheKey, threading.Lock] = {}
 
 
 def _make_cache_key(
@@ -26,22 +38,23 @@ def _make_cache_key(
     use_semantic_filtering: bool,
     semantic_threshold: float,
     use_batch_validation: bool
-) -> str:
-    """Generate cache key from query parameters."""
-    # Create a hash of the relevant parameters
-    key_data = {
-        "country": profile.country,
-        "region": profile.region,
-        "sector": profile.sector,
-        "asset_type": profile.asset_type,
-        "themes": [t.theme for t in themes],
-        "days_lookback": days_lookback,
-        "use_semantic_filtering": use_semantic_filtering,
-        "semantic_threshold": semantic_threshold,
-        "use_batch_validation": use_batch_validation,
-    }
-    key_str = json.dumps(key_data, sort_keys=True)
-    return hashlib.md5(key_str.encode()).hexdigest()
+) -> CacheKey:
+    """Generate cache key from query parameters.
+
+    The tuple is used directly as the dict key, so no serialization or
+    digest is needed and distinct parameters can never collide.
+    """
+    return (
+        profile.country,
+        profile.region,
+        profile.sector,
+        profile.asset_type,
+        tuple(t.theme for t in themes),
+        days_lookback,
+        use_semantic_filtering,
+        semantic_threshold,
+        use_batch_validation,
+    )
 
 
 def retrieve_intelligence_cached(
@@ -71,7 +84,6 @@ def retrieve_intelligence_cached(
         List of intelligence signals
     """
     # Get defaults from settings if not provided
-    from .scoring_settings_service import get_active_scoring_settings
     settings = get_active_scoring_settings()
 
     if days_lookback is None:
@@ -97,38 +109,72 @@ def retrieve_intelligence_cached(
     )
 
     # Check cache
-    if cache_key in _cache:
-        cached_result, cached_time = _cache[cache_key]
+    cached = _get_cached(cache_key, max_signals)
+    if cached is not None:
+        return cached
+
+    # Cache miss or expired: only one caller per key fetches, the rest wait for it
+    with _cache_lock:
+        key_lock = _key_locks.setdefault(cache_key, threading.Lock())
+
+    try:
+        with key_lock:
+            # Another caller may have filled the cache while we waited
+            cached = _get_cached(cache_key, max_signals)
+            if cached is not None:
+                return cached
+
+            # Fetch fresh data
+            result = retrieve_intelligence(
+                profile, themes, days_lookback, max_signals,
+                use_semantic_filtering, semantic_threshold, use_batch_validation
+            )
+
+            # Store full result in cache, evicting the least recently used entries
+            with _cache_lock:
+                _cache[cache_key] = (result, time.monotonic())
+                _cache.move_to_end(cache_key)
+                while len(_cache) > _cache_max_entries:
+                    _cache.popitem(last=False)
+
+            return result
+    finally:
+        with _cache_lock:
+            if _key_locks.get(cache_key) is key_lock:
+                del _key_locks[cache_key]
+
+
+def _get_cached(
+    cache_key: CacheKey, max_signals: Optional[int]
+) -> Optional[IntelligenceRetrievalResult]:
+    """Return the cached result for a key if present and not expired.
+
+    The cached object itself is returned when no trimming is needed, so
+    callers must not mutate it.
+    """
+    with _cache_lock:
+        entry = _cache.get(cache_key)
+        if entry is None:
+            return None
+
+        cached_result, cached_time = entry
 
         # Check if cache is still valid
-        if datetime.now() - cached_time < _cache_ttl:
-            # Return cached results (limit signals to max_signals)
-            if isinstance(cached_result, IntelligenceRetrievalResult):
-                # Return full result with limited signals
-                return IntelligenceRetrievalResult(
-                    signals=cached_result.signals[:max_signals],
-                    web_searches=cached_result.web_searches,
-                )
-            else:
-                # Backward compatibility: old cache format (just signals)
-                return IntelligenceRetrievalResult(
-                    signals=cached_result[:max_signals] if isinstance(cached_result, list) else [],
-                    web_searches=[],
-                )
-        else:
+        if time.monotonic() - cached_time >= _CACHE_TTL_SECONDS:
             # Cache expired, remove it
             del _cache[cache_key]
+            return None
+        _cache.move_to_end(cache_key)
 
-    # Cache miss or expired, fetch fresh data
-    result = retrieve_intelligence(
-        profile, themes, days_lookback, max_signals,
-        use_semantic_filtering, semantic_threshold, use_batch_validation
-    )
+    # Return the cached result as-is when it already fits within max_signals
+    if max_signals is None or max_signals >= len(cached_result.signals):
+        return cached_result
 
-    # Store full result in cache
-    _cache[cache_key] = (result, datetime.now())
-
-    return result
+    # Otherwise return it with limited signals
+    return IntelligenceRetrievalResult(
+        signals=cached_result.signals[:max_signals],
+        web_searches=cached_result.web_searches,
+    )
 
 
 def invalidate_cache():
@@ -136,14 +182,22 @@ def invalidate_cache():
     
     Call this when new data is refreshed (e.g., after /refresh endpoint).
     """
-    global _cache
-    _cache.clear()
+    with _cache_lock:
+        _cache.clear()
 
 
-def get_cache_stats() -> dict:
-    """Get cache statistics."""
-    return {
-        "cache_size": len(_cache),
-        "cache_ttl_minutes": _cache_ttl.total_seconds() / 60,
-        "cached_keys": list(_cache.keys()),
-    }
+def get_cache_stats(include_keys: bool = False) -> dict:
+    """Get cache statistics.
+
+    Args:
+        include_keys: Also list every cached key (for debugging; O(cache size))
+    """
+    with _cache_lock:
+        stats = {
+            "cache_size": len(_cache),
+            "cache_max_entries": _cache_max_entries,
+            "cache_ttl_seconds": _CACHE_TTL_SECONDS,
+        }
+        if include_keys:
+            stats["cached_keys"] = list(_cache)
+        return stats
@@ -1,18 +1,65 @@
 """Main pipeline orchestrator - runs the complete GP risk analysis pipeline."""
-from dataclasses import dataclass
-from typing import Literal, List, Dict, Any, Generator
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Literal, List, Dict, Any, Generator, Sequence, Tuple
 import time
 from .schemas.geo_risk import Holding
-from .geo_risk_characterization import characterize_asset, AssetProfile, get_characterization_summary
+from .geo_risk_characterization import (
+    characterize_asset,
+    AssetProfile,
+    get_characterization_summary,
+    get_exposures,
+)
 from .geo_risk_theme_mapper import identify_relevant_themes, get_top_themes, ThemeRelevance
 from .geo_risk_intelligence import retrieve_intelligence, IntelligenceSignal, IntelligenceRetrievalResult
 from .geo_risk_intelligence_cache import retrieve_intelligence_cached
 from .geo_risk_impact import assess_impact, AggregateImpact
 from .geo_risk_probability import calculate_probabilities, ActionProbabilities, get_probability_summary
 from .scoring_settings_service import get_active_scoring_settings
+from .json_encoding import encode_json
 
 
-@dataclass
+# Fields sent to the frontend for each streamed theme, signal and theme impact
+_THEME_FIELDS: Tuple[str, ...] = ("theme", "relevance_score", "reasoning", "keywords_matched")
+_SIGNAL_FIELDS: Tuple[str, ...] = (
+    "source",
+    "title",
+    "summary",
+    "topic",
+    "relevance_score",
+    "theme_match",
+    "published_at",
+    "url",
+    "country",
+    "activity_level",
+    "base_relevance",
+    "theme_match_score",
+    "recency_score",
+    "source_quality",
+    "activity_level_score",
+)
+_THEME_IMPACT_FIELDS: Tuple[str, ...] = (
+    "theme",
+    "impact_direction",
+    "impact_magnitude",
+    "confidence",
+    "reasoning",
+    "signal_count",
+    "summary",
+)
+
+
+def _to_dicts(items: Sequence[Any], fields: Tuple[str, ...]) -> List[Dict[str, Any]]:
+    """Build one dict per item from the given attributes."""
+    if not items:
+        return []
+    if len(fields) == 1:
+        return [{fields[0]: getattr(item, fields[0])} for item in items]
+    get_values = attrgetter(*fields)
+    return [dict(zip(fields, get_values(item))) for item in items]
+
+
+@dataclass(slots=True)
 class PipelineResult:
     """Complete pipeline result with all intermediate steps."""
     # Step 1: Characterization
@@ -40,6 +87,24 @@ class PipelineResult:
     days_lookback: int
 
 
+def _retrieve_signals(
+    profile: AssetProfile,
+    themes: List[ThemeRelevance],
+    days_lookback: int,
+) -> Tuple[List[IntelligenceSignal], List[Dict[str, Any]]]:
+    """
+    Retrieve intelligence signals and web search metadata for the themes.
+
+    With no themes, impact assessment ignores every signal and the outcome is
+    the neutral default, so retrieval (database queries, web searches, Claude
+    calls) is skipped.
+    """
+    if not themes:
+        return [], []
+    intel_result = retrieve_intelligence_cached(profile, themes, days_lookback=days_lookback)
+    return intel_result.signals, intel_result.web_searches
+
+
 def run_pipeline(
     holding: Holding,
     risk_tolerance: Literal["Low", "Medium", "High"] = "Medium",
@@ -74,12 +139,10 @@ def run_pipeline(
     
     # Step 2: Theme Identification
     themes = identify_relevant_themes(profile)
-    top_themes = get_top_themes(profile, max_themes=5)
+    top_themes = get_top_themes(profile, max_themes=5, themes=themes)
     
     # Step 3: Intelligence Retrieval (with caching)
-    intel_result = retrieve_intelligence_cached(profile, themes, days_lookback=days_lookback)
-    signals = intel_result.signals
-    web_searches = intel_result.web_searches
+    signals, web_searches = _retrieve_signals(profile, themes, days_lookback)
     
     # Step 4: Impact Assessment
     impact = assess_impact(profile, themes, signals)
@@ -117,7 +180,7 @@ def run_pipeline_simple(
     return result.probabilities
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineStepUpdate:
     """Progress update for a single pipeline step."""
     step_id: str
@@ -126,6 +189,20 @@ class PipelineStepUpdate:
     duration_ms: int
     data: Any = None  # Step-specific data
     error: str | None = None
+    serialized: bytes | None = field(default=None, repr=False, compare=False)  # Cached JSON of this update
+
+    def to_json(self) -> bytes:
+        """Encode this update as UTF-8 JSON once and reuse it for every sender."""
+        if self.serialized is None:
+            self.serialized = encode_json({
+                "step_id": self.step_id,
+                "step_name": self.step_name,
+                "status": self.status,
+                "duration_ms": self.duration_ms,
+                "data": self.data,
+                "error": self.error,
+            })
+        return self.serialized
 
 
 def run_pipeline_streaming(
@@ -160,17 +237,7 @@ def run_pipeline_streaming(
         step_duration = int((time.time() - step_start) * 1000)
 
         # Build exposures list
-        exposures = []
-        if profile.is_government_exposed:
-            exposures.append("Government")
-        if profile.is_energy_exposed:
-            exposures.append("Energy")
-        if profile.is_financial_exposed:
-            exposures.append("Financial")
-        if profile.is_technology_exposed:
-            exposures.append("Technology")
-        if profile.is_infrastructure_exposed:
-            exposures.append("Infrastructure")
+        exposures = get_exposures(profile)
 
         yield PipelineStepUpdate(
             step_id="characterization",
@@ -197,7 +264,7 @@ def run_pipeline_streaming(
         # Step 2: Theme Identification
         step_start = time.time()
         themes = identify_relevant_themes(profile)
-        top_themes = get_top_themes(profile, max_themes=5)
+        top_themes = get_top_themes(profile, max_themes=5, themes=themes)
         step_duration = int((time.time() - step_start) * 1000)
 
         yield PipelineStepUpdate(
@@ -206,24 +273,14 @@ def run_pipeline_streaming(
             status="completed",
             duration_ms=step_duration,
             data={
-                "themes": [
-                    {
-                        "theme": t.theme,
-                        "relevance_score": t.relevance_score,
-                        "reasoning": t.reasoning,
-                        "keywords_matched": t.keywords_matched,
-                    }
-                    for t in themes
-                ],
+                "themes": _to_dicts(themes, _THEME_FIELDS),
                 "top_themes": top_themes,
             }
         )
 
         # Step 3: Intelligence Retrieval
         step_start = time.time()
-        intel_result = retrieve_intelligence_cached(profile, themes, days_lookback=days_lookback)
-        signals = intel_result.signals
-        web_searches = intel_result.web_searches
+        signals, web_searches = _retrieve_signals(profile, themes, days_lookback)
         step_duration = int((time.time() - step_start) * 1000)
 
         yield PipelineStepUpdate(
@@ -232,26 +289,7 @@ def run_pipeline_streaming(
             status="completed",
             duration_ms=step_duration,
             data={
-                "signals": [
-                    {
-                        "source": s.source,
-                        "title": s.title,
-                        "summary": s.summary,
-                        "topic": s.topic,
-                        "relevance_score": s.relevance_score,
-                        "theme_match": s.theme_match,
-                        "published_at": s.published_at,
-                        "url": s.url,
-                        "country": s.country,
-                        "activity_level": s.activity_level,
-                        "base_relevance": s.base_relevance,
-                        "theme_match_score": s.theme_match_score,
-                        "recency_score": s.recency_score,
-                        "source_quality": s.source_quality,
-                        "activity_level_score": s.activity_level_score,
-                    }
-                    for s in signals
-                ],
+                "signals": _to_dicts(signals, _SIGNAL_FIELDS),
                 "signal_count": len(signals),
                 "web_searches": web_searches,
             }
@@ -275,18 +313,7 @@ def run_pipeline_streaming(
                     "overall_magnitude": impact.overall_magnitude,
                     "confidence": impact.confidence,
                     "total_signals": impact.total_signals,
-                    "theme_impacts": [
-                        {
-                            "theme": ti.theme,
-                            "impact_direction": ti.impact_direction,
-                            "impact_magnitude": ti.impact_magnitude,
-                            "confidence": ti.confidence,
-                            "reasoning": ti.reasoning,
-                            "signal_count": ti.signal_count,
-                            "summary": ti.summary,
-                        }
-                        for ti in impact.theme_impacts
-                    ],
+                    "theme_impacts": _to_dicts(impact.theme_impacts, _THEME_IMPACT_FIELDS),
                 },
                 "probabilities": {
                     "negative": probabilities.sell,  # Map sell to negative
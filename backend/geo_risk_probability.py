@@ -1,11 +1,30 @@
 """Probability calculation - converts impact assessments to Sell/Hold/Buy probabilities."""
 from dataclasses import dataclass
-from typing import Literal
-from .geo_risk_impact import AggregateImpact, ThemeImpact
+from typing import Literal, Optional, Sequence, Tuple
+from .geo_risk_impact import AggregateImpact, ThemeImpact, DIRECTION_CODES
 from .geo_risk_characterization import AssetProfile
 
 
-@dataclass
+# (intercept, slope) on overall magnitude for (sell, hold, buy), per overall direction
+_BASE_PROBABILITY_LINES = {
+    "negative": ((0.4, 0.4), (0.4, -0.2), (0.2, -0.2)),
+    "positive": ((0.2, -0.1), (0.4, -0.2), (0.4, 0.3)),
+}
+_NEUTRAL_PROBABILITIES = (0.2, 0.6, 0.2)
+
+# Share of each theme's magnitude * confidence that shifts probabilities
+_THEME_WEIGHT = 0.3
+_NEGATIVE_CODE = DIRECTION_CODES["negative"]
+_POSITIVE_CODE = DIRECTION_CODES["positive"]
+
+# (sell, hold, buy) multipliers per risk tolerance when overall impact is negative
+_NEGATIVE_RISK_MULTIPLIERS = {
+    "Low": (1.3, 0.9, 0.7),
+    "High": (0.8, 1.1, 1.0),
+}
+
+
+@dataclass(slots=True)
 class ActionProbabilities:
     """Probability scores for Sell/Hold/Buy actions."""
     sell: float  # 0.0 to 1.0
@@ -13,17 +32,60 @@ class ActionProbabilities:
     buy: float  # 0.0 to 1.0
     
     def normalize(self):
-        """Ensure probabilities sum to 1.0."""
-        total = self.sell + self.hold + self.buy
-        if total > 0:
-            self.sell = self.sell / total
-            self.hold = self.hold / total
-            self.buy = self.buy / total
+        """Clamp probabilities to be non-negative and ensure they sum to 1.0."""
+        sell = max(0.0, self.sell)
+        hold = max(0.0, self.hold)
+        buy = max(0.0, self.buy)
+        total = sell + hold + buy
+        if abs(total - 1.0) < 1e-9:
+            # Already sums to 1.0 (e.g. the neutral default), no divides needed
+            self.sell, self.hold, self.buy = sell, hold, buy
+        elif total > 0:
+            self.sell, self.hold, self.buy = sell / total, hold / total, buy / total
         else:
             # Default to neutral if no signals
-            self.sell = 0.2
-            self.hold = 0.6
-            self.buy = 0.2
+            self.sell, self.hold, self.buy = _NEUTRAL_PROBABILITIES
+
+
+def _probability_core(
+    lines: Optional[Tuple[Tuple[float, float], ...]],
+    overall_magnitude: float,
+    magnitudes: Sequence[float],
+    confidences: Sequence[float],
+    directions: Sequence[int],
+    risk_multipliers: Optional[Tuple[float, float, float]],
+) -> Tuple[float, float, float]:
+    """Numeric core of calculate_probabilities; returns unclamped (sell, hold, buy)."""
+    # Base probabilities from overall impact direction: negative impact increases
+    # sell probability, positive increases buy, neutral defaults to hold
+    if lines is not None:
+        (sell_a, sell_b), (hold_a, hold_b), (buy_a, buy_b) = lines
+        sell = sell_a + overall_magnitude * sell_b
+        hold = hold_a + overall_magnitude * hold_b
+        buy = buy_a + overall_magnitude * buy_b
+    else:  # neutral
+        sell, hold, buy = _NEUTRAL_PROBABILITIES
+    
+    # Adjust based on theme-specific impacts in one pass: each theme's weight goes
+    # to its own side and is taken half from each of the other two
+    negative = 0.0
+    positive = 0.0
+    for magnitude, confidence, direction in zip(magnitudes, confidences, directions):
+        if direction == _NEGATIVE_CODE:
+            negative += magnitude * confidence * _THEME_WEIGHT
+        elif direction == _POSITIVE_CODE:
+            positive += magnitude * confidence * _THEME_WEIGHT
+    sell += negative - positive * 0.5
+    hold -= (negative + positive) * 0.5
+    buy += positive - negative * 0.5
+    
+    # Adjust for risk tolerance
+    if risk_multipliers is not None:
+        sell *= risk_multipliers[0]
+        hold *= risk_multipliers[1]
+        buy *= risk_multipliers[2]
+    
+    return sell, hold, buy
 
 
 def calculate_probabilities(
@@ -42,61 +104,24 @@ def calculate_probabilities(
     Returns:
         ActionProbabilities with normalized probabilities
     """
-    probs = ActionProbabilities(sell=0.0, hold=0.0, buy=0.0)
-    
-    # Base probabilities from overall impact direction
-    if impact.overall_direction == "negative":
-        # Negative impact increases sell probability
-        probs.sell = 0.4 + (impact.overall_magnitude * 0.4)
-        probs.hold = 0.4 - (impact.overall_magnitude * 0.2)
-        probs.buy = 0.2 - (impact.overall_magnitude * 0.2)
-        
-    elif impact.overall_direction == "positive":
-        # Positive impact increases buy probability
-        probs.sell = 0.2 - (impact.overall_magnitude * 0.1)
-        probs.hold = 0.4 - (impact.overall_magnitude * 0.2)
-        probs.buy = 0.4 + (impact.overall_magnitude * 0.3)
-        
-    else:  # neutral
-        # Neutral defaults to hold
-        probs.sell = 0.2
-        probs.hold = 0.6
-        probs.buy = 0.2
-    
-    # Adjust based on theme-specific impacts
-    for theme_impact in impact.theme_impacts:
-        if theme_impact.impact_direction == "negative":
-            weight = theme_impact.impact_magnitude * theme_impact.confidence * 0.3
-            probs.sell += weight
-            probs.hold -= weight * 0.5
-            probs.buy -= weight * 0.5
-            
-        elif theme_impact.impact_direction == "positive":
-            weight = theme_impact.impact_magnitude * theme_impact.confidence * 0.3
-            probs.buy += weight
-            probs.hold -= weight * 0.5
-            probs.sell -= weight * 0.5
-    
-    # Adjust for risk tolerance
-    if risk_tolerance == "Low":
-        # Low risk tolerance = more sensitive to negative signals
-        if impact.overall_direction == "negative":
-            probs.sell *= 1.3
-            probs.hold *= 0.9
-            probs.buy *= 0.7
-    elif risk_tolerance == "High":
-        # High risk tolerance = less sensitive to negative signals
-        if impact.overall_direction == "negative":
-            probs.sell *= 0.8
-            probs.hold *= 1.1
-            probs.buy *= 1.0
-    
-    # Ensure non-negative
-    probs.sell = max(0.0, probs.sell)
-    probs.hold = max(0.0, probs.hold)
-    probs.buy = max(0.0, probs.buy)
+    # Resolve the string enums to numeric tables once, then run the numeric core
+    # (Low risk tolerance is more sensitive to negative signals, High less)
+    risk_multipliers = (
+        _NEGATIVE_RISK_MULTIPLIERS.get(risk_tolerance)
+        if impact.overall_direction == "negative"
+        else None
+    )
+    sell, hold, buy = _probability_core(
+        _BASE_PROBABILITY_LINES.get(impact.overall_direction),
+        impact.overall_magnitude,
+        impact.magnitudes,
+        impact.confidences,
+        impact.directions,
+        risk_multipliers,
+    )
     
-    # Normalize to sum to 1.0
+    # Clamp to non-negative and normalize to sum to 1.0
+    probs = ActionProbabilities(sell=sell, hold=hold, buy=buy)
     probs.normalize()
     
     return probs
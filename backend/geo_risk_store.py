@@ -1,5 +1,11 @@
 """In-memory audit store for geopolitical risk scans."""
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from datetime import datetime, timezone
+import hashlib
+import heapq
+import itertools
+import time
+from typing import Dict, List, Optional, Tuple
 from .schemas.geo_risk import GeoRiskScanResult
 
 
@@ -7,42 +13,92 @@ class GeoRiskStore:
     """Simple in-memory store for scan results (MVP)."""
     
     def __init__(self, max_scans: int = 100):
-        self._scans: Dict[str, GeoRiskScanResult] = {}
+        # Scans are stored as they are created (a re-stored scan moves to the end),
+        # so insertion order is created_at order
+        self._scans: "OrderedDict[str, GeoRiskScanResult]" = OrderedDict()
+        # Secondary index: client_id -> scan IDs in insertion order
+        self._by_client: Dict[str, "OrderedDict[str, None]"] = {}
+        # created_at parsed once to an epoch float, so listings sort on floats
+        self._created_ts: Dict[str, float] = {}
+        # scan_id -> (JSON body, ETag), filled on first fetch; scans are not
+        # modified once stored, so the body stays valid until the scan is replaced
+        self._json: Dict[str, Tuple[bytes, str]] = {}
         self._max_scans = max_scans
     
     def store(self, result: GeoRiskScanResult) -> None:
         """Store a scan result."""
+        previous = self._scans.get(result.scan_id)
+        if previous is not None:
+            self._unindex(previous)
         self._scans[result.scan_id] = result
+        self._scans.move_to_end(result.scan_id)
+        self._created_ts[result.scan_id] = _created_timestamp(result.created_at)
+        self._by_client.setdefault(result.inputs.client_id, OrderedDict())[result.scan_id] = None
         
-        # Evict oldest if over limit
-        if len(self._scans) > self._max_scans:
-            # Sort by created_at and remove oldest
-            sorted_scans = sorted(
-                self._scans.items(),
-                key=lambda x: x[1].created_at,
-            )
-            oldest_id = sorted_scans[0][0]
-            del self._scans[oldest_id]
+        # Evict oldest (first inserted) if over limit
+        while len(self._scans) > self._max_scans:
+            _, evicted = self._scans.popitem(last=False)
+            self._unindex(evicted)
+    
+    def _unindex(self, result: GeoRiskScanResult) -> None:
+        """Remove a scan from the client and created_at indexes."""
+        self._created_ts.pop(result.scan_id, None)
+        self._json.pop(result.scan_id, None)
+        client_scans = self._by_client.get(result.inputs.client_id)
+        if client_scans is None:
+            return
+        client_scans.pop(result.scan_id, None)
+        if not client_scans:
+            del self._by_client[result.inputs.client_id]
     
     def get(self, scan_id: str) -> Optional[GeoRiskScanResult]:
         """Retrieve a scan by ID."""
         return self._scans.get(scan_id)
     
+    def get_json(self, scan_id: str) -> Optional[Tuple[bytes, str]]:
+        """Retrieve a scan's JSON body and ETag, serialized once per stored scan."""
+        cached = self._json.get(scan_id)
+        if cached is None:
+            result = self._scans.get(scan_id)
+            if result is None:
+                return None
+            body = result.model_dump_json(by_alias=True).encode()
+            cached = self._json[scan_id] = (body, f'"{hashlib.sha1(body).hexdigest()}"')
+        return cached
+    
     def list_by_client(self, client_id: str, limit: int = 10) -> List[GeoRiskScanResult]:
         """List scans for a specific client, newest first."""
-        matching = [
-            scan for scan in self._scans.values()
-            if scan.inputs.client_id == client_id
-        ]
-        # Sort by created_at descending
-        matching.sort(key=lambda x: x.created_at, reverse=True)
-        return matching[:limit]
+        # Only this client's scans are visited; partial sort keeps the newest `limit`
+        client_scans = self._by_client.get(client_id, ())
+        newest = heapq.nlargest(limit, client_scans, key=self._created_ts.__getitem__)
+        return [self._scans[scan_id] for scan_id in newest]
     
     def list_all(self, limit: int = 20) -> List[GeoRiskScanResult]:
         """List all scans, newest first."""
-        scans = list(self._scans.values())
-        scans.sort(key=lambda x: x.created_at, reverse=True)
-        return scans[:limit]
+        newest = heapq.nlargest(limit, self._scans, key=self._created_ts.__getitem__)
+        return [self._scans[scan_id] for scan_id in newest]
+
+
+def _created_timestamp(created_at: str) -> float:
+    """Convert an ISO8601 created_at to an epoch float (unparseable values sort oldest)."""
+    try:
+        return datetime.fromisoformat(created_at).timestamp()
+    except (TypeError, ValueError):
+        return float("-inf")
+
+
+# Per-process sequence that keeps IDs created in the same nanosecond apart
+_scan_seq = itertools.count()
+
+
+def new_scan_id(prefix: str, tag: str) -> str:
+    """Build a unique scan ID from a nanosecond timestamp and a sequence number."""
+    return f"{prefix}_{time.time_ns()}_{next(_scan_seq) & 0xFFFF:04x}_{tag}"
+
+
+def new_created_at() -> str:
+    """Current UTC time as an ISO8601 created_at, to the millisecond."""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
 
 
 # Global singleton instance
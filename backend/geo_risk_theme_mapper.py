@@ -1,8 +1,11 @@
 """Theme identification - maps asset characteristics to relevant geopolitical themes."""
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from operator import attrgetter
+from typing import Iterable, Iterator, List, Dict, FrozenSet, Optional, Tuple
+import heapq
+import time
 from .geo_risk_characterization import AssetProfile
-from .theme_store import load_themes_from_db, get_theme_weights_from_db
+from .theme_store import load_themes_from_db
 
 
 # Default geopolitical theme definitions (fallback if database is empty)
@@ -50,19 +53,117 @@ DEFAULT_GEOPOLITICAL_THEMES = {
 }
 
 
+# Themes that get the emerging market bonus
+EMERGING_MARKET_THEMES = frozenset({"currency_volatility", "political_instability", "trade_disruption"})
+
+# Themes with an exposure-flag bonus, and the share of exposure_bonus_weight they add
+EXPOSURE_BONUS_SCALES = {
+    "energy_security": 1.0,
+    "currency_volatility": 0.67,
+    "political_instability": 1.0,
+    "supply_chain_risk": 0.67,
+}
+
+# Theme definitions and their compiled form are cached briefly so theme edits
+# made through another process are picked up; see clear_theme_cache
+_THEME_CACHE_TTL_SECONDS = 30.0
+_theme_cache: Optional[Tuple[Dict[str, Dict], Tuple["CompiledTheme", ...], float]] = None
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledTheme:
+    """Theme definition with lookup sets and scoring weights resolved once."""
+    name: str
+    countries: FrozenSet[str]
+    regions: FrozenSet[str]
+    sectors: FrozenSet[str]
+    country_weight: float
+    region_weight: float
+    sector_weight: float
+    exposure_weight: float
+    emerging_bonus: float
+    min_threshold: float
+    # Upper bounds on the exposure and emerging market bonuses this theme can add
+    max_exposure_bonus: float
+    max_emerging_bonus: float
+
+
+def _compile_theme(theme_name: str, theme_def: Dict) -> CompiledTheme:
+    """Resolve a theme's lookup sets and weights (custom weights or defaults)."""
+    exposure_weight = theme_def.get("exposure_bonus_weight", 0.3)
+    emerging_bonus = theme_def.get("emerging_market_bonus", 0.1)
+    exposure_scale = EXPOSURE_BONUS_SCALES.get(theme_name)
+    return CompiledTheme(
+        name=theme_name,
+        countries=frozenset(theme_def.get("relevant_countries", [])),
+        regions=frozenset(theme_def.get("relevant_regions", [])),
+        sectors=frozenset(theme_def.get("relevant_sectors", [])),
+        country_weight=theme_def.get("country_match_weight", 0.4),
+        region_weight=theme_def.get("region_match_weight", 0.2),
+        sector_weight=theme_def.get("sector_match_weight", 0.3),
+        exposure_weight=exposure_weight,
+        emerging_bonus=emerging_bonus,
+        min_threshold=theme_def.get("min_relevance_threshold", 0.1),
+        max_exposure_bonus=(
+            max(0.0, exposure_weight * exposure_scale)
+            if exposure_scale is not None and exposure_weight is not None
+            else 0.0
+        ),
+        max_emerging_bonus=(
+            max(0.0, emerging_bonus)
+            if theme_name in EMERGING_MARKET_THEMES and emerging_bonus is not None
+            else 0.0
+        ),
+    )
+
+
+# The default themes never change, so they are compiled once at import
+_DEFAULT_COMPILED_THEMES: Tuple[CompiledTheme, ...] = tuple(
+    _compile_theme(name, theme_def) for name, theme_def in DEFAULT_GEOPOLITICAL_THEMES.items()
+)
+
+
+def _load_themes() -> Tuple[Dict[str, Dict], Tuple[CompiledTheme, ...]]:
+    """Get the theme definitions and their compiled form, loading them if stale."""
+    global _theme_cache
+    cached = _theme_cache
+    if cached is not None and time.monotonic() - cached[2] < _THEME_CACHE_TTL_SECONDS:
+        return cached[0], cached[1]
+    
+    themes = load_themes_from_db()
+    if themes:
+        compiled = tuple(_compile_theme(name, theme_def) for name, theme_def in themes.items())
+    else:
+        themes, compiled = DEFAULT_GEOPOLITICAL_THEMES, _DEFAULT_COMPILED_THEMES
+    _theme_cache = (themes, compiled, time.monotonic())
+    return themes, compiled
+
+
+def clear_theme_cache():
+    """Clear the theme cache (call after creating, updating or deleting themes)."""
+    global _theme_cache
+    _theme_cache = None
+
+
 def get_geopolitical_themes() -> Dict[str, Dict]:
     """
     Get geopolitical themes from database, with fallback to defaults.
     
     Returns a dictionary of theme definitions.
     """
-    db_themes = load_themes_from_db()
-    if db_themes:
-        return db_themes
-    return DEFAULT_GEOPOLITICAL_THEMES
+    return _load_themes()[0]
 
 
-@dataclass
+# What matched between an asset and a theme, recorded as bit flags while
+# scoring and turned into readable reasoning only for themes that qualify
+_MATCH_COUNTRY = 1
+_MATCH_REGION = 2
+_MATCH_SECTOR = 4
+_MATCH_EXPOSURE = 8
+_MATCH_EMERGING = 16
+
+
+@dataclass(frozen=True, slots=True)
 class ThemeRelevance:
     """Theme with relevance score for an asset."""
     theme: str
@@ -80,90 +181,98 @@ def identify_relevant_themes(profile: AssetProfile) -> List[ThemeRelevance]:
     
     Returns themes sorted by relevance (highest first).
     """
-    relevant_themes: List[ThemeRelevance] = []
-    themes = get_geopolitical_themes()
+    _, compiled_themes = _load_themes()
+    return rank_themes(_score_themes(profile, compiled_themes))
+
+
+_relevance_score = attrgetter("relevance_score")
+
+
+def rank_themes(themes: Iterable[ThemeRelevance], top_k: Optional[int] = None) -> List[ThemeRelevance]:
+    """
+    Order themes by relevance (highest first), keeping only the top_k if given.
     
-    for theme_name, theme_def in themes.items():
-        # Get custom weights for this theme (or use defaults)
-        weights = get_theme_weights_from_db(theme_name)
-        country_weight = weights["country_match_weight"] if weights else theme_def.get("country_match_weight", 0.4)
-        region_weight = weights["region_match_weight"] if weights else theme_def.get("region_match_weight", 0.2)
-        sector_weight = weights["sector_match_weight"] if weights else theme_def.get("sector_match_weight", 0.3)
-        exposure_weight = weights["exposure_bonus_weight"] if weights else theme_def.get("exposure_bonus_weight", 0.3)
-        emerging_bonus = weights["emerging_market_bonus"] if weights else theme_def.get("emerging_market_bonus", 0.1)
-        min_threshold = weights["min_relevance_threshold"] if weights else theme_def.get("min_relevance_threshold", 0.1)
-        
+    Ties keep their input order, as with a stable sort.
+    """
+    if top_k is None:
+        return sorted(themes, key=_relevance_score, reverse=True)
+    return heapq.nlargest(top_k, themes, key=_relevance_score)
+
+
+def _score_themes(
+    profile: AssetProfile,
+    compiled_themes: Tuple[CompiledTheme, ...],
+) -> Iterator[ThemeRelevance]:
+    """Score the compiled themes for one asset, yielding those over their threshold."""
+    for theme in compiled_themes:
+        theme_name = theme.name
         score = 0.0
-        reasoning_parts = []
+        matches = 0
         matched_keywords = []
         
         # Check country match
         if profile.country:
-            if profile.country in theme_def.get("relevant_countries", []):
-                score += country_weight
-                reasoning_parts.append(f"Country {profile.country} is directly relevant")
+            if profile.country in theme.countries:
+                score += theme.country_weight
+                matches |= _MATCH_COUNTRY
         
         # Check region match
-        if profile.region in theme_def.get("relevant_regions", []):
-            score += region_weight
-            reasoning_parts.append(f"Region {profile.region} is relevant")
+        if profile.region in theme.regions:
+            score += theme.region_weight
+            matches |= _MATCH_REGION
         
         # Check sector match
-        if profile.sector in theme_def.get("relevant_sectors", []):
-            score += sector_weight
-            reasoning_parts.append(f"Sector {profile.sector} is exposed")
+        if profile.sector in theme.sectors:
+            score += theme.sector_weight
+            matches |= _MATCH_SECTOR
+        
+        # Skip the remaining checks when even the largest possible bonuses
+        # cannot lift the score to the threshold
+        if score + theme.max_exposure_bonus + theme.max_emerging_bonus < theme.min_threshold:
+            continue
         
         # Check exposure flags (using customizable weight)
         if theme_name == "energy_security" and profile.is_energy_exposed:
-            score += exposure_weight
-            reasoning_parts.append("Energy sector exposure")
+            score += theme.exposure_weight
+            matches |= _MATCH_EXPOSURE
         
         if theme_name == "currency_volatility" and profile.is_financial_exposed:
-            score += exposure_weight * 0.67  # Scale down for financial exposure
-            reasoning_parts.append("Financial sector exposure")
+            score += theme.exposure_weight * 0.67  # Scale down for financial exposure
+            matches |= _MATCH_EXPOSURE
         
         if theme_name == "political_instability" and profile.is_government_exposed:
-            score += exposure_weight
-            reasoning_parts.append("Government exposure")
+            score += theme.exposure_weight
+            matches |= _MATCH_EXPOSURE
         
         if theme_name == "supply_chain_risk" and profile.is_technology_exposed:
-            score += exposure_weight * 0.67  # Scale down for tech exposure
-            reasoning_parts.append("Technology sector exposure")
+            score += theme.exposure_weight * 0.67  # Scale down for tech exposure
+            matches |= _MATCH_EXPOSURE
         
         # Emerging market bonus for certain themes
         if profile.is_emerging_market:
-            if theme_name in ["currency_volatility", "political_instability", "trade_disruption"]:
-                score += emerging_bonus
-                reasoning_parts.append("Emerging market context")
+            if theme_name in EMERGING_MARKET_THEMES:
+                score += theme.emerging_bonus
+                matches |= _MATCH_EMERGING
         
         # Normalize score to 0-1 range
         score = min(1.0, score)
         
         # Use customizable threshold
-        if score >= min_threshold:
+        if score >= theme.min_threshold:
             # Create more readable reasoning
-            readable_reasoning = _create_readable_reasoning(
-                reasoning_parts, profile, theme_name
-            )
+            readable_reasoning = _create_readable_reasoning(matches, profile, theme_name)
             
-            relevant_themes.append(
-                ThemeRelevance(
-                    theme=theme_name,
-                    relevance_score=score,
-                    reasoning=readable_reasoning,
-                    keywords_matched=matched_keywords,
-                )
+            yield ThemeRelevance(
+                theme=theme_name,
+                relevance_score=score,
+                reasoning=readable_reasoning,
+                keywords_matched=matched_keywords,
             )
-    
-    # Sort by relevance score (highest first)
-    relevant_themes.sort(key=lambda x: x.relevance_score, reverse=True)
-    
-    return relevant_themes
 
 
-def _create_readable_reasoning(reasoning_parts: List[str], profile: AssetProfile, theme_name: str) -> str:
-    """Create human-readable reasoning from technical parts."""
-    if not reasoning_parts:
+def _create_readable_reasoning(matches: int, profile: AssetProfile, theme_name: str) -> str:
+    """Create human-readable reasoning from the _MATCH_* flags set while scoring."""
+    if not matches:
         return "General relevance to this asset"
     
     # Format theme name
@@ -183,11 +292,11 @@ def _create_readable_reasoning(reasoning_parts: List[str], profile: AssetProfile
         sentences.append(f"operating in the {profile.sector} sector")
     
     # Theme-specific context
-    if "Country" in " ".join(reasoning_parts):
+    if matches & _MATCH_COUNTRY:
         sentences.append(f"which makes it particularly vulnerable to {theme_display}")
-    elif "Sector" in " ".join(reasoning_parts):
+    elif matches & _MATCH_SECTOR:
         sentences.append(f"which is directly impacted by {theme_display}")
-    elif "Emerging market" in " ".join(reasoning_parts):
+    elif matches & _MATCH_EMERGING:
         sentences.append(f"with emerging market exposure increasing {theme_display} risk")
     else:
         sentences.append(f"relevant to {theme_display} considerations")
@@ -202,11 +311,20 @@ def _create_readable_reasoning(reasoning_parts: List[str], profile: AssetProfile
         return sentences[0] + ". " + " ".join(sentences[1:]) + "."
 
 
-def get_top_themes(profile: AssetProfile, max_themes: int = 5) -> List[str]:
+def get_top_themes(
+    profile: AssetProfile,
+    max_themes: int = 5,
+    themes: Optional[List[ThemeRelevance]] = None,
+) -> List[str]:
     """
     Get the top N most relevant themes for an asset.
     
+    Pass the result of identify_relevant_themes as `themes` to reuse it
+    instead of identifying the themes again.
+    
     Returns just the theme names.
     """
-    themes = identify_relevant_themes(profile)
+    if themes is None:
+        _, compiled_themes = _load_themes()
+        themes = rank_themes(_score_themes(profile, compiled_themes), top_k=max_themes)
     return [t.theme for t in themes[:max_themes]]
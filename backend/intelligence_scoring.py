@@ -9,8 +9,11 @@ This module provides scoring functions for intelligence signals based on:
 All scoring parameters are loaded from database settings with fallback to defaults.
 """
 import math
+import re
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
 from .scoring_settings_service import get_active_scoring_settings
 
 
@@ -42,34 +45,112 @@ DEFAULT_ACTIVITY_LEVEL_SCORES: Dict[str, float] = {
     "default": 0.3,
 }
 
+# Upper bound on memoized source name -> quality score lookups per config
+MAX_RESOLVED_SOURCES = 4096
 
-def _get_source_quality_scores() -> Dict[str, float]:
-    """Get source quality scores from database or defaults."""
+
+@dataclass(frozen=True, slots=True)
+class ScoringConfig:
+    """Scoring parameters resolved once from database settings or defaults."""
+    # (base_relevance, theme_match, recency, source_quality, activity_level)
+    weight_vector: Tuple[float, float, float, float, float]
+    # First four weights rescaled to sum to 1.0, for signals without an activity level
+    redistributed_weights: Tuple[float, float, float, float]
+    recency_decay_constant: float
+    source_quality_scores: Dict[str, float]
+    activity_level_scores: Dict[str, float]
+    # Source names lowercased once: (name, score) in settings order, and the
+    # first score for each lowercased name
+    source_quality_lower: Tuple[Tuple[str, float], ...] = ()
+    source_quality_by_lower: Dict[str, float] = field(default_factory=dict)
+    # Memoized get_source_quality_score results for this config
+    source_quality_resolved: Dict[str, float] = field(default_factory=dict)
+
+
+# (settings dict the config was built from, config); rebuilt when the
+# settings service hands out a different settings object
+_config_cache: Optional[Tuple[Optional[Dict], ScoringConfig]] = None
+
+
+def get_scoring_config() -> ScoringConfig:
+    """
+    Get the scoring parameters for the active settings.
+
+    Batch callers resolve this once and pass it to the scoring functions,
+    instead of each function reading the settings again.
+    """
+    global _config_cache
     settings = get_active_scoring_settings()
+    cached = _config_cache
+    if cached is not None and cached[0] is settings:
+        return cached[1]
+
+    weights = _get_score_weights(settings)
+    weight_vector = (
+        weights["base_relevance"],
+        weights["theme_match"],
+        weights["recency"],
+        weights["source_quality"],
+        weights["activity_level"],
+    )
+    total_other_weights = sum(weight_vector[:4])
+    scale_factor = 1.0 / total_other_weights if total_other_weights else 0.0
+    source_scores = _get_source_quality_scores(settings)
+    source_lower = tuple((name.lower(), score) for name, score in source_scores.items())
+    source_by_lower: Dict[str, float] = {}
+    for name_lower, score in source_lower:
+        source_by_lower.setdefault(name_lower, score)
+    config = ScoringConfig(
+        weight_vector=weight_vector,
+        redistributed_weights=tuple(weight * scale_factor for weight in weight_vector[:4]),
+        recency_decay_constant=settings.get("recency_decay_constant", 30.0) if settings else 30.0,
+        source_quality_scores=source_scores,
+        activity_level_scores=_get_activity_level_scores(settings),
+        source_quality_lower=source_lower,
+        source_quality_by_lower=source_by_lower,
+    )
+    _config_cache = (settings, config)
+    return config
+
+
+def _get_source_quality_scores(settings: Optional[Dict]) -> Dict[str, float]:
+    """Get source quality scores from database or defaults."""
     if settings and settings.get("source_quality_scores"):
         return settings["source_quality_scores"]
     return DEFAULT_SOURCE_QUALITY_SCORES
 
 
-def _get_activity_level_scores() -> Dict[str, float]:
+def _get_activity_level_scores(settings: Optional[Dict]) -> Dict[str, float]:
     """Get activity level scores from database or defaults."""
-    settings = get_active_scoring_settings()
     if settings and settings.get("activity_level_scores"):
         return settings["activity_level_scores"]
     return DEFAULT_ACTIVITY_LEVEL_SCORES
 
 
-def get_source_quality_score(source_name: str) -> float:
+def get_source_quality_score(source_name: str, config: Optional[ScoringConfig] = None) -> float:
     """
     Get quality score for a source (from database settings or defaults).
     
     Args:
         source_name: Name of the source
+        config: Resolved scoring parameters (read from settings if None)
     
     Returns:
         Quality score (0.0 to 1.0)
     """
-    source_scores = _get_source_quality_scores()
+    config = config or get_scoring_config()
+    resolved = config.source_quality_resolved
+    score = resolved.get(source_name)
+    if score is None:
+        score = _match_source_quality(source_name, config)
+        if len(resolved) < MAX_RESOLVED_SOURCES:
+            resolved[source_name] = score
+    return score
+
+
+def _match_source_quality(source_name: str, config: ScoringConfig) -> float:
+    """Match a source name against the configured source quality scores."""
+    source_scores = config.source_quality_scores
     
     # Try exact match first
     if source_name in source_scores:
@@ -77,34 +158,39 @@ def get_source_quality_score(source_name: str) -> float:
     
     # Try case-insensitive match
     source_lower = source_name.lower()
-    for name, score in source_scores.items():
-        if name.lower() == source_lower:
-            return score
+    score = config.source_quality_by_lower.get(source_lower)
+    if score is not None:
+        return score
     
     # Check if source name contains a known source
-    for name, score in source_scores.items():
-        if name.lower() in source_lower or source_lower in name.lower():
+    for name_lower, score in config.source_quality_lower:
+        if name_lower in source_lower or source_lower in name_lower:
             return score
     
     # Default score for unknown sources
     return source_scores.get("default", 0.7)
 
 
-def get_activity_level_score(activity_level: str) -> float:
+def get_activity_level_score(activity_level: str, config: Optional[ScoringConfig] = None) -> float:
     """
     Get score for country activity level (from database settings or defaults).
     
     Args:
         activity_level: Activity level string (Critical/High/Medium/Low)
+        config: Resolved scoring parameters (read from settings if None)
     
     Returns:
         Activity score (0.0 to 1.0)
     """
-    activity_scores = _get_activity_level_scores()
+    activity_scores = (config or get_scoring_config()).activity_level_scores
     return activity_scores.get(activity_level, activity_scores.get("default", 0.3))
 
 
-def calculate_recency_score(published_at: datetime | str, days_lookback: int = 90) -> float:
+def calculate_recency_score(
+    published_at: datetime | str,
+    days_lookback: int = 90,
+    config: Optional[ScoringConfig] = None,
+) -> float:
     """
     Calculate recency score with exponential decay (using database settings or defaults).
     
@@ -117,6 +203,7 @@ def calculate_recency_score(published_at: datetime | str, days_lookback: int = 9
     Args:
         published_at: Publication date (datetime or ISO string)
         days_lookback: Maximum days to look back (default 90)
+        config: Resolved scoring parameters (read from settings if None)
     
     Returns:
         Recency score (0.0 to 1.0)
@@ -140,8 +227,7 @@ def calculate_recency_score(published_at: datetime | str, days_lookback: int = 9
         return 0.0
     
     # Get decay constant from settings or use default
-    settings = get_active_scoring_settings()
-    decay_constant = settings.get("recency_decay_constant", 30.0) if settings else 30.0
+    decay_constant = (config or get_scoring_config()).recency_decay_constant
     
     # Exponential decay: e^(-days_ago / decay_constant)
     recency_score = math.exp(-days_ago / decay_constant)
@@ -149,32 +235,136 @@ def calculate_recency_score(published_at: datetime | str, days_lookback: int = 9
     return max(0.0, min(1.0, recency_score))
 
 
+def calculate_recency_scores(
+    published: Sequence[datetime | str],
+    days_lookback: int = 90,
+    config: Optional[ScoringConfig] = None,
+) -> List[float]:
+    """
+    Calculate recency scores for a batch of publication dates.
+
+    Same decay as calculate_recency_score, but the decay constant and the
+    current time are read once for the whole batch, and the decay is computed
+    once per distinct whole-day age (at most days_lookback + 1 values).
+
+    Args:
+        published: Publication dates (datetime or ISO string)
+        days_lookback: Maximum days to look back (default 90)
+        config: Resolved scoring parameters (read from settings if None)
+
+    Returns:
+        Recency scores (0.0 to 1.0), one per date
+    """
+    decay_constant = (config or get_scoring_config()).recency_decay_constant
+    now = datetime.now()
+
+    decay_by_days: Dict[int, float] = {}
+    scores: List[float] = []
+    for published_at in published:
+        pub_date = _parse_date(published_at) if isinstance(published_at, str) else published_at
+        if not pub_date:
+            scores.append(0.0)
+            continue
+        days_ago = (now - pub_date).days
+        if days_ago > days_lookback:
+            scores.append(0.0)
+            continue
+        score = decay_by_days.get(days_ago)
+        if score is None:
+            score = decay_by_days[days_ago] = max(0.0, min(1.0, math.exp(-days_ago / decay_constant)))
+        scores.append(score)
+    return scores
+
+
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+)
+
+# The ISO 8601 shapes among _DATE_FORMATS, which datetime.fromisoformat parses
+# to the same naive datetime (a trailing Z is only accepted after a T time)
+_ISO_DATE_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2}:\d{2}(?:\.\d{1,6})?Z?| \d{2}:\d{2}:\d{2})?"
+)
+
+# Slash dates (dd/mm/yyyy or mm/dd/yyyy), built directly instead of via strptime
+_SLASH_DATE_RE = re.compile(r"([0-9]{1,2})/([0-9]{1,2})/([0-9]{4})")
+
+# Which reading of an ambiguous slash date is tried first ("dmy" or "mdy");
+# the other is the fallback when the first is not a valid date
+SLASH_DATE_ORDER = "dmy"
+
+
 def _parse_date(date_str: str) -> datetime | None:
     """Parse various date formats."""
-    formats = [
-        "%Y-%m-%d",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%Y-%m-%d %H:%M:%S",
-        "%d/%m/%Y",
-        "%m/%d/%Y",
-        "%Y-%m-%dT%H:%M:%S.%f",
-        "%Y-%m-%dT%H:%M:%S.%fZ",
-    ]
-    for fmt in formats:
+    if not isinstance(date_str, str):
+        return None
+    return _parse_date_str(date_str)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_str(date_str: str) -> datetime | None:
+    """Parse a date string; memoized since feed items share published_at values."""
+    if _ISO_DATE_RE.fullmatch(date_str):
+        try:
+            return datetime.fromisoformat(date_str.removesuffix("Z"))
+        except ValueError:
+            pass
+    slash_match = _SLASH_DATE_RE.fullmatch(date_str)
+    if slash_match:
+        return _parse_slash_date(*map(int, slash_match.groups()))
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
-        except (ValueError, TypeError):
+        except ValueError:
+            continue
+    return None
+
+
+def _parse_slash_date(first: int, second: int, year: int) -> datetime | None:
+    """Build a slash date, trying the SLASH_DATE_ORDER reading first."""
+    if SLASH_DATE_ORDER == "mdy":
+        readings = ((first, second), (second, first))
+    else:
+        readings = ((second, first), (first, second))
+    for month, day in readings:
+        try:
+            return datetime(year, month, day)
+        except ValueError:
             continue
     return None
 
 
+def _get_score_weights(settings: Optional[Dict]) -> Dict[str, float]:
+    """Get final score weights from database settings or defaults."""
+    if settings:
+        return {
+            "base_relevance": settings.get("weight_base_relevance", 0.3),
+            "theme_match": settings.get("weight_theme_match", 0.25),
+            "recency": settings.get("weight_recency", 0.2),
+            "source_quality": settings.get("weight_source_quality", 0.15),
+            "activity_level": settings.get("weight_activity_level", 0.1),
+        }
+    return {
+        "base_relevance": 0.3,
+        "theme_match": 0.25,
+        "recency": 0.2,
+        "source_quality": 0.15,
+        "activity_level": 0.1,
+    }
+
+
 def calculate_final_score(
     base_relevance: float,
     theme_match: float,
     recency_score: float,
     source_quality: float = 0.7,
     activity_level: float = 0.0,
+    config: Optional[ScoringConfig] = None,
 ) -> float:
     """
     Calculate final weighted score for an intelligence signal (using database settings or defaults).
@@ -185,54 +375,60 @@ def calculate_final_score(
         recency_score: Recency score from calculate_recency_score (0.0 to 1.0)
         source_quality: Source quality score (0.0 to 1.0), default 0.7
         activity_level: Activity level score (0.0 to 1.0), default 0.0 (only for snapshots)
+        config: Resolved scoring parameters (read from settings if None)
     
     Returns:
         Final weighted score (0.0 to 1.0)
     """
     # Get weights from database settings or use defaults
-    settings = get_active_scoring_settings()
-    if settings:
-        weights = {
-            "base_relevance": settings.get("weight_base_relevance", 0.3),
-            "theme_match": settings.get("weight_theme_match", 0.25),
-            "recency": settings.get("weight_recency", 0.2),
-            "source_quality": settings.get("weight_source_quality", 0.15),
-            "activity_level": settings.get("weight_activity_level", 0.1),
-        }
-    else:
-        weights = {
-            "base_relevance": 0.3,
-            "theme_match": 0.25,
-            "recency": 0.2,
-            "source_quality": 0.15,
-            "activity_level": 0.1,
-        }
+    config = config or get_scoring_config()
+    w_base, w_theme, w_recency, w_source, w_activity = config.weight_vector
     
-    # If no activity level (global items), redistribute weight to other factors
+    # If no activity level (global items), use the weights with the
+    # activity_level weight redistributed proportionally to the other factors
     if activity_level == 0.0:
-        # Redistribute activity_level weight proportionally
-        total_other_weights = sum([
-            weights["base_relevance"],
-            weights["theme_match"],
-            weights["recency"],
-            weights["source_quality"],
-        ])
-        scale_factor = 1.0 / total_other_weights
-        adjusted_weights = {
-            "base_relevance": weights["base_relevance"] * scale_factor,
-            "theme_match": weights["theme_match"] * scale_factor,
-            "recency": weights["recency"] * scale_factor,
-            "source_quality": weights["source_quality"] * scale_factor,
-        }
-    else:
-        adjusted_weights = weights
+        w_base, w_theme, w_recency, w_source = config.redistributed_weights
     
     final_score = (
-        base_relevance * adjusted_weights.get("base_relevance", weights["base_relevance"]) +
-        theme_match * adjusted_weights.get("theme_match", weights["theme_match"]) +
-        recency_score * adjusted_weights.get("recency", weights["recency"]) +
-        source_quality * adjusted_weights.get("source_quality", weights["source_quality"]) +
-        activity_level * weights["activity_level"]
+        base_relevance * w_base +
+        theme_match * w_theme +
+        recency_score * w_recency +
+        source_quality * w_source +
+        activity_level * w_activity
     )
     
     return max(0.0, min(1.0, final_score))
+
+
+def calculate_final_scores(
+    base_relevance: Sequence[float],
+    theme_match: Sequence[float],
+    recency_score: Sequence[float],
+    source_quality: Sequence[float],
+    activity_level: Sequence[float],
+    config: Optional[ScoringConfig] = None,
+) -> List[float]:
+    """
+    Calculate final weighted scores for a batch of signals.
+
+    Column-wise equivalent of calculate_final_score: the resolved weights are
+    unpacked once, then combined with each row of the input columns.
+
+    Returns:
+        Final weighted scores (0.0 to 1.0), one per row
+    """
+    config = config or get_scoring_config()
+    w_base, w_theme, w_recency, w_source, w_activity = config.weight_vector
+    # Redistributed weights for rows without an activity level
+    scaled = config.redistributed_weights
+
+    scores: List[float] = []
+    for base, theme, recency, source, activity in zip(
+        base_relevance, theme_match, recency_score, source_quality, activity_level
+    ):
+        wb, wt, wr, ws = scaled if activity == 0.0 else (w_base, w_theme, w_recency, w_source)
+        final_score = (
+            base * wb + theme * wt + recency * wr + source * ws + activity * w_activity
+        )
+        scores.append(max(0.0, min(1.0, final_score)))
+    return scores
@@ -0,0 +1,17 @@
+"""JSON encoding shared by the pipeline stream and the geo-risk routes."""
+import json
+from typing import Any
+
+# orjson encodes straight to bytes (optional, falls back to json.dumps)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def encode_json(value: Any) -> bytes:
+    """Encode a value as UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
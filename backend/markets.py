@@ -1,12 +1,23 @@
 import os
+import random
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import List
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
 
 import httpx
 
 from .models import MarketItem
 
+# orjson decodes response bytes directly (optional, falls back to response.json())
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 FRED_BASE_URL = "https://api.stlouisfed.org/fred/series/observations"
 STOOQ_BASE_URL = "https://stooq.com/q/d/l/"
 COINGECKO_URL = (
@@ -14,15 +25,42 @@ COINGECKO_URL = (
     "?ids=bitcoin&vs_currencies=usd&include_24hr_change=true"
 )
 
+# Days of Stooq history requested; enough to span weekends and holidays
+STOOQ_WINDOW_DAYS = 14
+
+# How long fetched quotes are reused before asking the source again. Stooq and
+# CoinGecko quote intraday; FRED series are daily observations
+STOOQ_CACHE_TTL_SECONDS = 900.0
+FRED_CACHE_TTL_SECONDS = 3600.0
+COINGECKO_CACHE_TTL_SECONDS = 900.0
+
+# (source, id) -> (fetched value, time.monotonic() when fetched)
+_fetch_cache: Dict[Tuple[str, str], Tuple[Any, float]] = {}
+
+# All market requests are I/O bound, so they run concurrently over one pooled
+# client; one worker per pooled connection so no fetch waits on the pool
+MAX_FETCH_WORKERS = 10
+FETCH_LIMITS = httpx.Limits(max_connections=MAX_FETCH_WORKERS)
+
+# Short connect and read timeouts so one unresponsive source cannot hold up the batch
+FETCH_TIMEOUT = httpx.Timeout(8.0, connect=2.0)
+
+# Transient failures (connection errors, timeouts, 429 and 5xx responses) are
+# retried once after a random delay of up to FETCH_RETRY_MAX_JITTER_SECONDS
+FETCH_ATTEMPTS = 2
+FETCH_RETRY_MAX_JITTER_SECONDS = 0.2
+
+T = TypeVar("T")
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StooqSymbol:
     symbol: str
     name: str
     category: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FredSeries:
     series_id: str
     name: str
@@ -53,28 +91,35 @@ def _now_label() -> str:
     return datetime.now(timezone.utc).strftime("Updated %Y-%m-%d %H:%M UTC")
 
 
-def _fetch_stooq_series(symbol: str) -> List[float]:
+def _fetch_stooq_series(client: httpx.Client, symbol: str) -> List[float]:
+    """Return the latest two daily closes for a symbol, newest first."""
     url = STOOQ_BASE_URL
-    params = {"s": symbol, "i": "d"}
-    response = httpx.get(url, params=params, timeout=20)
-    response.raise_for_status()
-    lines = response.text.strip().splitlines()
-    if len(lines) < 2:
-        return []
-    values = []
-    for line in lines[1:]:
-        parts = line.split(",")
-        if len(parts) < 5:
-            continue
-        try:
-            close = float(parts[4])
-        except ValueError:
-            continue
-        values.append(close)
-    return values
+    today = datetime.now(timezone.utc).date()
+    params = {
+        "s": symbol,
+        "i": "d",
+        "d1": (today - timedelta(days=STOOQ_WINDOW_DAYS)).strftime("%Y%m%d"),
+        "d2": today.strftime("%Y%m%d"),
+    }
+    # Rows are oldest first, so only the last two valid closes are kept
+    closes: deque[float] = deque(maxlen=2)
+    with client.stream("GET", url, params=params) as response:
+        response.raise_for_status()
+        lines = response.iter_lines()
+        next(lines, None)  # header
+        for line in lines:
+            parts = line.split(",")
+            if len(parts) < 5:
+                continue
+            try:
+                close = float(parts[4])
+            except ValueError:
+                continue
+            closes.append(close)
+    return list(reversed(closes))
 
 
-def _fetch_fred_series(series_id: str, api_key: str) -> List[float]:
+def _fetch_fred_series(client: httpx.Client, series_id: str, api_key: str) -> List[float]:
     params = {
         "series_id": series_id,
         "api_key": api_key,
@@ -82,9 +127,9 @@ def _fetch_fred_series(series_id: str, api_key: str) -> List[float]:
         "sort_order": "desc",
         "limit": 10,
     }
-    response = httpx.get(FRED_BASE_URL, params=params, timeout=20)
+    response = client.get(FRED_BASE_URL, params=params)
     response.raise_for_status()
-    data = response.json()
+    data = _json(response)
     observations = data.get("observations", [])
     values = []
     for obs in observations:
@@ -100,6 +145,58 @@ def _fetch_fred_series(series_id: str, api_key: str) -> List[float]:
     return values
 
 
+def _fetch_bitcoin(client: httpx.Client) -> dict[str, Any]:
+    response = client.get(COINGECKO_URL)
+    response.raise_for_status()
+    return _json(response).get("bitcoin", {})
+
+
+def _json(response: httpx.Response) -> Any:
+    """Decode a JSON response body."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Whether a failed request is worth retrying."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+def _fetch_with_retry(fetch: Callable[..., T], *args: Any) -> T:
+    """Run one fetch, retrying transient failures with random jitter."""
+    for _ in range(FETCH_ATTEMPTS - 1):
+        try:
+            return fetch(*args)
+        except Exception as exc:
+            if not _is_transient(exc):
+                raise
+        time.sleep(random.uniform(0, FETCH_RETRY_MAX_JITTER_SECONDS))
+    return fetch(*args)
+
+
+def _cached_fetch(key: Tuple[str, str], ttl_seconds: float, fetch: Callable[..., T], *args: Any) -> T:
+    """Return a recent result for key, or fetch it; empty results are not cached."""
+    cached = _fetch_cache.get(key)
+    if cached is not None and time.monotonic() - cached[1] < ttl_seconds:
+        return cached[0]
+    value = _fetch_with_retry(fetch, *args)
+    if value:
+        _fetch_cache[key] = (value, time.monotonic())
+    return value
+
+
+def _fetch_or_none(fetch: Callable[..., T], *args: Any) -> T | None:
+    """Run one fetch; a failed source is skipped rather than failing the batch."""
+    try:
+        return fetch(*args)
+    except Exception:
+        return None
+
+
 def _build_change(values: List[float]) -> tuple[float | None, float | None]:
     if len(values) < 2:
         return None, None
@@ -112,12 +209,34 @@ def _build_change(values: List[float]) -> tuple[float | None, float | None]:
 def fetch_market_items() -> List[MarketItem]:
     items: List[MarketItem] = []
     updated_at = _now_label()
+    fred_key = os.getenv("FRED_API_KEY", "").strip()
+    fred_series = FRED_SERIES if fred_key else []
 
-    for symbol in STOOQ_SYMBOLS:
-        try:
-            values = _fetch_stooq_series(symbol.symbol)
-        except Exception:
-            continue
+    with httpx.Client(timeout=FETCH_TIMEOUT, limits=FETCH_LIMITS) as client, ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        stooq_futures = [
+            executor.submit(
+                _fetch_or_none, _cached_fetch, ("stooq", symbol.symbol), STOOQ_CACHE_TTL_SECONDS,
+                _fetch_stooq_series, client, symbol.symbol,
+            )
+            for symbol in STOOQ_SYMBOLS
+        ]
+        fred_futures = [
+            executor.submit(
+                _fetch_or_none, _cached_fetch, ("fred", series.series_id), FRED_CACHE_TTL_SECONDS,
+                _fetch_fred_series, client, series.series_id, fred_key,
+            )
+            for series in fred_series
+        ]
+        bitcoin_future = executor.submit(
+            _fetch_or_none, _cached_fetch, ("coingecko", "bitcoin"), COINGECKO_CACHE_TTL_SECONDS,
+            _fetch_bitcoin, client,
+        )
+
+        stooq_values = [future.result() for future in stooq_futures]
+        fred_values = [future.result() for future in fred_futures]
+        bitcoin = bitcoin_future.result()
+
+    for symbol, values in zip(STOOQ_SYMBOLS, stooq_values):
         if not values:
             continue
         change, change_pct = _build_change(values)
@@ -135,36 +254,27 @@ def fetch_market_items() -> List[MarketItem]:
             )
         )
 
-    fred_key = os.getenv("FRED_API_KEY", "").strip()
-    if fred_key:
-        for series in FRED_SERIES:
-            try:
-                values = _fetch_fred_series(series.series_id, fred_key)
-            except Exception:
-                continue
-            if not values:
-                continue
-            change, change_pct = _build_change(values)
-            items.append(
-                MarketItem(
-                    id=series.series_id,
-                    name=series.name,
-                    symbol=series.series_id,
-                    category=series.category,
-                    price=values[0],
-                    change=change,
-                    change_pct=change_pct,
-                    updated_at=updated_at,
-                    source="FRED",
-                )
+    for series, values in zip(fred_series, fred_values):
+        if not values:
+            continue
+        change, change_pct = _build_change(values)
+        items.append(
+            MarketItem(
+                id=series.series_id,
+                name=series.name,
+                symbol=series.series_id,
+                category=series.category,
+                price=values[0],
+                change=change,
+                change_pct=change_pct,
+                updated_at=updated_at,
+                source="FRED",
             )
+        )
 
     try:
-        response = httpx.get(COINGECKO_URL, timeout=20)
-        response.raise_for_status()
-        data = response.json().get("bitcoin", {})
-        price = data.get("usd")
-        change_pct = data.get("usd_24h_change")
+        price = bitcoin.get("usd") if bitcoin else None
+        change_pct = bitcoin.get("usd_24h_change") if bitcoin else None
         if price is not None:
             items.append(
                 MarketItem(
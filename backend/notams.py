@@ -14,14 +14,14 @@ def _now_label() -> str:
     return datetime.now(timezone.utc).strftime("Updated %Y-%m-%d %H:%M UTC")
 
 
-def _coerce_item(raw: Dict[str, Any]) -> Dict[str, str]:
+def _coerce_item(raw: Dict[str, Any], updated_at: str) -> Dict[str, str]:
     return {
         "id": str(raw.get("NOTAMNumber") or raw.get("id") or raw.get("notam_id") or ""),
         "location": str(raw.get("ICAO") or raw.get("location") or raw.get("airport") or ""),
         "issued_at": str(raw.get("issued") or raw.get("issue_date") or raw.get("time") or ""),
         "summary": str(raw.get("text") or raw.get("summary") or raw.get("raw") or ""),
         "source": "NOTAM",
-        "updated_at": _now_label(),
+        "updated_at": updated_at,
     }
 
 
@@ -44,10 +44,11 @@ def fetch_notams() -> List[Dict[str, str]]:
     #     return []
     #
     # items: List[Dict[str, str]] = []
+    # updated_at = _now_label()
     # if isinstance(data, list):
     #     for raw in data:
     #         if isinstance(raw, dict):
-    #             items.append(_coerce_item(raw))
+    #             items.append(_coerce_item(raw, updated_at))
     #     return items
     #
     # if isinstance(data, dict):
@@ -55,7 +56,7 @@ def fetch_notams() -> List[Dict[str, str]]:
     #         if isinstance(value, list):
     #             for raw in value:
     #                 if isinstance(raw, dict):
-    #                     items.append(_coerce_item(raw))
+    #                     items.append(_coerce_item(raw, updated_at))
     #     return items
     #
     # return items
@@ -1,57 +1,29 @@
 """Prompt template for geopolitical risk scan LLM queries."""
-from typing import List
+from typing import Dict, List
 from ..schemas.geo_risk import GeoRiskScanInputs
 
 
-def build_prompt(inputs: GeoRiskScanInputs, regulatory_snippets: List[str], strict_mode: bool = False) -> str:
-    """
-    Build the LLM prompt for geopolitical risk scanning.
-    
-    Args:
-        inputs: Scan input parameters
-        regulatory_snippets: Relevant FCA regulatory text chunks
-        strict_mode: If True, use stricter JSON-only enforcement
-    """
-    regulatory_context = ""
-    if regulatory_snippets:
-        regulatory_context = "\n\n## Regulatory Context (FCA Handbook)\n\n"
-        for i, snippet in enumerate(regulatory_snippets[:3], 1):
-            regulatory_context += f"[Snippet {i}]\n{snippet}\n\n"
-    
-    portfolio_summary = f"Total value: {inputs.portfolio.total_value:,.0f}"
-    if inputs.portfolio.holdings:
-        regions = [h.region for h in inputs.portfolio.holdings if h.region]
-        unique_regions = list(set(regions))
-        portfolio_summary += f"\nRegions: {', '.join(unique_regions[:5])}"
-    
-    strict_instructions = ""
-    if strict_mode:
-        strict_instructions = (
-            "\n\nCRITICAL: You MUST output ONLY valid JSON. No markdown, no explanations, "
-            "no additional text. The response must be parseable as JSON directly."
-        )
-    
-    prompt = f"""You are an internal decision-support tool for financial advisers analyzing geopolitical risk.
+# Regions listed in the portfolio summary
+MAX_PROMPT_REGIONS = 5
+
+# Static prompt text, assembled once at import; only the input parameters and
+# regulatory context are formatted per call
+_PROMPT_HEADER = """You are an internal decision-support tool for financial advisers analyzing geopolitical risk.
 
 ## Task
 Analyze the geopolitical risk for a client portfolio and output a probabilistic assessment.
 
 ## Input Parameters
-- Client ID: {inputs.client_id}
-- As-of Date: {inputs.as_of}
-- Horizon: {inputs.horizon_days} days
-- Risk Tolerance: {inputs.risk_tolerance}
-- Portfolio: {portfolio_summary}
+"""
 
-{regulatory_context}
-## Instructions
+_PROMPT_INSTRUCTIONS = """## Instructions
 
 1. **Output Format**: You MUST output valid JSON matching this exact schema:
-{{
+{
   "scenarios": [
-    {{"name": "low", "p": 0.xx}},
-    {{"name": "moderate", "p": 0.xx}},
-    {{"name": "severe", "p": 0.xx}}
+    {"name": "low", "p": 0.xx},
+    {"name": "moderate", "p": 0.xx},
+    {"name": "severe", "p": 0.xx}
   ],
   "confidence": "low|medium|high",
   "drivers": ["driver1", "driver2", "driver3", "driver4"],
@@ -59,7 +31,7 @@ Analyze the geopolitical risk for a client portfolio and output a probabilistic
   "limitations": ["limitation1", "limitation2", "limitation3"],
   "disclaimer": "Internal decision-support only. Not financial advice.",
   "citations": []
-}}
+}
 
 2. **Probabilities**: The three scenario probabilities MUST sum to exactly 1.00. Round to 2 decimal places.
 
@@ -79,9 +51,63 @@ Analyze the geopolitical risk for a client portfolio and output a probabilistic
 
 7. **Confidence**: Assess confidence as "low", "medium", or "high" based on data quality and regional specificity.
 
-{strict_instructions}
+"""
+
+_PROMPT_OUTPUT = """
 
 ## Output
 Return ONLY the JSON object, no markdown formatting, no code blocks, no explanations."""
+
+_STRICT_INSTRUCTIONS = (
+    "\n\nCRITICAL: You MUST output ONLY valid JSON. No markdown, no explanations, "
+    "no additional text. The response must be parseable as JSON directly."
+)
+
+
+def build_prompt(inputs: GeoRiskScanInputs, regulatory_snippets: List[str], strict_mode: bool = False) -> str:
+    """
+    Build the LLM prompt for geopolitical risk scanning.
+    
+    Args:
+        inputs: Scan input parameters
+        regulatory_snippets: Relevant FCA regulatory text chunks
+        strict_mode: If True, use stricter JSON-only enforcement
+    """
+    regulatory_context = ""
+    if regulatory_snippets:
+        regulatory_context = "\n\n## Regulatory Context (FCA Handbook)\n\n"
+        for i, snippet in enumerate(regulatory_snippets[:3], 1):
+            regulatory_context += f"[Snippet {i}]\n{snippet}\n\n"
+    
+    portfolio_summary = f"Total value: {inputs.portfolio.total_value:,.0f}"
+    if inputs.portfolio.holdings:
+        # First 5 distinct regions in holding order (stable across calls)
+        unique_regions: Dict[str, None] = {}
+        for holding in inputs.portfolio.holdings:
+            region = holding.region
+            if region and region not in unique_regions:
+                unique_regions[region] = None
+                if len(unique_regions) == MAX_PROMPT_REGIONS:
+                    break
+        portfolio_summary += f"\nRegions: {', '.join(unique_regions)}"
+    
+    strict_instructions = _STRICT_INSTRUCTIONS if strict_mode else ""
     
-    return prompt
+    parameters = (
+        f"- Client ID: {inputs.client_id}\n"
+        f"- As-of Date: {inputs.as_of}\n"
+        f"- Horizon: {inputs.horizon_days} days\n"
+        f"- Risk Tolerance: {inputs.risk_tolerance}\n"
+        f"- Portfolio: {portfolio_summary}\n"
+    )
+    
+    return f"{_PROMPT_HEADER}{parameters}\n{regulatory_context}\n{_PROMPT_INSTRUCTIONS}{strict_instructions}{_PROMPT_OUTPUT}"
+
+
+def make_strict_prompt(prompt: str) -> str:
+    """
+    Turn a prompt from build_prompt(strict_mode=False) into its strict-mode form.
+    
+    Equivalent to rebuilding with strict_mode=True, without re-formatting the inputs.
+    """
+    return prompt.removesuffix(_PROMPT_OUTPUT) + _STRICT_INSTRUCTIONS + _PROMPT_OUTPUT
@@ -1,8 +1,20 @@
 """Retrieve relevant regulatory snippets from FCA excerpts."""
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Sequence, Tuple
+
+# Aho-Corasick term automaton (optional, falls back to one str.count per term)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Below this many query terms, one str.count per term beats building an automaton
+AUTOMATON_MIN_TERMS = 5
 
 
 class RegulatorySnippet:
@@ -19,47 +31,144 @@ def _chunk_text(text: str, chunk_size: int = 500) -> List[str]:
         return []
     
     # Split by double newlines (paragraphs)
-    paragraphs = text.split("\n\n")
+    paragraphs = [para for para in (p.strip() for p in text.split("\n\n")) if para]
+    
+    # Each chunk is paragraphs[start:end], packed greedily up to chunk_size
     chunks = []
-    current_chunk = []
+    start = 0
     current_size = 0
-    
-    for para in paragraphs:
-        para = para.strip()
-        if not para:
-            continue
-        
+    for end, para in enumerate(paragraphs):
         para_size = len(para)
-        if current_size + para_size > chunk_size and current_chunk:
-            # Save current chunk
-            chunks.append("\n\n".join(current_chunk))
-            current_chunk = [para]
+        if current_size + para_size > chunk_size and end > start:
+            chunks.append("\n\n".join(paragraphs[start:end]))
+            start = end
             current_size = para_size
         else:
-            current_chunk.append(para)
             current_size += para_size + 2  # +2 for "\n\n"
     
-    if current_chunk:
-        chunks.append("\n\n".join(current_chunk))
+    if start < len(paragraphs):
+        chunks.append("\n\n".join(paragraphs[start:]))
     
     return chunks
 
 
-def _score_chunk(chunk: str, query_terms: List[str]) -> int:
-    """Score a chunk based on keyword matches."""
+def _score_chunks(chunks_lower: Sequence[str], query_terms: List[str]) -> List[int]:
+    """
+    Score lowercased chunks by keyword matches.
+    
+    A chunk's score is the number of (non-overlapping) occurrences of each term,
+    summed over the terms.
+    """
     if not query_terms:
-        return 1
+        return [1] * len(chunks_lower)
     
-    chunk_lower = chunk.lower()
-    score = 0
-    for term in query_terms:
-        term_lower = term.lower()
-        # Count occurrences
-        score += chunk_lower.count(term_lower)
+    terms = [term.lower() for term in query_terms]
+    if not AHOCORASICK_AVAILABLE or len(terms) < AUTOMATON_MIN_TERMS or "" in terms:
+        return [sum(chunk.count(term) for term in terms) for chunk in chunks_lower]
     
+    automaton = _term_automaton(tuple(terms))
+    return [_count_term_matches(automaton, chunk) for chunk in chunks_lower]
+
+
+@lru_cache(maxsize=32)
+def _term_automaton(terms: Tuple[str, ...]) -> "ahocorasick.Automaton":
+    """Build an automaton whose payload is (term, term length, times the term was queried)."""
+    automaton = ahocorasick.Automaton()
+    for term in set(terms):
+        automaton.add_word(term, (term, len(term), terms.count(term)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _count_term_matches(automaton: "ahocorasick.Automaton", text: str) -> int:
+    """Count term occurrences in one scan, matching str.count per term."""
+    # Matches arrive ordered by end position; like str.count, an occurrence
+    # overlapping the previous counted one of the same term is skipped
+    next_start: Dict[str, int] = {}
+    score = 0
+    for end, (term, length, weight) in automaton.iter(text):
+        start = end - length + 1
+        if start >= next_start.get(term, 0):
+            next_start[term] = end + 1
+            score += weight
     return score
 
 
+# A "## " heading line, with the newline before it (headings are at line starts)
+_HEADING_RE = re.compile(r"(?:^|\n)## ([^\n]*)")
+
+
+def _split_sections(content: str) -> Dict[str, str]:
+    """
+    Split text into sections by "## " headings (like ## COBS 9, ## SYSC 7).
+    
+    Text before the first heading is the "General" section. A heading with no
+    lines under it does not replace an earlier section of the same name.
+    """
+    parts = _HEADING_RE.split(content)  # [preamble, name, body, name, body, ...]
+    sections = {}
+    if parts[0] or not content.startswith("## "):
+        sections["General"] = parts[0]
+    for name, body in zip(parts[1::2], parts[2::2]):
+        # Each body starts with the newline ending its heading; empty means no lines
+        if body:
+            sections[name.strip()] = body[1:]
+    return sections
+
+
+@lru_cache(maxsize=4)
+def _load_chunks(excerpts_file: Path, mtime: float) -> Tuple[Tuple[str, str, str, str], ...]:
+    """
+    Read and chunk the excerpts file.
+    
+    Returns (text, section, chunk_id, lowercased text) per chunk. Cached per file
+    and modification time, so the file is only re-read after it changes.
+    """
+    content = excerpts_file.read_text(encoding="utf-8")
+    
+    if not content.strip():
+        return ()
+    
+    sections = _split_sections(content)
+    
+    # Chunk each section
+    all_chunks: List[Tuple[str, str, str, str]] = []  # (text, section, chunk_id, text lowercased)
+    
+    for section_name, section_text in sections.items():
+        chunks = _chunk_text(section_text, chunk_size=500)
+        for i, chunk in enumerate(chunks):
+            chunk_id = f"chunk_{section_name.lower().replace(' ', '_')}_{i+1:02d}"
+            all_chunks.append((chunk, section_name, chunk_id, chunk.lower()))
+    
+    return tuple(all_chunks)
+
+
+@lru_cache(maxsize=16)
+def _rank_chunks(
+    excerpts_file: Path,
+    mtime: float,
+    query_terms: Tuple[str, ...],
+) -> Tuple[Tuple[int, str, str, str], ...]:
+    """
+    Score and rank the file's chunks for a query, best first.
+    
+    Returns (score, text, section, chunk_id) per chunk. The scan fallback always
+    queries the same terms, so ranking runs once per file version and term set.
+    """
+    all_chunks = _load_chunks(excerpts_file, mtime)
+    
+    # Score and rank chunks
+    scores = _score_chunks([chunk_lower for _, _, _, chunk_lower in all_chunks], list(query_terms))
+    scored_chunks = [
+        (score, chunk, section, chunk_id)
+        for score, (chunk, section, chunk_id, _) in zip(scores, all_chunks)
+    ]
+    
+    # Sort by score (descending)
+    scored_chunks.sort(key=lambda x: x[0], reverse=True)
+    return tuple(scored_chunks)
+
+
 def retrieve_regulatory_snippets(
     query_terms: List[str],
     max_results: int = 3,
@@ -82,55 +191,13 @@ def retrieve_regulatory_snippets(
     
     excerpts_file = base_path / "docs" / "regulatory" / "FCA_EXCERPTS.md"
     
-    if not excerpts_file.exists():
-        return []
-    
     try:
-        content = excerpts_file.read_text(encoding="utf-8")
+        ranked_chunks = _rank_chunks(excerpts_file, os.path.getmtime(excerpts_file), tuple(query_terms))
     except Exception:
         return []
     
-    if not content.strip():
-        return []
-    
-    # Extract sections (headings like ## COBS 9, ## SYSC 7)
-    sections = {}
-    current_section = "General"
-    current_text = []
-    
-    for line in content.split("\n"):
-        if line.startswith("## "):
-            # Save previous section
-            if current_text:
-                sections[current_section] = "\n".join(current_text)
-            # Start new section
-            current_section = line[3:].strip()
-            current_text = []
-        else:
-            current_text.append(line)
-    
-    # Save last section
-    if current_text:
-        sections[current_section] = "\n".join(current_text)
-    
-    # Chunk each section
-    all_chunks: List[Tuple[str, str, str]] = []  # (text, section, chunk_id)
-    
-    for section_name, section_text in sections.items():
-        chunks = _chunk_text(section_text, chunk_size=500)
-        for i, chunk in enumerate(chunks):
-            chunk_id = f"chunk_{section_name.lower().replace(' ', '_')}_{i+1:02d}"
-            all_chunks.append((chunk, section_name, chunk_id))
-    
-    # Score and rank chunks
-    scored_chunks = [
-        (_score_chunk(chunk, query_terms), chunk, section, chunk_id)
-        for chunk, section, chunk_id in all_chunks
-    ]
-    
-    # Sort by score (descending) and take top N
-    scored_chunks.sort(key=lambda x: x[0], reverse=True)
-    top_chunks = scored_chunks[:max_results]
+    # Take top N
+    top_chunks = ranked_chunks[:max_results]
     
     # Convert to RegulatorySnippet objects
     snippets = [
@@ -1,11 +1,11 @@
 """FastAPI routes for geopolitical risk scanning."""
+import asyncio
 import json
 import os
 import re
-from datetime import datetime
 from typing import List
 import httpx
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.responses import StreamingResponse
 
 from ..schemas.geo_risk import (
@@ -26,63 +26,184 @@ from ..schemas.geo_risk import (
 )
 from ..geo_risk_fallback import generate_fallback
 from ..geo_risk_validate import validate_result
-from ..prompts.geo_risk_scan_prompt import build_prompt
+from ..prompts.geo_risk_scan_prompt import build_prompt, make_strict_prompt
 from ..regulatory_retriever import retrieve_regulatory_snippets, get_snippet_texts
-from ..geo_risk_store import get_store
-from ..geo_risk_pipeline import run_pipeline_simple, run_pipeline, run_pipeline_streaming
-from ..geo_risk_intelligence_cache import invalidate_cache
+from ..geo_risk_store import get_store, new_scan_id, new_created_at
+from ..geo_risk_characterization import get_exposures
+from ..json_encoding import encode_json
 
 router = APIRouter(prefix="/geo-risk", tags=["geo-risk"])
 
+# Request risk tolerance (validated lowercase) -> pipeline risk tolerance
+_RISK_TOLERANCE = {
+    "low": "Low",
+    "medium": "Medium",
+    "high": "High",
+}
 
-def _call_ollama(prompt: str, model: str = None) -> str:
-    """Call Ollama API directly."""
+# Scans are immutable once stored; browsers may reuse a fetched scan briefly
+SCAN_CACHE_CONTROL = "private, max-age=60"
+
+# One pooled async Ollama client, so the normal and strict-mode retry calls
+# (and concurrent scans) reuse warm connections without holding a worker
+# thread while the model generates; created on first use in the event loop
+OLLAMA_TIMEOUT = httpx.Timeout(90.0, connect=5.0)
+OLLAMA_LIMITS = httpx.Limits(max_keepalive_connections=8)
+_ollama_client: httpx.AsyncClient | None = None
+
+
+def _get_ollama_client() -> httpx.AsyncClient:
+    """Return the shared Ollama client, creating it on first use."""
+    global _ollama_client
+    if _ollama_client is None:
+        _ollama_client = httpx.AsyncClient(timeout=OLLAMA_TIMEOUT, limits=OLLAMA_LIMITS)
+    return _ollama_client
+
+
+async def close_ollama_client():
+    """Close the shared Ollama client (called on app shutdown)."""
+    global _ollama_client
+    if _ollama_client is not None:
+        client, _ollama_client = _ollama_client, None
+        await client.aclose()
+
+
+# The pipeline modules pull in the Anthropic SDK and the intelligence stack,
+# which dominate app start-up; they are imported on first use, inside worker
+# threads so the import never blocks the event loop
+
+
+def _run_pipeline_simple(*args, **kwargs):
+    """run_pipeline_simple, imported on first use."""
+    from ..geo_risk_pipeline import run_pipeline_simple
+    return run_pipeline_simple(*args, **kwargs)
+
+
+def _run_pipeline(*args, **kwargs):
+    """run_pipeline, imported on first use."""
+    from ..geo_risk_pipeline import run_pipeline
+    return run_pipeline(*args, **kwargs)
+
+
+async def _call_ollama(prompt: str, model: str = None) -> str:
+    """
+    Call Ollama API directly.
+    
+    The reply is streamed and the connection closed as soon as it contains a
+    complete JSON object, instead of waiting for generation to finish.
+    """
     if model is None:
         model = os.getenv("OLLAMA_MODEL", "llama3.1:8b")
     base_url = os.getenv("OLLAMA_URL", "http://localhost:11434").rstrip("/")
     
     try:
         # Use /api/chat endpoint (same as agent.py)
-        response = httpx.post(
+        async with _get_ollama_client().stream(
+            "POST",
             f"{base_url}/api/chat",
-            json={
+            # Encoded straight to bytes (orjson when available) rather than
+            # via httpx's json= (json.dumps, then a separate UTF-8 encode)
+            content=encode_json({
                 "model": model,
                 "messages": [
                     {"role": "user", "content": prompt}
                 ],
-                "stream": False,
+                "stream": True,
                 "options": {"num_predict": 800},  # Enough for JSON response
-            },
-            timeout=90,
-        )
-        response.raise_for_status()
-        data = response.json()
-        # Extract content from message response
-        message = data.get("message", {})
-        return message.get("content", "").strip()
+            }),
+            headers={"Content-Type": "application/json"},
+        ) as response:
+            response.raise_for_status()
+            parts: List[str] = []
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                if "error" in data:
+                    raise RuntimeError(data["error"])
+                # Extract content from each streamed message chunk
+                content = data.get("message", {}).get("content", "")
+                if content:
+                    parts.append(content)
+                    if "}" in content and _has_complete_json("".join(parts)):
+                        break
+                if data.get("done"):
+                    break
+        return "".join(parts).strip()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Ollama call failed: {str(e)}")
 
 
+# Tokens that matter when scanning for a balanced JSON object
+_JSON_SCAN_RE = re.compile(r'[{}"\\]')
+# A JSON object inside a markdown code block
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+
+def _find_balanced_json(text: str) -> str | None:
+    """
+    Return the first balanced {...} object in text, or None if there is none.
+    
+    Braces inside JSON string literals (including escaped quotes) are ignored.
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped_at = -1  # Position of the character after a backslash in a string
+    for match in _JSON_SCAN_RE.finditer(text, start):
+        position = match.start()
+        if position == escaped_at:
+            continue
+        char = match.group()
+        if in_string:
+            if char == "\\":
+                escaped_at = position + 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:position + 1]
+    return None
+
+
+def _has_complete_json(text: str) -> bool:
+    """Whether text already holds a balanced JSON object that parses."""
+    candidate = _find_balanced_json(text)
+    if candidate is None:
+        return False
+    try:
+        json.loads(candidate)
+    except json.JSONDecodeError:
+        return False
+    return True
+
+
 def _extract_json_from_response(text: str) -> dict:
     """Extract JSON from LLM response (may have markdown or extra text)."""
-    # Try to find JSON object
-    # Look for { ... } pattern
-    json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', text, re.DOTALL)
-    if json_match:
-        try:
-            return json.loads(json_match.group(0))
-        except json.JSONDecodeError:
-            pass
-    
     # Try parsing entire response as JSON
     try:
         return json.loads(text)
     except json.JSONDecodeError:
         pass
     
+    # Look for the first balanced { ... } object
+    candidate = _find_balanced_json(text)
+    if candidate is not None:
+        try:
+            return json.loads(candidate)
+        except json.JSONDecodeError:
+            pass
+    
     # Try to extract from code blocks
-    code_block_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', text, re.DOTALL)
+    code_block_match = _JSON_BLOCK_RE.search(text)
     if code_block_match:
         try:
             return json.loads(code_block_match.group(1))
@@ -117,8 +238,8 @@ def _parse_llm_response(response_text: str, inputs: GeoRiskScanInputs, model: st
         raise HTTPException(status_code=500, detail=f"Failed to construct output: {str(e)}")
     
     # Generate scan_id and timestamp
-    scan_id = f"scan_{int(datetime.now().timestamp())}_{inputs.client_id[:8]}"
-    created_at = datetime.now().isoformat()
+    scan_id = new_scan_id("scan", inputs.client_id[:8])
+    created_at = new_created_at()
     
     result = GeoRiskScanResult(
         scan_id=scan_id,
@@ -140,13 +261,16 @@ def _parse_llm_response(response_text: str, inputs: GeoRiskScanInputs, model: st
 
 
 @router.post("/scan")
-def scan_geo_risk(request: GeoRiskScanRequest) -> GeoRiskScanResult:
+async def scan_geo_risk(request: GeoRiskScanRequest) -> GeoRiskScanResult:
     """
     Run a geopolitical risk scan.
     
     Uses the new pipeline-based approach for per-holding analysis.
     Returns a probabilistic risk assessment with scenarios, confidence, drivers,
     and suitability impact in compliance-safe language.
+    
+    The blocking pipeline and file reads run in worker threads and the Ollama
+    fallback is awaited, so neither ties up the event loop.
     """
     model = os.getenv("OLLAMA_MODEL", "llama3.1:8b")
     
@@ -168,15 +292,10 @@ def scan_geo_risk(request: GeoRiskScanRequest) -> GeoRiskScanResult:
     # Use new pipeline to calculate probabilities
     try:
         # Convert risk_tolerance to proper case
-        risk_tolerance_map = {
-            "low": "Low",
-            "medium": "Medium",
-            "high": "High",
-        }
-        risk_tolerance = risk_tolerance_map.get(request.risk_tolerance.lower(), "Medium")
+        risk_tolerance = _RISK_TOLERANCE.get(request.risk_tolerance, "Medium")
         
         # Run pipeline
-        probabilities = run_pipeline_simple(holding, risk_tolerance)
+        probabilities = await asyncio.to_thread(_run_pipeline_simple, holding, risk_tolerance)
         
         # Convert probabilities to scenarios format
         # Map: Sell -> severe, Hold -> moderate, Buy -> low
@@ -220,8 +339,8 @@ def scan_geo_risk(request: GeoRiskScanRequest) -> GeoRiskScanResult:
         )
         
         # Generate scan_id and timestamp
-        scan_id = f"scan_{int(datetime.now().timestamp())}_{request.client_id[:8]}"
-        created_at = datetime.now().isoformat()
+        scan_id = new_scan_id("scan", request.client_id[:8])
+        created_at = new_created_at()
         
         result = GeoRiskScanResult(
             scan_id=scan_id,
@@ -239,7 +358,7 @@ def scan_geo_risk(request: GeoRiskScanRequest) -> GeoRiskScanResult:
         # Pipeline failed, fall back to LLM-based approach
         # Retrieve regulatory snippets
         query_terms = ["suitability", "risk", "documentation", "assessment"]
-        snippets = retrieve_regulatory_snippets(query_terms, max_results=3)
+        snippets = await asyncio.to_thread(retrieve_regulatory_snippets, query_terms, 3)
         snippet_texts = get_snippet_texts(snippets)
         
         # Build prompt
@@ -248,13 +367,13 @@ def scan_geo_risk(request: GeoRiskScanRequest) -> GeoRiskScanResult:
         used_fallback = False
         
         try:
-            response_text = _call_ollama(prompt, model)
+            response_text = await _call_ollama(prompt, model)
             result = _parse_llm_response(response_text, inputs, model)
             
             # If validation failed, try once more with strict mode
             if not result.meta.validation.passed:
-                prompt_strict = build_prompt(inputs, snippet_texts, strict_mode=True)
-                response_text_strict = _call_ollama(prompt_strict, model)
+                prompt_strict = make_strict_prompt(prompt)
+                response_text_strict = await _call_ollama(prompt_strict, model)
                 result = _parse_llm_response(response_text_strict, inputs, model)
                 
                 # If still failed, use fallback
@@ -276,7 +395,7 @@ def scan_geo_risk(request: GeoRiskScanRequest) -> GeoRiskScanResult:
 
 
 @router.post("/scan-detailed")
-def scan_geo_risk_detailed(request: GeoRiskScanRequest) -> DetailedPipelineResult:
+async def scan_geo_risk_detailed(request: GeoRiskScanRequest) -> DetailedPipelineResult:
     """
     Run a detailed geopolitical risk scan with full pipeline breakdown.
     
@@ -288,12 +407,7 @@ def scan_geo_risk_detailed(request: GeoRiskScanRequest) -> DetailedPipelineResul
     - Final probability calculations
     """
     # Convert risk_tolerance to proper case
-    risk_tolerance_map = {
-        "low": "Low",
-        "medium": "Medium",
-        "high": "High",
-    }
-    risk_tolerance = risk_tolerance_map.get(request.risk_tolerance.lower(), "Medium")
+    risk_tolerance = _RISK_TOLERANCE.get(request.risk_tolerance, "Medium")
     
     # Get the holding
     if not request.portfolio.holdings:
@@ -302,24 +416,15 @@ def scan_geo_risk_detailed(request: GeoRiskScanRequest) -> DetailedPipelineResul
     holding = request.portfolio.holdings[0]
     
     # Run full pipeline
-    pipeline_result = run_pipeline(holding, risk_tolerance, days_lookback=90)
+    pipeline_result = await asyncio.to_thread(_run_pipeline, holding, risk_tolerance, days_lookback=90)
     
     # Extract exposures
-    exposures = []
-    if pipeline_result.profile.is_government_exposed:
-        exposures.append("Government")
-    if pipeline_result.profile.is_energy_exposed:
-        exposures.append("Energy")
-    if pipeline_result.profile.is_financial_exposed:
-        exposures.append("Financial")
-    if pipeline_result.profile.is_technology_exposed:
-        exposures.append("Technology")
-    if pipeline_result.profile.is_infrastructure_exposed:
-        exposures.append("Infrastructure")
-    
-    # Convert themes
+    exposures = get_exposures(pipeline_result.profile)
+    
+    # Convert themes, signals and theme impacts. These come from the pipeline's
+    # typed dataclasses, so they are constructed without re-validation
     theme_details = [
-        ThemeDetail(
+        ThemeDetail.model_construct(
             theme=t.theme,
             relevance_score=t.relevance_score,
             reasoning=t.reasoning,
@@ -328,9 +433,8 @@ def scan_geo_risk_detailed(request: GeoRiskScanRequest) -> DetailedPipelineResul
         for t in pipeline_result.themes
     ]
     
-    # Convert signals
     signal_details = [
-        IntelligenceSignalDetail(
+        IntelligenceSignalDetail.model_construct(
             source=s.source,
             title=s.title,
             summary=s.summary,
@@ -350,7 +454,7 @@ def scan_geo_risk_detailed(request: GeoRiskScanRequest) -> DetailedPipelineResul
         for s in pipeline_result.signals
     ]
     
-    # Convert web searches
+    # Convert web searches (plain dicts, so these are still validated)
     web_search_details = [
         WebSearchDetail(
             theme=ws.get("theme", ""),
@@ -362,9 +466,8 @@ def scan_geo_risk_detailed(request: GeoRiskScanRequest) -> DetailedPipelineResul
         for ws in pipeline_result.web_searches
     ]
     
-    # Convert impact
     theme_impact_details = [
-        ThemeImpactDetail(
+        ThemeImpactDetail.model_construct(
             theme=ti.theme,
             impact_direction=ti.impact_direction,
             impact_magnitude=ti.impact_magnitude,
@@ -431,12 +534,7 @@ def scan_geo_risk_detailed_stream(request: GeoRiskScanRequest):
     Each event includes step_id, step_name, status, duration_ms, and step-specific data.
     """
     # Convert risk_tolerance to proper case
-    risk_tolerance_map = {
-        "low": "Low",
-        "medium": "Medium",
-        "high": "High",
-    }
-    risk_tolerance = risk_tolerance_map.get(request.risk_tolerance.lower(), "Medium")
+    risk_tolerance = _RISK_TOLERANCE.get(request.risk_tolerance, "Medium")
 
     # Get the holding
     if not request.portfolio.holdings:
@@ -444,23 +542,15 @@ def scan_geo_risk_detailed_stream(request: GeoRiskScanRequest):
 
     holding = request.portfolio.holdings[0]
 
+    from ..geo_risk_pipeline import run_pipeline_streaming
+    
     # Create SSE event generator
     def generate_sse_events():
         """Generate SSE-formatted events from pipeline updates."""
         try:
             for update in run_pipeline_streaming(holding, risk_tolerance, days_lookback=90):
-                # Convert update to JSON
-                event_data = {
-                    "step_id": update.step_id,
-                    "step_name": update.step_name,
-                    "status": update.status,
-                    "duration_ms": update.duration_ms,
-                    "data": update.data,
-                    "error": update.error,
-                }
-
                 # Format as SSE: data: {json}\n\n
-                yield f"data: {json.dumps(event_data)}\n\n"
+                yield b"data: " + update.to_json() + b"\n\n"
 
         except Exception as e:
             # Send error event
@@ -472,7 +562,7 @@ def scan_geo_risk_detailed_stream(request: GeoRiskScanRequest):
                 "data": None,
                 "error": str(e),
             }
-            yield f"data: {json.dumps(error_event)}\n\n"
+            yield b"data: " + encode_json(error_event) + b"\n\n"
 
     return StreamingResponse(
         generate_sse_events(),
@@ -501,13 +591,23 @@ def list_scans(client_id: str | None = None, limit: int = 10) -> List[GeoRiskSca
         return store.list_all(limit=limit)
 
 
-@router.get("/scans/{scan_id}")
-def get_scan(scan_id: str) -> GeoRiskScanResult:
-    """Get a specific scan by ID."""
+@router.get("/scans/{scan_id}", response_model=GeoRiskScanResult)
+def get_scan(scan_id: str, request: Request) -> Response:
+    """
+    Get a specific scan by ID.
+    
+    Stored scans never change, so the response carries an ETag and a matching
+    If-None-Match gets 304 Not Modified without a body.
+    """
     store = get_store()
-    result = store.get(scan_id)
+    cached = store.get_json(scan_id)
     
-    if not result:
+    if not cached:
         raise HTTPException(status_code=404, detail="Scan not found")
     
-    return result
+    body, etag = cached
+    headers = {"ETag": etag, "Cache-Control": SCAN_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,5 +1,6 @@
 """API routes for GP scan management."""
 from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
@@ -19,7 +20,8 @@ router = APIRouter(prefix="/gp-scans", tags=["gp-scans"])
 def _get_or_create_asset(
     db: Session,
     pipeline_result: dict,
-    asset_id: Optional[int] = None
+    asset_id: Optional[int] = None,
+    commit: bool = True,
 ) -> AssetTable:
     """
     Get existing asset by ID, or create new asset from pipeline result.
@@ -28,6 +30,8 @@ def _get_or_create_asset(
         db: Database session
         pipeline_result: Full pipeline result dict
         asset_id: Optional asset ID (if provided, fetch existing)
+        commit: Commit a newly created asset; if False it is only flushed,
+            so it gets an ID but is committed (or rolled back) with the caller's transaction
     
     Returns:
         AssetTable instance
@@ -86,12 +90,55 @@ def _get_or_create_asset(
     )
     
     db.add(new_asset)
+    if not commit:
+        db.flush()
+        return new_asset
     db.commit()
     db.refresh(new_asset)
     
     return new_asset
 
 
+def _scan_row_from_pipeline(
+    pipeline_result: dict,
+    scan_data: GPScanCreate,
+    asset_id: int,
+    now: datetime,
+) -> dict:
+    """
+    Build the gp_scans column values for a scan, extracting key metrics from its pipeline result.
+    
+    Args:
+        pipeline_result: Full pipeline result dict
+        scan_data: Scan being saved
+        asset_id: ID of the scanned asset
+        now: Timestamp used for scan_date, created_at and updated_at
+    
+    Returns:
+        Dict of GPScanTable attribute values
+    """
+    probabilities = pipeline_result.get("probabilities", {})
+    impact = pipeline_result.get("impact", {})
+    
+    return {
+        "asset_id": asset_id,
+        "risk_tolerance": scan_data.risk_tolerance,
+        "days_lookback": scan_data.days_lookback,
+        "scan_date": now,
+        "pipeline_result": pipeline_result,
+        "negative_probability": probabilities.get("negative") or probabilities.get("sell", 0.0),
+        "neutral_probability": probabilities.get("neutral") or probabilities.get("hold", 0.0),
+        "positive_probability": probabilities.get("positive") or probabilities.get("buy", 0.0),
+        "overall_direction": impact.get("overall_direction", "neutral"),
+        "overall_magnitude": impact.get("overall_magnitude", 0.0),
+        "confidence": impact.get("confidence", 0.0),
+        "signal_count": pipeline_result.get("signal_count", 0),
+        "top_themes": pipeline_result.get("top_themes", [])[:5],  # Top 5
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
 @router.post("", response_model=GPScanResponse, status_code=201)
 def save_gp_scan(scan_data: GPScanCreate, db: Session = Depends(get_db)):
     """
@@ -102,38 +149,8 @@ def save_gp_scan(scan_data: GPScanCreate, db: Session = Depends(get_db)):
     # Get or create asset
     asset = _get_or_create_asset(db, scan_data.pipeline_result, scan_data.asset_id)
     
-    # Extract key metrics from pipeline result
-    probabilities = scan_data.pipeline_result.get("probabilities", {})
-    impact = scan_data.pipeline_result.get("impact", {})
-    
-    negative_prob = probabilities.get("negative") or probabilities.get("sell", 0.0)
-    neutral_prob = probabilities.get("neutral") or probabilities.get("hold", 0.0)
-    positive_prob = probabilities.get("positive") or probabilities.get("buy", 0.0)
-    
-    overall_direction = impact.get("overall_direction", "neutral")
-    overall_magnitude = impact.get("overall_magnitude", 0.0)
-    confidence = impact.get("confidence", 0.0)
-    signal_count = scan_data.pipeline_result.get("signal_count", 0)
-    top_themes = scan_data.pipeline_result.get("top_themes", [])[:5]  # Top 5
-    
     # Create scan record
-    scan = GPScanTable(
-        asset_id=asset.id,
-        risk_tolerance=scan_data.risk_tolerance,
-        days_lookback=scan_data.days_lookback,
-        scan_date=datetime.utcnow(),
-        pipeline_result=scan_data.pipeline_result,
-        negative_probability=negative_prob,
-        neutral_probability=neutral_prob,
-        positive_probability=positive_prob,
-        overall_direction=overall_direction,
-        overall_magnitude=overall_magnitude,
-        confidence=confidence,
-        signal_count=signal_count,
-        top_themes=top_themes,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
-    )
+    scan = GPScanTable(**_scan_row_from_pipeline(scan_data.pipeline_result, scan_data, asset.id, datetime.utcnow()))
     
     db.add(scan)
     db.commit()
@@ -158,6 +175,52 @@ def save_gp_scan(scan_data: GPScanCreate, db: Session = Depends(get_db)):
     )
 
 
+@router.post("/bulk", response_model=List[GPScanResponse], status_code=201)
+def save_gp_scans_bulk(scans_data: List[GPScanCreate], db: Session = Depends(get_db)):
+    """
+    Save many GP risk scan results at once.
+    
+    Assets are resolved as in save_gp_scan, but new assets are only flushed; they
+    and the scans (written with a single multi-row INSERT ... RETURNING) are
+    committed together, so nothing is saved if any item fails.
+    """
+    if not scans_data:
+        return []
+    
+    now = datetime.utcnow()
+    rows = []
+    for scan_data in scans_data:
+        asset = _get_or_create_asset(db, scan_data.pipeline_result, scan_data.asset_id, commit=False)
+        rows.append(_scan_row_from_pipeline(scan_data.pipeline_result, scan_data, asset.id, now))
+    
+    scan_ids = db.scalars(
+        insert(GPScanTable).returning(GPScanTable.id, sort_by_parameter_order=True),
+        rows,
+    ).all()
+    db.commit()
+    
+    return [
+        GPScanResponse(
+            id=scan_id,
+            asset_id=row["asset_id"],
+            risk_tolerance=row["risk_tolerance"],
+            days_lookback=row["days_lookback"],
+            scan_date=now.isoformat(),
+            negative_probability=row["negative_probability"],
+            neutral_probability=row["neutral_probability"],
+            positive_probability=row["positive_probability"],
+            overall_direction=row["overall_direction"],
+            overall_magnitude=row["overall_magnitude"],
+            confidence=row["confidence"],
+            signal_count=row["signal_count"],
+            top_themes=row["top_themes"],
+            created_at=now.isoformat(),
+            updated_at=now.isoformat(),
+        )
+        for scan_id, row in zip(scan_ids, rows)
+    ]
+
+
 @router.get("", response_model=List[GPScanResponse])
 def list_gp_scans(
     asset_id: Optional[int] = None,
@@ -7,6 +7,8 @@ from datetime import datetime
 from ..database import get_db
 from ..db_models import ThemeTable
 from ..schemas.themes import ThemeCreate, ThemeUpdate, ThemeResponse
+from ..geo_risk_theme_mapper import clear_theme_cache
+from ..theme_web_search import clear_query_cache
 
 router = APIRouter(prefix="/themes", tags=["themes"])
 
@@ -99,6 +101,10 @@ def create_theme(theme: ThemeCreate, db: Session = Depends(get_db)):
     db.commit()
     db.refresh(db_theme)
     
+    # Clear cache so the new theme is used immediately
+    clear_theme_cache()
+    clear_query_cache()
+    
     return ThemeResponse(
         id=db_theme.id,
         name=db_theme.name,
@@ -157,6 +163,10 @@ def update_theme(theme_name: str, theme_update: ThemeUpdate, db: Session = Depen
     db.commit()
     db.refresh(theme)
     
+    # Clear cache so the updated theme is used immediately
+    clear_theme_cache()
+    clear_query_cache()
+    
     return ThemeResponse(
         id=theme.id,
         name=theme.name,
@@ -188,6 +198,8 @@ def delete_theme(theme_name: str, db: Session = Depends(get_db)):
     theme.is_active = "false"
     theme.updated_at = datetime.utcnow()
     db.commit()
+    clear_theme_cache()
+    clear_query_cache()
     
     return None
 
@@ -277,6 +289,8 @@ def _seed_default_themes(db: Session):
         created_count += 1
     
     db.commit()
+    clear_theme_cache()
+    clear_query_cache()
     
     return {
         "status": "success",
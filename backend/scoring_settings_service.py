@@ -1,13 +1,34 @@
 """Service to load and cache scoring settings from database."""
-from typing import Dict, Optional
-from functools import lru_cache
+from typing import Dict, Optional, Tuple
+import time
 from .database import SessionLocal
 from .db_models import ScoringSettingsTable
 
 
-@lru_cache(maxsize=1)
+# Cached (settings, time.monotonic() when it expires). The short TTL lets every
+# worker process pick up settings changes made through another process.
+_SETTINGS_TTL_SECONDS = 30.0
+# Failed loads are cached (as None) briefly too, so a database outage costs at
+# most one connection timeout per window instead of one per call
+_SETTINGS_FAILURE_TTL_SECONDS = 5.0
+_settings_cache: Optional[Tuple[Optional[Dict], float]] = None
+
+
 def get_active_scoring_settings() -> Optional[Dict]:
     """Get active scoring settings from database with caching."""
+    global _settings_cache
+    cached = _settings_cache
+    if cached is not None and time.monotonic() < cached[1]:
+        return cached[0]
+
+    settings, loaded = _load_active_scoring_settings()
+    ttl = _SETTINGS_TTL_SECONDS if loaded else _SETTINGS_FAILURE_TTL_SECONDS
+    _settings_cache = (settings, time.monotonic() + ttl)
+    return settings
+
+
+def _load_active_scoring_settings() -> Tuple[Optional[Dict], bool]:
+    """Load active scoring settings; the flag is False if the database query failed."""
     db = SessionLocal()
     try:
         settings = db.query(ScoringSettingsTable).filter(
@@ -22,7 +43,7 @@ def get_active_scoring_settings() -> Optional[Dict]:
             ).first()
         
         if not settings:
-            return None
+            return None, True
         
         return {
             "weight_base_relevance": settings.weight_base_relevance,
@@ -45,14 +66,16 @@ def get_active_scoring_settings() -> Optional[Dict]:
             "max_signals_default": settings.max_signals_default,
             "max_events_per_snapshot": settings.max_events_per_snapshot,
             "use_semantic_filtering": settings.use_semantic_filtering == "true",
-        }
+        }, True
     except Exception as e:
+        # Cached only for _SETTINGS_FAILURE_TTL_SECONDS, so the database is retried soon
         print(f"Error loading scoring settings: {e}")
-        return None
+        return None, False
     finally:
         db.close()
 
 
 def clear_scoring_settings_cache():
     """Clear the scoring settings cache (call after updating settings)."""
-    get_active_scoring_settings.cache_clear()
+    global _settings_cache
+    _settings_cache = None
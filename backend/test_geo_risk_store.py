@@ -0,0 +1,50 @@
+"""Tests for the in-memory geo-risk scan store."""
+from backend.geo_risk_fallback import generate_fallback
+from backend.geo_risk_store import GeoRiskStore
+from backend.schemas.geo_risk import GeoRiskScanInputs
+
+
+def _scan(scan_id: str, created_at: str):
+    """Fallback scan result with the given ID and created_at."""
+    inputs = GeoRiskScanInputs(
+        client_id="client1",
+        as_of="2024-01-01",
+        horizon_days=30,
+        risk_tolerance="medium",
+        portfolio={
+            "total_value": 1.0,
+            "holdings": [{
+                "id": "1",
+                "name": "Russia Energy",
+                "class": "Equities",
+                "region": "Europe",
+                "value": 1.0,
+                "allocation_pct": 1.0,
+                "sector": "Energy",
+            }],
+        },
+    )
+    result = generate_fallback(inputs)
+    result.scan_id = scan_id
+    result.created_at = created_at
+    return result
+
+
+def test_restored_scan_is_evicted_by_created_at():
+    """Re-storing a scan makes it the newest, so the oldest other scan is evicted first."""
+    store = GeoRiskStore(max_scans=3)
+    store.store(_scan("a", "2024-01-01T00:00:00"))
+    store.store(_scan("b", "2024-01-02T00:00:00"))
+    store.store(_scan("c", "2024-01-03T00:00:00"))
+    store.store(_scan("a", "2024-01-04T00:00:00"))
+
+    store.store(_scan("d", "2024-01-05T00:00:00"))
+
+    assert store.get("b") is None
+    assert [scan.scan_id for scan in store.list_all()] == ["d", "a", "c"]
+
+    store.store(_scan("e", "2024-01-06T00:00:00"))
+
+    assert store.get("c") is None
+    assert store.get("a") is not None
+    assert [scan.scan_id for scan in store.list_by_client("client1")] == ["e", "d", "a"]
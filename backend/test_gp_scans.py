@@ -0,0 +1,109 @@
+"""
+Tests for the bulk GP scan route.
+
+Runs against in-memory SQLite; the Postgres ARRAY columns are stored as JSON
+for the duration of each test.
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import JSON, create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database import get_db
+from backend.db_models import AssetTable, GPScanTable
+from backend.routes import gp_scans
+
+
+def _pipeline_result(ticker: str, signal_count: int) -> dict:
+    """Minimal pipeline result for a scan of the given asset."""
+    return {
+        "ticker": ticker,
+        "name": f"{ticker} Asset",
+        "asset_country": "Russia",
+        "asset_region": "Europe",
+        "probabilities": {"negative": 0.5, "neutral": 0.3, "positive": 0.2},
+        "impact": {"overall_direction": "negative", "overall_magnitude": 0.4, "confidence": 0.6},
+        "signal_count": signal_count,
+        "top_themes": ["sanctions", "energy_security"],
+    }
+
+
+@pytest.fixture
+def client_and_session():
+    """Test client for the GP scan routes and a session factory on the same database."""
+    array_columns = [AssetTable.__table__.c.exposures, GPScanTable.__table__.c.top_themes]
+    original_types = [column.type for column in array_columns]
+    for column in array_columns:
+        column.type = JSON()
+
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    tables = [AssetTable.__table__, GPScanTable.__table__]
+    for table in tables:
+        table.create(engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(gp_scans.router)
+    app.dependency_overrides[get_db] = override_get_db
+
+    try:
+        yield TestClient(app), session_factory
+    finally:
+        for column, original_type in zip(array_columns, original_types):
+            column.type = original_type
+        engine.dispose()
+
+
+def test_bulk_returns_scans_in_request_order(client_and_session):
+    """Returned ids and asset_ids line up with the request items."""
+    client, session_factory = client_and_session
+
+    asset_ids = [
+        client.post("/gp-scans", json={"risk_tolerance": "Medium", "pipeline_result": _pipeline_result(ticker, 0)}).json()["asset_id"]
+        for ticker in ("AAA", "BBB", "CCC")
+    ]
+    requested_asset_ids = [asset_ids[2], asset_ids[0], asset_ids[2], asset_ids[1]]
+
+    response = client.post("/gp-scans/bulk", json=[
+        {"asset_id": asset_id, "risk_tolerance": "Low", "pipeline_result": _pipeline_result("ignored", index)}
+        for index, asset_id in enumerate(requested_asset_ids)
+    ])
+
+    assert response.status_code == 201
+    scans = response.json()
+    assert [scan["asset_id"] for scan in scans] == requested_asset_ids
+    assert [scan["signal_count"] for scan in scans] == [0, 1, 2, 3]
+
+    with session_factory() as db:
+        stored = {scan.id: scan for scan in db.scalars(select(GPScanTable))}
+    for index, scan in enumerate(scans):
+        assert stored[scan["id"]].asset_id == requested_asset_ids[index]
+        assert stored[scan["id"]].signal_count == index
+
+
+def test_bulk_writes_nothing_when_an_item_fails(client_and_session):
+    """A bad asset_id rolls back the whole batch, including assets created for earlier items."""
+    client, session_factory = client_and_session
+
+    response = client.post("/gp-scans/bulk", json=[
+        {"risk_tolerance": "Low", "pipeline_result": _pipeline_result("NEW", 1)},
+        {"asset_id": 999, "risk_tolerance": "Low", "pipeline_result": _pipeline_result("NEW", 2)},
+    ])
+
+    assert response.status_code == 404
+    with session_factory() as db:
+        assert db.scalar(select(func.count()).select_from(AssetTable)) == 0
+        assert db.scalar(select(func.count()).select_from(GPScanTable)) == 0
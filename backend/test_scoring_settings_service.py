@@ -0,0 +1,57 @@
+"""Tests for scoring settings caching."""
+import pytest
+
+from backend import scoring_settings_service as service
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for the settings cache, starting with an empty cache."""
+    now = [1000.0]
+    monkeypatch.setattr(service.time, "monotonic", lambda: now[0])
+    service.clear_scoring_settings_cache()
+    yield now
+    service.clear_scoring_settings_cache()
+
+
+def test_failed_load_is_retried_once_per_failure_window(clock, monkeypatch):
+    """During a database outage the loader runs once per failure TTL, not once per call."""
+    calls = []
+
+    def failing_loader():
+        calls.append(clock[0])
+        return None, False
+
+    monkeypatch.setattr(service, "_load_active_scoring_settings", failing_loader)
+
+    for _ in range(5):
+        assert service.get_active_scoring_settings() is None
+    assert len(calls) == 1
+
+    clock[0] += service._SETTINGS_FAILURE_TTL_SECONDS - 0.1
+    assert service.get_active_scoring_settings() is None
+    assert len(calls) == 1
+
+    clock[0] += 0.2
+    assert service.get_active_scoring_settings() is None
+    assert len(calls) == 2
+
+
+def test_loaded_settings_use_full_ttl_after_recovery(clock, monkeypatch):
+    """Once the database recovers, settings are cached for the normal TTL."""
+    results = [(None, False), ({"days_lookback_default": 30}, True)]
+    calls = []
+
+    def loader():
+        calls.append(clock[0])
+        return results[len(calls) - 1]
+
+    monkeypatch.setattr(service, "_load_active_scoring_settings", loader)
+
+    assert service.get_active_scoring_settings() is None
+    clock[0] += service._SETTINGS_FAILURE_TTL_SECONDS
+    assert service.get_active_scoring_settings() == {"days_lookback_default": 30}
+
+    clock[0] += service._SETTINGS_TTL_SECONDS - 0.1
+    assert service.get_active_scoring_settings() == {"days_lookback_default": 30}
+    assert len(calls) == 2
@@ -4,7 +4,8 @@ This module performs targeted web searches for each identified geopolitical them
 providing real-time, relevant intelligence signals.
 """
 import os
-from typing import List, Dict, Optional
+import threading
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 import httpx
 from dataclasses import dataclass
@@ -17,6 +18,7 @@ from .intelligence_scoring import (
     calculate_recency_score,
     get_source_quality_score,
     calculate_final_score,
+    get_scoring_config,
 )
 
 if TYPE_CHECKING:
@@ -33,61 +35,158 @@ class WebSearchResult:
     source: Optional[str] = None
 
 
+# Simple in-memory cache for web search results, keyed by (search API, query, days_lookback)
+_search_cache: Dict[Tuple[str, str, int], Tuple[List[WebSearchResult], datetime]] = {}
+_search_cache_ttl_minutes = 15
+_search_cache_max_entries = 256
+_search_cache_lock = threading.Lock()
+
+# LLM-refined search queries, keyed by the profile fields, theme and lookback they
+# depend on; manual fallback queries are cheap and never cached
+_QueryKey = Tuple[Optional[str], Optional[str], Optional[str], Optional[str], str, int]
+_query_cache: Dict[_QueryKey, Tuple[str, datetime]] = {}
+_query_cache_max_entries = 512
+
+
 def search_theme_web(
     profile: AssetProfile,
     theme: ThemeRelevance,
     days_lookback: int = 90,
+    query: Optional[str] = None,
 ) -> List[WebSearchResult]:
     """
     Search the web for a specific theme related to the asset.
     
+    Results are cached for _search_cache_ttl_minutes, so identical searches
+    (e.g. several assets in the same country) only hit the API once.
+    
     Args:
         profile: Asset profile
         theme: Theme to search for
         days_lookback: How many days back to search
+        query: Pre-built search query (built from profile and theme if omitted)
     
     Returns:
         List of web search results
     """
     # Build targeted search query
-    query = _build_search_query(profile, theme, days_lookback)
+    if query is None:
+        query = _build_search_query(profile, theme, days_lookback)
     
     # Use web search API (Tavily recommended, or Serper for Google search)
     # Note: Ollama LLM is used separately for analysis, not for web search
     search_api = os.getenv("WEB_SEARCH_API", "tavily")  # tavily or serper
     
-    if search_api == "tavily":
-        return _search_tavily(query, days_lookback)
-    elif search_api == "serper":
-        return _search_serper(query, days_lookback)
+    cache_key = (search_api, query, days_lookback)
+    cached_results = _get_cached_search(cache_key)
+    if cached_results is not None:
+        return cached_results
+    
+    if search_api == "serper":
+        results = _search_serper(query, days_lookback)
     else:
         # Default to Tavily
-        return _search_tavily(query, days_lookback)
+        results = _search_tavily(query, days_lookback)
+    
+    # Empty results usually mean a missing key or API error, so don't cache them
+    if results:
+        _add_cached_search(cache_key, results)
+    return results
+
+
+def _get_cached_search(cache_key: Tuple[str, str, int]) -> Optional[List[WebSearchResult]]:
+    """Get cached search results if not expired."""
+    with _search_cache_lock:
+        entry = _search_cache.get(cache_key)
+        if entry is None:
+            return None
+        results, cached_at = entry
+        if datetime.now() - cached_at < timedelta(minutes=_search_cache_ttl_minutes):
+            return list(results)
+        # Expired, remove from cache
+        del _search_cache[cache_key]
+        return None
+
+
+def _add_cached_search(cache_key: Tuple[str, str, int], results: List[WebSearchResult]) -> None:
+    """Add search results to cache, evicting the oldest entry when full."""
+    with _search_cache_lock:
+        if cache_key not in _search_cache and len(_search_cache) >= _search_cache_max_entries:
+            del _search_cache[next(iter(_search_cache))]
+        _search_cache[cache_key] = (list(results), datetime.now())
+
+
+def clear_search_cache() -> None:
+    """Clear the web search results and query caches."""
+    with _search_cache_lock:
+        _search_cache.clear()
+        _query_cache.clear()
+
+
+def clear_query_cache() -> None:
+    """Clear the search query cache (call after creating, updating or deleting themes)."""
+    with _search_cache_lock:
+        _query_cache.clear()
+
+
+def _get_cached_query(cache_key: _QueryKey) -> Optional[str]:
+    """Get a cached LLM search query if not expired."""
+    with _search_cache_lock:
+        entry = _query_cache.get(cache_key)
+        if entry is None:
+            return None
+        query, cached_at = entry
+        if datetime.now() - cached_at < timedelta(minutes=_search_cache_ttl_minutes):
+            return query
+        del _query_cache[cache_key]
+        return None
+
+
+def _add_cached_query(cache_key: _QueryKey, query: str) -> None:
+    """Add an LLM search query to the cache, evicting the oldest entry when full."""
+    with _search_cache_lock:
+        if cache_key not in _query_cache and len(_query_cache) >= _query_cache_max_entries:
+            del _query_cache[next(iter(_query_cache))]
+        _query_cache[cache_key] = (query, datetime.now())
 
 
 def _build_search_query(profile: AssetProfile, theme: ThemeRelevance, days_lookback: int = 90) -> str:
     """Build a targeted search query for the theme and asset.
     
-    Uses LLM to create natural, well-phrased search queries.
+    Uses LLM to create natural, well-phrased search queries. LLM queries are
+    cached for _search_cache_ttl_minutes on the profile fields and theme they
+    depend on, so the LLM is asked once per distinct combination; if the LLM
+    fails, a manual query is built and the LLM is tried again next time.
     """
+    country = profile.country
+    region = profile.region
+    sector = profile.sector
+    asset_class = profile.asset_class
+    theme_key = theme.theme
+    
+    cache_key = (country, region, sector, asset_class, theme_key, days_lookback)
+    cached_query = _get_cached_query(cache_key)
+    if cached_query is not None:
+        return cached_query
+    
     # Get theme keywords
     themes = get_geopolitical_themes()
-    theme_info = themes.get(theme.theme, {})
+    theme_info = themes.get(theme_key, {})
     theme_keywords = theme_info.get("keywords", [])
     
     # Format theme name for readability
-    theme_name = theme.theme.replace("_", " ").title()
+    theme_name = theme_key.replace("_", " ").title()
     
     # Build context for LLM
     context_parts = []
-    if profile.country:
-        context_parts.append(f"Country: {profile.country}")
-    if profile.region:
-        context_parts.append(f"Region: {profile.region}")
-    if profile.sector and profile.sector not in ["Diversified", "Cash"]:
-        context_parts.append(f"Sector: {profile.sector}")
-    if profile.asset_class:
-        context_parts.append(f"Asset Class: {profile.asset_class}")
+    if country:
+        context_parts.append(f"Country: {country}")
+    if region:
+        context_parts.append(f"Region: {region}")
+    if sector and sector not in ["Diversified", "Cash"]:
+        context_parts.append(f"Sector: {sector}")
+    if asset_class:
+        context_parts.append(f"Asset Class: {asset_class}")
     
     context = ", ".join(context_parts)
     
@@ -95,25 +194,26 @@ def _build_search_query(profile: AssetProfile, theme: ThemeRelevance, days_lookb
     try:
         query = _refine_query_with_llm(theme_name, context, theme_keywords, days_lookback)
         if query:
+            _add_cached_query(cache_key, query)
             return query
     except Exception as e:
         print(f"LLM query refinement failed: {e}, using fallback")
     
     # Fallback: Build query manually if LLM fails
     parts = []
-    if profile.country:
-        parts.append(profile.country)
-    elif profile.region:
-        parts.append(profile.region)
+    if country:
+        parts.append(country)
+    elif region:
+        parts.append(region)
     
     # Add theme in natural language
     if theme_name:
         parts.append(theme_name.lower())
     
     # Add financial context
-    if profile.asset_class == "Equities":
+    if asset_class == "Equities":
         parts.append("financial markets")
-    elif profile.asset_class:
+    elif asset_class:
         parts.append("investment")
     
     query = " ".join(parts)
@@ -478,6 +578,7 @@ def convert_web_results_to_signals(
     from .geo_risk_intelligence import IntelligenceSignal
 
     signals = []
+    scoring_config = get_scoring_config()
 
     for result in web_results:
         # Parse published date
@@ -487,8 +588,8 @@ def convert_web_results_to_signals(
         # Web results need validation - don't assume high relevance
         base_relevance = 0.5  # Reduced from 0.7 (conservative until validated)
         theme_match_score = theme.relevance_score
-        recency_score = calculate_recency_score(published_at, days_lookback)
-        source_quality = get_source_quality_score(result.source or "Unknown")
+        recency_score = calculate_recency_score(published_at, days_lookback, scoring_config)
+        source_quality = get_source_quality_score(result.source or "Unknown", scoring_config)
 
         # Boost source quality for web results from trusted sources
         if _is_trusted_news_source(result.url or ""):
@@ -501,6 +602,7 @@ def convert_web_results_to_signals(
             recency_score=recency_score,
             source_quality=source_quality,
             activity_level=0.0,  # Not applicable for web results
+            config=scoring_config,
         )
 
         signal = IntelligenceSignal(